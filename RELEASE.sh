@@ -11,7 +11,7 @@ echo "=================================="
 echo ""
 
 # Check if we're in the right directory
-if [ ! -f "setup.py" ]; then
+if [ ! -f "pyproject.toml" ]; then
     echo "❌ Error: Must run from project root directory"
     exit 1
 fi
@@ -149,7 +149,7 @@ echo "   - Title: VibeWP v${VERSION} - Remote Backups"
 echo "   - Description: Copy from RELEASE_NOTES_v${VERSION}.md"
 echo ""
 echo "4. Optional: Publish to PyPI"
-echo "   python3 setup.py sdist bdist_wheel"
+echo "   python3 -m build"
 echo "   twine upload dist/vibewp-${VERSION}*"
 echo ""
 echo "Release files created:"
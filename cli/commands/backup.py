@@ -101,7 +101,8 @@ def create_backup(
                         local_backup_path=local_backup,
                         remote_path=remote_path,
                         bucket=remote_config.bucket,
-                        encryption=remote_config.encryption
+                        encryption=remote_config.encryption,
+                        upload_concurrency=remote_config.upload_concurrency
                     )
 
                 print_success(f"Backup uploaded to {remote_config.provider}:{remote_config.bucket}/{remote_path}")
@@ -509,10 +510,11 @@ def list_remote_backups(
         remote_path = f"backups/{site}" if site else "backups"
 
         with console.status("[cyan]Fetching remote backup list...", spinner="dots"):
-            backups = remote_mgr.list_remote_backups(
+            summary = remote_mgr.get_backup_summary(
                 bucket=remote_config.bucket,
                 remote_path=remote_path
             )
+        backups = summary['backups']
 
         if not backups:
             print_info("No remote backups found")
@@ -531,8 +533,7 @@ def list_remote_backups(
         console.print(f"\n[dim]Total: {len(backups)} backups[/dim]")
 
         # Show total size
-        total_size = remote_mgr.get_remote_size(remote_config.bucket, remote_path)
-        console.print(f"[dim]Total size: {total_size}[/dim]\n")
+        console.print(f"[dim]Total size: {summary['total_size']}[/dim]\n")
 
         ssh.disconnect()
 
@@ -318,6 +318,7 @@ def audit_server(
     wp_api_token: str = typer.Option(None, "--wp-api-token", help="WPScan API token (overrides config)"),
     skip_wordpress: bool = typer.Option(False, "--skip-wordpress", help="Skip WordPress audits"),
     skip_lynis: bool = typer.Option(False, "--skip-lynis", help="Skip Lynis integration"),
+    use_cache: bool = typer.Option(False, "--cache", help="Reuse WordPress results for unchanged sites and recent WPScan lookups from earlier audits"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed progress")
 ):
     """Run comprehensive server security audit"""
@@ -335,7 +336,11 @@ def audit_server(
         print_success("Connected to VPS")
 
         # Initialize audit manager
-        audit_manager = ServerAuditManager(ssh, config)
+        audit_manager = ServerAuditManager(
+            ssh,
+            config,
+            audit_cache_dir=config.config_dir / "audit_cache" if use_cache else None
+        )
 
         # Get WPScan API token (from parameter or config)
         api_token = wp_api_token
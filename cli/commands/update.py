@@ -34,7 +34,7 @@ def check_updates(
             progress.add_task(description="Checking for updates...", total=None)
 
             manager = UpdateManager()
-            update_info = manager.check_for_updates(include_prerelease=pre)
+            update_info = manager.check_for_updates(include_prerelease=pre, revalidate=True)
 
         # Display version information
         table = Table(title="Version Information")
@@ -99,7 +99,7 @@ def install_update(
             console=console,
         ) as progress:
             progress.add_task(description="Checking for updates...", total=None)
-            update_info = manager.check_for_updates(include_prerelease=pre)
+            update_info = manager.check_for_updates(include_prerelease=pre, revalidate=True)
 
         # Check if update needed
         if not update_info.update_available and not force:
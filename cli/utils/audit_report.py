@@ -1,9 +1,11 @@
 """Security audit report generation with multiple output formats"""
 
 from typing import Dict, List, Optional
+from bisect import bisect_right
+from collections import Counter, defaultdict
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-import json
 
 from rich.console import Console
 from rich.table import Table
@@ -13,6 +15,13 @@ from rich.layout import Layout
 from rich import box
 from jinja2 import Environment, FileSystemLoader
 
+from cli.utils import jsonio
+
+# Lowest score for each band above red; bisect_right indexes the colour tables
+_SCORE_THRESHOLDS = (50, 70, 90)
+_SCORE_COLORS = ('red', 'orange1', 'yellow', 'green')
+_SCORE_HTML_COLORS = ('#ef4444', '#f97316', '#f59e0b', '#10b981')
+
 
 class ReportGenerator:
     """Generate security audit reports in multiple formats"""
@@ -94,27 +103,23 @@ class ReportGenerator:
 
     def _aggregate_findings(self, system_results: Dict, wordpress_results: Dict) -> List[Dict]:
         """Aggregate all findings from system and WordPress audits"""
-        all_findings = []
-
-        # System findings
-        for category, data in system_results.items():
-            if category == 'timestamp':
-                continue
-
-            if isinstance(data, dict) and 'findings' in data:
-                for finding in data['findings']:
-                    finding['category'] = f'System: {category.title()}'
-                    all_findings.append(finding)
+        # (category label, findings list) per source, in report order
+        sources = [
+            (f'System: {category.title()}', data['findings'])
+            for category, data in system_results.items()
+            if category != 'timestamp' and isinstance(data, dict) and 'findings' in data
+        ]
+        sources.extend(
+            (f'WordPress: {site_name}', site_data['findings'])
+            for site_name, site_data in wordpress_results.get('sites', {}).items()
+            if 'findings' in site_data
+        )
 
-        # WordPress findings
-        if 'sites' in wordpress_results:
-            for site_name, site_data in wordpress_results['sites'].items():
-                if 'findings' in site_data:
-                    for finding in site_data['findings']:
-                        finding['category'] = f'WordPress: {site_name}'
-                        all_findings.append(finding)
+        for label, findings in sources:
+            for finding in findings:
+                finding['category'] = label
 
-        return all_findings
+        return list(chain.from_iterable(findings for _, findings in sources))
 
     def _calculate_overall_score(self, findings: List[Dict]) -> int:
         """
@@ -129,11 +134,12 @@ class ReportGenerator:
         if not findings:
             return 100
 
-        # Calculate total penalty based on severity
-        total_penalty = 0
-        for finding in findings:
-            severity = finding.get('severity', 'low')
-            total_penalty += self.SEVERITY_WEIGHTS.get(severity, 2)
+        # Calculate total penalty based on severity: one weight lookup per level
+        counts = Counter(finding.get('severity', 'low') for finding in findings)
+        total_penalty = sum(
+            self.SEVERITY_WEIGHTS.get(severity, 2) * count
+            for severity, count in counts.items()
+        )
 
         # Base score of 100, subtract penalties
         # Scale: each critical = -10, high = -7, medium = -4, low = -2
@@ -144,35 +150,17 @@ class ReportGenerator:
 
     def _group_by_severity(self, findings: List[Dict]) -> Dict[str, List[Dict]]:
         """Group findings by severity level"""
-        grouped = {
-            'critical': [],
-            'high': [],
-            'medium': [],
-            'low': []
-        }
-
+        grouped = defaultdict(list)
         for finding in findings:
-            severity = finding.get('severity', 'low')
-            if severity in grouped:
-                grouped[severity].append(finding)
+            grouped[finding.get('severity', 'low')].append(finding)
 
-        return grouped
+        # Unknown severities are dropped; every known level gets a list
+        return {severity: grouped.get(severity, []) for severity in self.SEVERITY_WEIGHTS}
 
     def _count_severities(self, findings: List[Dict]) -> Dict[str, int]:
         """Count findings by severity"""
-        counts = {
-            'critical': 0,
-            'high': 0,
-            'medium': 0,
-            'low': 0
-        }
-
-        for finding in findings:
-            severity = finding.get('severity', 'low')
-            if severity in counts:
-                counts[severity] += 1
-
-        return counts
+        counts = Counter(finding.get('severity', 'low') for finding in findings)
+        return {severity: counts[severity] for severity in self.SEVERITY_WEIGHTS}
 
     def _generate_console_report(self, report_data: Dict) -> None:
         """Generate and print console report using Rich"""
@@ -268,14 +256,7 @@ class ReportGenerator:
 
     def _get_score_color(self, score: int) -> str:
         """Get color based on security score"""
-        if score >= 90:
-            return "green"
-        elif score >= 70:
-            return "yellow"
-        elif score >= 50:
-            return "orange1"
-        else:
-            return "red"
+        return _SCORE_COLORS[bisect_right(_SCORE_THRESHOLDS, score)]
 
     def _generate_json_report(self, report_data: Dict, output_path: Optional[str]) -> str:
         """Generate JSON report file"""
@@ -293,8 +274,8 @@ class ReportGenerator:
             'wordpress_results': report_data['wordpress_results']
         }
 
-        with open(output_path, 'w') as f:
-            json.dump(json_data, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(jsonio.dumps(json_data, indent=True))
 
         return output_path
 
@@ -320,14 +301,7 @@ class ReportGenerator:
 
     def _get_score_color_html(self, score: int) -> str:
         """Get HTML color based on security score"""
-        if score >= 90:
-            return "#10b981"  # green
-        elif score >= 70:
-            return "#f59e0b"  # yellow
-        elif score >= 50:
-            return "#f97316"  # orange
-        else:
-            return "#ef4444"  # red
+        return _SCORE_HTML_COLORS[bisect_right(_SCORE_THRESHOLDS, score)]
 
     def _generate_pdf_report(self, report_data: Dict, output_path: Optional[str]) -> str:
         """
@@ -472,11 +446,4 @@ class ReportGenerator:
         """Get reportlab color based on security score"""
         from reportlab.lib import colors
 
-        if score >= 90:
-            return colors.HexColor('#10b981')
-        elif score >= 70:
-            return colors.HexColor('#f59e0b')
-        elif score >= 50:
-            return colors.HexColor('#f97316')
-        else:
-            return colors.HexColor('#ef4444')
+        return colors.HexColor(self._get_score_color_html(score))
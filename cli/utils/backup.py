@@ -171,7 +171,6 @@ class BackupManager:
         required_files = [
             "cli/__init__.py",
             "cli/main.py",
-            "setup.py",
             "requirements.txt"
         ]
 
@@ -180,6 +179,11 @@ class BackupManager:
                 logger.error(f"Backup verification failed: missing {file_path}")
                 return False
 
+        # Installs from before the pyproject.toml migration still ship setup.py
+        if not any((backup_path / name).exists() for name in ("pyproject.toml", "setup.py")):
+            logger.error("Backup verification failed: missing pyproject.toml")
+            return False
+
         return True
 
     def _ensure_backup_dir(self) -> None:
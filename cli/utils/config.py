@@ -5,7 +5,7 @@ import yaml
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, model_validator, validator
 
 
 class VPSConfig(BaseModel):
@@ -41,14 +41,16 @@ class RemoteBackupConfig(BaseModel):
     secret_key: str = ""
     encryption: bool = True  # Encrypt backups before upload
     retention_days: int = 30  # Keep backups for N days
+    upload_concurrency: int = 8  # Parallel S3 multipart chunks per upload
 
-    @validator('bucket', 'access_key', 'secret_key')
-    def validate_required_when_enabled(cls, v, values):
+    @model_validator(mode='after')
+    def validate_required_when_enabled(self):
         """Validate that required fields are not empty when remote backup is enabled"""
-        # Only validate if enabled=True (values may not have 'enabled' yet during construction)
-        if values.get('enabled', False) and not v:
+        # One check on the built model (also covers fields left at their
+        # defaults, which per-field validators skip)
+        if self.enabled and not (self.bucket and self.access_key and self.secret_key):
             raise ValueError('bucket, access_key, and secret_key are required when remote backup is enabled')
-        return v
+        return self
 
     @validator('retention_days')
     def validate_retention(cls, v):
@@ -59,6 +61,13 @@ class RemoteBackupConfig(BaseModel):
             raise ValueError('retention_days cannot exceed 3650 days (10 years)')
         return v
 
+    @validator('upload_concurrency')
+    def validate_upload_concurrency(cls, v):
+        """Validate upload concurrency stays within what rclone handles well"""
+        if not 1 <= v <= 32:
+            raise ValueError('upload_concurrency must be between 1 and 32')
+        return v
+
 
 class DockerConfig(BaseModel):
     """Docker configuration"""
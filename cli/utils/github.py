@@ -1,13 +1,49 @@
 """GitHub API client for version checking and release management."""
 
-import requests
-from typing import Optional, Dict, Any, List
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared by every client so repeated API calls reuse pooled keep-alive
+# connections instead of paying a new TCP/TLS handshake each time.
+# Per-client headers (including auth) are sent with each request.
+# Built on first use so importing this module doesn't import requests.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# Clock for cache timestamps; module-level so tests can substitute it
+_now = time.monotonic
+
+
+def _get_session():
+    """Return the shared requests session, creating it on first call."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            _SESSION = requests.Session()
+            _SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        return _SESSION
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``requests`` lazily so ``cli.utils.github.requests`` stays patchable."""
+    if name == 'requests':
+        import requests
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 @dataclass
 class GitHubRelease:
@@ -38,6 +74,18 @@ class GitHubRelease:
             assets=data.get('assets', [])
         )
 
+    def to_api_response(self) -> Dict[str, Any]:
+        """Return the API fields this release was built from (see from_api_response)."""
+        return {
+            'tag_name': self.tag_name,
+            'name': self.name,
+            'body': self.body,
+            'published_at': self.published_at.isoformat(),
+            'html_url': self.html_url,
+            'prerelease': self.prerelease,
+            'assets': self.assets
+        }
+
 
 class GitHubAPIError(Exception):
     """GitHub API related errors."""
@@ -58,41 +106,114 @@ class GitHubClient:
 
     # Cache settings
     CACHE_TTL = timedelta(minutes=5)
-
-    def __init__(self, token: Optional[str] = None, timeout: int = 10):
+    _CACHE_TTL_SECONDS = CACHE_TTL.total_seconds()
+    CACHE_MAX_ENTRIES = 128
+    # Latest release kept on disk between CLI runs (see release_cache_file)
+    RELEASE_CACHE_TTL = timedelta(hours=24)
+
+    # Pagination settings (GitHub caps per_page at 100)
+    MAX_PER_PAGE = 100
+    MAX_PAGE_WORKERS = 4
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        timeout: int = 10,
+        stale_on_error: bool = True,
+        release_cache_file: Optional[Path] = None
+    ):
         """
         Initialize GitHub client.
 
         Args:
             token: Optional GitHub personal access token for higher rate limits
             timeout: Request timeout in seconds (default: 10s)
+            stale_on_error: Serve an expired cached response when GitHub times out,
+                is unreachable or returns a 5xx error
+            release_cache_file: JSON file keeping get_latest_release results for
+                RELEASE_CACHE_TTL across processes (None disables it)
         """
         self.token = token
         self.timeout = timeout
-        self._cache: Dict[str, tuple[datetime, Any]] = {}
-
-        # Setup session with headers
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.stale_on_error = stale_on_error
+        self.release_cache_file = Path(release_cache_file) if release_cache_file else None
+        # key -> (_now() when stored, data, ETag), least recently used first
+        self._cache: "OrderedDict[str, Tuple[float, Any, Optional[str]]]" = OrderedDict()
+        # key -> Last-Modified of the cached response, sent back as If-Modified-Since
+        self._last_modified: Dict[str, str] = {}
+        # Guards _cache and _last_modified; get_all_releases requests pages
+        # from worker threads, and LRU reordering/eviction is not atomic
+        self._lock = threading.Lock()
+
+        # Shared pooled session; headers stay per client
+        self.session = _get_session()
+        self.headers = {
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': f'{self.REPO_NAME}-cli/1.0'
-        })
+        }
 
         if token:
-            self.session.headers['Authorization'] = f'token {token}'
+            self.headers['Authorization'] = f'token {token}'
 
     def _get_cached(self, key: str) -> Optional[Any]:
         """Get cached response if not expired."""
-        if key in self._cache:
-            cached_time, data = self._cache[key]
-            if datetime.now() - cached_time < self.CACHE_TTL:
-                logger.debug(f"Using cached response for {key}")
-                return data
+        with self._lock:
+            if key in self._cache:
+                cached_time, data, _ = self._cache[key]
+                if _now() - cached_time < self._CACHE_TTL_SECONDS:
+                    logger.debug(f"Using cached response for {key}")
+                    self._cache.move_to_end(key)
+                    return data
         return None
 
-    def _set_cache(self, key: str, data: Any) -> None:
-        """Cache response with timestamp."""
-        self._cache[key] = (datetime.now(), data)
+    def _get_cache_entry(self, key: str) -> Tuple[Optional[Tuple[float, Any, Optional[str]]], Optional[str]]:
+        """Cached entry for key, fresh or expired, and its Last-Modified."""
+        with self._lock:
+            return self._cache.get(key), self._last_modified.get(key)
+
+    def _set_cache(
+        self,
+        key: str,
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Cache response with timestamp and the validators it was served with.
+
+        Expired entries are kept for ETag revalidation; the least recently
+        used entry is evicted once the cache holds CACHE_MAX_ENTRIES.
+        """
+        with self._lock:
+            self._insert_cache_entry(key, (_now(), data, etag), last_modified)
+
+    def _insert_cache_entry(
+        self,
+        key: str,
+        entry: Tuple[float, Any, Optional[str]],
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Insert entry as most recently used, evicting the LRU entry if full.
+
+        Callers hold _lock.
+        """
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        if last_modified:
+            self._last_modified[key] = last_modified
+        if len(self._cache) > self.CACHE_MAX_ENTRIES:
+            evicted_key, _ = self._cache.popitem(last=False)
+            self._last_modified.pop(evicted_key, None)
+
+    def _alias_cache(self, key: str, alias: str) -> None:
+        """Point alias at the cached entry for key (shared, not copied)."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._insert_cache_entry(alias, entry)
+
+    def _can_serve_stale(self, entry: Optional[Tuple[float, Any, Optional[str]]]) -> bool:
+        """Whether a failed request may fall back to an expired cache entry."""
+        return self.stale_on_error and entry is not None
 
     def _make_request(self, endpoint: str, use_cache: bool = True) -> Dict[str, Any]:
         """
@@ -109,6 +230,8 @@ class GitHubClient:
             GitHubRateLimitError: If rate limit exceeded
             GitHubAPIError: For other API errors
         """
+        import requests
+
         cache_key = f"request:{endpoint}"
 
         # Check cache first
@@ -119,9 +242,24 @@ class GitHubClient:
 
         url = f"{self.BASE_URL}{endpoint}"
 
+        # Revalidate an expired entry instead of refetching it; a 304 reply
+        # carries no body and does not count against the rate limit
+        headers = dict(self.headers)
+        stale, last_modified = self._get_cache_entry(cache_key) if use_cache else (None, None)
+        if stale is not None:
+            if stale[2]:
+                headers['If-None-Match'] = stale[2]
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
         try:
             logger.debug(f"Making GitHub API request: {url}")
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+
+            if response.status_code == 304 and stale is not None:
+                logger.debug(f"GitHub resource not modified: {endpoint}")
+                self._set_cache(cache_key, stale[1], stale[2])
+                return stale[1]
 
             # Check rate limit
             if response.status_code == 403:
@@ -138,6 +276,10 @@ class GitHubClient:
             if response.status_code == 404:
                 raise GitHubAPIError(f"GitHub resource not found (404): {endpoint}")
 
+            if response.status_code >= 500 and self._can_serve_stale(stale):
+                logger.warning(f"GitHub API returned {response.status_code}; using cached response for {endpoint}")
+                return stale[1]
+
             # Raise for other errors
             response.raise_for_status()
 
@@ -145,27 +287,123 @@ class GitHubClient:
 
             # Cache successful response
             if use_cache:
-                self._set_cache(cache_key, data)
+                self._set_cache(
+                    cache_key, data, response.headers.get('ETag'), response.headers.get('Last-Modified')
+                )
 
             return data
 
         except requests.exceptions.Timeout:
+            if self._can_serve_stale(stale):
+                logger.warning(f"GitHub API request timed out; using cached response for {endpoint}")
+                return stale[1]
             raise GitHubAPIError(f"GitHub API request timed out after {self.timeout}s")
         except requests.exceptions.ConnectionError as e:
+            if self._can_serve_stale(stale):
+                logger.warning(f"Failed to connect to GitHub API; using cached response for {endpoint}")
+                return stale[1]
             raise GitHubAPIError(f"Failed to connect to GitHub API: {e}")
         except requests.exceptions.RequestException as e:
             raise GitHubAPIError(f"GitHub API request failed: {e}")
 
-    def get_latest_release(self, include_prerelease: bool = False) -> Optional[GitHubRelease]:
+    def get_latest_release(
+        self,
+        include_prerelease: bool = False,
+        revalidate: bool = False
+    ) -> Optional[GitHubRelease]:
         """
         Get latest release from GitHub.
 
+        A result younger than RELEASE_CACHE_TTL in release_cache_file is
+        returned without contacting GitHub, unless revalidate is set.
+
         Args:
             include_prerelease: If True, include pre-release versions
+            revalidate: Always ask GitHub, with a conditional request when
+                the stored release has validators (for explicit user checks)
 
         Returns:
             GitHubRelease object or None if no releases found
         """
+        cache_key = f"{self.REPO_OWNER}/{self.REPO_NAME}"
+        if include_prerelease:
+            cache_key += ":prerelease"
+        request_key = f"request:{self._latest_endpoint()}"
+
+        stored = self._read_release_cache(cache_key)
+        if stored is not None:
+            age, release, validators = stored
+            if age < self.RELEASE_CACHE_TTL.total_seconds() and not revalidate:
+                return release
+            if not include_prerelease:
+                # Revalidate the stored release rather than refetching it
+                with self._lock:
+                    if request_key not in self._cache:
+                        self._insert_cache_entry(
+                            request_key,
+                            (_now() - self._CACHE_TTL_SECONDS, release.to_api_response(), validators.get('etag')),
+                            validators.get('last_modified')
+                        )
+
+        release = self._fetch_latest_release(include_prerelease)
+        if release is not None:
+            validators = {}
+            if not include_prerelease:
+                entry, last_modified = self._get_cache_entry(request_key)
+                if entry is not None:
+                    validators = {'etag': entry[2], 'last_modified': last_modified}
+            self._write_release_cache(cache_key, release, validators)
+
+        return release
+
+    def _latest_endpoint(self) -> str:
+        """API path of the latest (non pre-release) release."""
+        return f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/releases/latest"
+
+    def _read_release_cache(self, cache_key: str) -> Optional[Tuple[float, GitHubRelease, Dict[str, Any]]]:
+        """
+        Read the release stored under cache_key in release_cache_file.
+
+        Returns:
+            (age in seconds, release, {'etag', 'last_modified'} validators),
+            or None if there is no readable entry
+        """
+        if not self.release_cache_file:
+            return None
+
+        try:
+            entry = json.loads(self.release_cache_file.read_text())[cache_key]
+            release = GitHubRelease.from_api_response(entry['release'])
+            return time.time() - entry['fetched_at'], release, entry.get('validators') or {}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def _write_release_cache(self, cache_key: str, release: GitHubRelease, validators: Dict[str, Any]) -> None:
+        """Store release and its HTTP validators under cache_key (failures are ignored)."""
+        if not self.release_cache_file:
+            return
+
+        try:
+            entries = json.loads(self.release_cache_file.read_text())
+            if not isinstance(entries, dict):
+                entries = {}
+        except (OSError, ValueError):
+            entries = {}
+
+        entries[cache_key] = {
+            'fetched_at': time.time(),
+            'release': release.to_api_response(),
+            'validators': validators
+        }
+
+        try:
+            self.release_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.release_cache_file.write_text(json.dumps(entries))
+        except OSError as e:
+            logger.debug(f"Could not write release cache: {e}")
+
+    def _fetch_latest_release(self, include_prerelease: bool) -> Optional[GitHubRelease]:
+        """Look up the latest release through the API (see get_latest_release)."""
         try:
             if include_prerelease:
                 # Get all releases and filter manually
@@ -175,8 +413,13 @@ class GitHubClient:
                 return releases[0]  # First is latest
             else:
                 # Use GitHub's latest endpoint (excludes pre-releases)
-                endpoint = f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/releases/latest"
+                endpoint = self._latest_endpoint()
                 data = self._make_request(endpoint)
+
+                # Same payload as the tag lookup; let get_release_by_tag reuse it
+                tag_endpoint = f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/releases/tags/{data['tag_name']}"
+                self._alias_cache(f"request:{endpoint}", f"request:{tag_endpoint}")
+
                 return GitHubRelease.from_api_response(data)
 
         except GitHubAPIError as e:
@@ -191,18 +434,29 @@ class GitHubClient:
             limit: Maximum number of releases to fetch
 
         Returns:
-            List of GitHubRelease objects, sorted by published date (newest first)
+            List of GitHubRelease objects, newest first
         """
+        per_page = min(limit, self.MAX_PER_PAGE)
+        endpoint = f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/releases?per_page={per_page}"
+
         try:
-            endpoint = f"/repos/{self.REPO_OWNER}/{self.REPO_NAME}/releases?per_page={limit}"
             data = self._make_request(endpoint)
 
-            releases = [GitHubRelease.from_api_response(release) for release in data]
-
-            # Sort by published date, newest first
-            releases.sort(key=lambda r: r.published_at, reverse=True)
+            # Page 1 tells whether more exist; fetch the rest concurrently
+            # over the pooled session rather than one round-trip at a time
+            if limit > per_page and len(data) == per_page:
+                last_page = -(-limit // per_page)
+                with ThreadPoolExecutor(max_workers=self.MAX_PAGE_WORKERS) as executor:
+                    pages = executor.map(
+                        self._make_request,
+                        [f"{endpoint}&page={page}" for page in range(2, last_page + 1)]
+                    )
+                    for page_data in pages:
+                        data = data + page_data
 
-            return releases
+            # GitHub lists releases newest first and pages are merged in
+            # order, so the result needs no re-sort
+            return [GitHubRelease.from_api_response(release) for release in data[:limit]]
 
         except GitHubAPIError as e:
             logger.error(f"Failed to fetch releases: {e}")
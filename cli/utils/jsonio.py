@@ -0,0 +1,57 @@
+"""JSON encoding and decoding, with orjson when it is installed"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional (the 'speedups' extra); the stdlib json module
+    # reads and writes the same documents
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode a JSON document
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode a value as UTF-8 JSON bytes
+
+    Both encoders write the same output: compact separators (or two-space
+    indentation), non-ASCII characters unescaped and non-str keys
+    converted to strings.
+
+    Args:
+        obj: Value to encode
+        indent: Indent nested values by two spaces
+
+    Returns:
+        Encoded document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+    return text.encode('utf-8')
@@ -2,16 +2,34 @@
 
 import json
 import logging
-from typing import Optional, List, Dict
-from cli.utils.ssh import SSHManager
+import re
+import shlex
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing it would pull in paramiko
+    from cli.utils.ssh import SSHManager
 
 logger = logging.getLogger(__name__)
 
+# One `rclone ls` line: "<size> <filename>", possibly space-padded
+_RCLONE_LS_RE = re.compile(r'^[ \t]*(\d+)[ \t]+(.+?)[ \t]*$', re.MULTILINE)
+
+# VibeWP provider name -> rclone S3 provider string
+_PROVIDER_MAP = {
+    's3': 'AWS',
+    'r2': 'Cloudflare',
+    'b2': 'Backblaze',
+    'wasabi': 'Wasabi',
+    'digitalocean': 'DigitalOcean',
+    'minio': 'Minio',
+}
+
 
 class RemoteBackupManager:
     """Manages remote backups to S3-compatible storage using rclone"""
 
-    def __init__(self, ssh_manager: SSHManager):
+    def __init__(self, ssh_manager: "SSHManager"):
         """
         Initialize remote backup manager
 
@@ -21,6 +39,11 @@ class RemoteBackupManager:
         self.ssh = ssh_manager
         self.rclone_remote_name = "vibewp-s3"
 
+        # Prerequisite checks don't change within one CLI run; cached until
+        # invalidate_rclone_cache() (called by install/configure)
+        self._rclone_installed: Optional[bool] = None
+        self._rclone_configured: Optional[bool] = None
+
     def check_rclone_installed(self) -> bool:
         """
         Check if rclone is installed on the VPS
@@ -28,8 +51,10 @@ class RemoteBackupManager:
         Returns:
             True if rclone is installed, False otherwise
         """
-        exit_code, _, _ = self.ssh.run_command("which rclone")
-        return exit_code == 0
+        if self._rclone_installed is None:
+            exit_code, _, _ = self.ssh.run_command("which rclone")
+            self._rclone_installed = exit_code == 0
+        return self._rclone_installed
 
     def check_rclone_configured(self) -> bool:
         """
@@ -38,10 +63,17 @@ class RemoteBackupManager:
         Returns:
             True if configured, False otherwise
         """
-        exit_code, _, _ = self.ssh.run_command(
-            f"rclone listremotes | grep -q '^{self.rclone_remote_name}:$'"
-        )
-        return exit_code == 0
+        if self._rclone_configured is None:
+            exit_code, _, _ = self.ssh.run_command(
+                f"rclone listremotes | grep -q '^{self.rclone_remote_name}:$'"
+            )
+            self._rclone_configured = exit_code == 0
+        return self._rclone_configured
+
+    def invalidate_rclone_cache(self) -> None:
+        """Forget cached rclone install/config checks so the next call re-runs them"""
+        self._rclone_installed = None
+        self._rclone_configured = None
 
     def install_rclone(self) -> bool:
         """
@@ -59,6 +91,7 @@ class RemoteBackupManager:
         install_cmd = "curl https://rclone.org/install.sh | sudo bash"
 
         exit_code, stdout, stderr = self.ssh.run_command(install_cmd)
+        self.invalidate_rclone_cache()
 
         if exit_code != 0:
             raise RuntimeError(f"Failed to install rclone: {stderr}")
@@ -98,39 +131,29 @@ class RemoteBackupManager:
         """
         logger.info(f"Configuring rclone remote: {self.rclone_remote_name}")
 
-        # Build rclone config based on provider
-        config_parts = [
-            f"[{self.rclone_remote_name}]",
-            "type = s3",
-            f"provider = {self._get_rclone_provider(provider)}",
-            f"access_key_id = {access_key}",
-            f"secret_access_key = {secret_key}",
+        # Create the remote in one invocation; argv is quoted by shlex.join
+        argv = [
+            "rclone", "config", "create", self.rclone_remote_name, "s3",
+            f"provider={self._get_rclone_provider(provider)}",
+            f"access_key_id={access_key}",
+            f"secret_access_key={secret_key}",
         ]
 
         if endpoint:
-            config_parts.append(f"endpoint = {endpoint}")
+            argv.append(f"endpoint={endpoint}")
 
         if region:
-            config_parts.append(f"region = {region}")
+            argv.append(f"region={region}")
 
         # Additional settings for reliability
-        config_parts.extend([
-            "acl = private",
-            "server_side_encryption = AES256",
+        argv.extend([
+            "acl=private",
+            "server_side_encryption=AES256",
+            "--non-interactive",
         ])
 
-        config_content = "\n".join(config_parts)
-
-        # Create rclone config directory
-        self.ssh.run_command("mkdir -p ~/.config/rclone")
-
-        # Write config file (escape config_content properly for heredoc)
-        write_cmd = f"""cat > ~/.config/rclone/rclone.conf << 'EOF'
-{config_content}
-EOF
-chmod 600 ~/.config/rclone/rclone.conf"""
-
-        exit_code, _, stderr = self.ssh.run_command(write_cmd)
+        exit_code, _, stderr = self.ssh.run_command(shlex.join(argv))
+        self.invalidate_rclone_cache()
 
         if exit_code != 0:
             raise RuntimeError(f"Failed to configure rclone: {stderr}")
@@ -151,7 +174,8 @@ chmod 600 ~/.config/rclone/rclone.conf"""
         local_backup_path: str,
         remote_path: str,
         bucket: str,
-        encryption: bool = False
+        encryption: bool = False,
+        upload_concurrency: int = 8
     ) -> bool:
         """
         Sync local backup to remote S3 storage
@@ -161,6 +185,7 @@ chmod 600 ~/.config/rclone/rclone.conf"""
             remote_path: Remote path within bucket
             bucket: S3 bucket name
             encryption: Enable server-side encryption (note: S3 server-side, not rclone crypt)
+            upload_concurrency: S3 multipart chunks uploaded in parallel
 
         Returns:
             True if sync successful
@@ -178,6 +203,13 @@ chmod 600 ~/.config/rclone/rclone.conf"""
         # Add transfer options for reliability
         rclone_cmd += " --transfers 4 --checkers 8 --retries 3 --low-level-retries 10"
 
+        # A backup is a single large archive, so throughput comes from
+        # splitting that one file rather than from parallel file transfers
+        rclone_cmd += (
+            " --multi-thread-streams 4 --multi-thread-cutoff 100M"
+            f" --s3-upload-concurrency {upload_concurrency}"
+        )
+
         # Use stats for summary instead of progress (non-interactive friendly)
         rclone_cmd += " --stats 30s --stats-one-line"
 
@@ -200,25 +232,44 @@ chmod 600 ~/.config/rclone/rclone.conf"""
         Returns:
             List of remote backup files
         """
-        cmd = f"rclone ls {self.rclone_remote_name}:{bucket}/{remote_path}"
-        exit_code, stdout, stderr = self.ssh.run_command(cmd)
+        backups = []
+        try:
+            # Parse lines as they arrive rather than buffering the whole listing
+            for line in self.ssh.run_command_stream(self._ls_command(bucket, remote_path)):
+                match = _RCLONE_LS_RE.match(line)
+                if match:
+                    backups.append({'filename': match.group(2), 'size': match.group(1)})
+        except RuntimeError as e:
+            logger.warning(f"Failed to list remote backups: {e}")
+            return []
+
+        return backups
+
+    def _ls_command(self, bucket: str, remote_path: str) -> str:
+        """Build the rclone command listing backups under remote_path"""
+        return f"rclone ls {self.rclone_remote_name}:{bucket}/{remote_path}"
+
+    @staticmethod
+    def _parse_backup_list(exit_code: int, stdout: str, stderr: str) -> List[Dict[str, str]]:
+        """
+        Parse `rclone ls` output into backup entries
 
+        Args:
+            exit_code: rclone exit code
+            stdout: rclone output (one "<size> <filename>" per line)
+            stderr: rclone error output
+
+        Returns:
+            List of remote backup files
+        """
         if exit_code != 0:
             logger.warning(f"Failed to list remote backups: {stderr}")
             return []
 
-        backups = []
-        for line in stdout.strip().split('\n'):
-            if line.strip():
-                parts = line.strip().split(None, 1)
-                if len(parts) == 2:
-                    size, filename = parts
-                    backups.append({
-                        'filename': filename,
-                        'size': size
-                    })
-
-        return backups
+        return [
+            {'filename': match.group(2), 'size': match.group(1)}
+            for match in _RCLONE_LS_RE.finditer(stdout)
+        ]
 
     def cleanup_old_backups(
         self,
@@ -239,8 +290,13 @@ chmod 600 ~/.config/rclone/rclone.conf"""
         """
         logger.info(f"Cleaning up backups older than {retention_days} days")
 
-        # Use rclone delete with --min-age filter
-        cmd = f"rclone delete {self.rclone_remote_name}:{bucket}/{remote_path} --min-age {retention_days}d"
+        # Use rclone delete with --min-age filter; --fast-list fetches the
+        # listing in as few S3 calls as possible and --checkers sets how
+        # many deletes rclone issues in parallel, all in one SSH exec
+        cmd = (
+            f"rclone delete {self.rclone_remote_name}:{bucket}/{remote_path} --min-age {retention_days}d"
+            " --fast-list --checkers 16"
+        )
 
         exit_code, stdout, stderr = self.ssh.run_command(cmd)
 
@@ -294,9 +350,47 @@ chmod 600 ~/.config/rclone/rclone.conf"""
         Returns:
             Human-readable size string
         """
-        cmd = f"rclone size {self.rclone_remote_name}:{bucket}/{remote_path} --json"
-        exit_code, stdout, _ = self.ssh.run_command(cmd)
+        exit_code, stdout, _ = self.ssh.run_command(self._size_command(bucket, remote_path))
+        return self._parse_remote_size(exit_code, stdout)
+
+    def get_backup_summary(self, bucket: str, remote_path: str = "backups") -> Dict[str, Any]:
+        """
+        List remote backups and their total size in one SSH round-trip
+
+        Args:
+            bucket: S3 bucket name
+            remote_path: Remote path to inspect
+
+        Returns:
+            Dict with 'backups' (as list_remote_backups) and 'total_size'
+            (as get_remote_size)
+        """
+        (ls_exit, ls_out, ls_err), (size_exit, size_out, _) = self.ssh.run_script([
+            self._ls_command(bucket, remote_path),
+            self._size_command(bucket, remote_path),
+        ])
 
+        return {
+            'backups': self._parse_backup_list(ls_exit, ls_out, ls_err),
+            'total_size': self._parse_remote_size(size_exit, size_out),
+        }
+
+    def _size_command(self, bucket: str, remote_path: str) -> str:
+        """Build the rclone command measuring remote_path as JSON"""
+        return f"rclone size {self.rclone_remote_name}:{bucket}/{remote_path} --json"
+
+    @staticmethod
+    def _parse_remote_size(exit_code: int, stdout: str) -> str:
+        """
+        Convert `rclone size --json` output to a human-readable size
+
+        Args:
+            exit_code: rclone exit code
+            stdout: rclone JSON output
+
+        Returns:
+            Human-readable size string, or "Unknown" on failure
+        """
         if exit_code != 0:
             return "Unknown"
 
@@ -326,13 +420,4 @@ chmod 600 ~/.config/rclone/rclone.conf"""
         Returns:
             rclone provider string
         """
-        provider_map = {
-            's3': 'AWS',
-            'r2': 'Cloudflare',
-            'b2': 'Backblaze',
-            'wasabi': 'Wasabi',
-            'digitalocean': 'DigitalOcean',
-            'minio': 'Minio',
-        }
-
-        return provider_map.get(provider.lower(), 'Other')
+        return _PROVIDER_MAP.get(provider.lower(), 'Other')
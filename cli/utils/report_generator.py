@@ -1,10 +1,14 @@
 """Security audit report generation in multiple formats"""
 
 from typing import Dict, List, Optional
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 import json
 
+# Most severe first; unknown severities sort last
+_SEVERITY_RANK = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+
 
 class ReportGenerator:
     """Generate security audit reports in multiple formats"""
@@ -158,6 +162,14 @@ class ReportGenerator:
 
             lines.append("")
 
+        # Stage timings (verbose audits only)
+        if audit_data.get('timings'):
+            lines.append("AUDIT TIMINGS")
+            lines.append("-" * 80)
+            for stage, elapsed_ms in audit_data['timings'].items():
+                lines.append(f"{stage}: {elapsed_ms:.1f} ms")
+            lines.append("")
+
         lines.append("=" * 80)
         lines.append("END OF REPORT")
         lines.append("=" * 80)
@@ -284,10 +296,11 @@ class ReportGenerator:
 
         # Statistics
         all_findings = self._collect_all_findings(audit_data)
-        critical_count = len([f for f in all_findings if f['severity'] == 'critical'])
-        high_count = len([f for f in all_findings if f['severity'] == 'high'])
-        medium_count = len([f for f in all_findings if f['severity'] == 'medium'])
-        low_count = len([f for f in all_findings if f['severity'] == 'low'])
+        severity_counts = Counter(f['severity'] for f in all_findings)
+        critical_count = severity_counts['critical']
+        high_count = severity_counts['high']
+        medium_count = severity_counts['medium']
+        low_count = severity_counts['low']
 
         html += f"""
         <div class="stats">
@@ -365,7 +378,11 @@ class ReportGenerator:
             f.write(content)
 
     def _collect_all_findings(self, audit_data: Dict) -> List[Dict]:
-        """Collect all findings from audit data"""
+        """
+        Collect all findings from audit data, most severe first
+
+        The sort is stable, so source order is kept within a severity.
+        """
         findings = []
 
         # System findings
@@ -376,27 +393,37 @@ class ReportGenerator:
 
         # WordPress findings
         if 'wordpress' in audit_data:
-            if 'findings' in audit_data['wordpress']:
-                findings.extend(audit_data['wordpress']['findings'])
-            if 'sites' in audit_data['wordpress']:
-                for site_data in audit_data['wordpress']['sites'].values():
-                    if 'findings' in site_data:
-                        findings.extend(site_data['findings'])
+            findings.extend(self._section_findings(audit_data['wordpress']))
 
         # Vulnerability findings
         if 'vulnerabilities' in audit_data:
-            if 'findings' in audit_data['vulnerabilities']:
-                findings.extend(audit_data['vulnerabilities']['findings'])
-            if 'sites' in audit_data['vulnerabilities']:
-                for site_data in audit_data['vulnerabilities']['sites'].values():
-                    if 'findings' in site_data:
-                        findings.extend(site_data['findings'])
+            findings.extend(self._section_findings(audit_data['vulnerabilities']))
 
         # Lynis findings
         if 'lynis' in audit_data and 'findings' in audit_data['lynis']:
             findings.extend(audit_data['lynis']['findings'])
 
-        return findings
+        return sorted(
+            findings,
+            key=lambda finding: _SEVERITY_RANK.get(finding['severity'], len(_SEVERITY_RANK))
+        )
+
+    @staticmethod
+    def _section_findings(section: Dict) -> List[Dict]:
+        """
+        Findings of a per-site audit section, each read once
+
+        A section-level 'findings' list already holds every site's findings,
+        so the per-site lists are only read when it is absent.
+        """
+        if 'findings' in section:
+            return section['findings']
+
+        return [
+            finding
+            for site_data in section.get('sites', {}).values()
+            for finding in site_data.get('findings', [])
+        ]
 
     def _get_score_color(self, score: int) -> str:
         """Get color for score badge"""
@@ -0,0 +1,21 @@
+"""Support for dataclasses that declare __slots__ by hand"""
+
+from dataclasses import fields
+from typing import Any, Callable, Tuple
+
+
+class SlottedDataclass:
+    """
+    Base for dataclasses that list their fields in an explicit __slots__
+
+    The package supports Python 3.8, so dataclass(slots=True) (3.10+) is not
+    available and slotted dataclasses declare __slots__ themselves. Such
+    instances have no __dict__, and frozen ones reject the setattr calls that
+    pickle and copy use to restore slot state, so instances are rebuilt
+    through the constructor from their dataclass fields instead.
+    """
+    __slots__ = ()
+
+    def __reduce__(self) -> Tuple[Callable, Tuple[Any, ...]]:
+        """Rebuild from the dataclass fields (used by pickle and copy)."""
+        return type(self), tuple(getattr(self, field.name) for field in fields(self))
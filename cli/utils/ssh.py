@@ -1,17 +1,251 @@
 """SSH management for VibeWP CLI"""
 
+import atexit
 import os
+import re
+import shlex
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 import paramiko
 from paramiko import SSHClient, AutoAddPolicy
 from paramiko.ssh_exception import SSHException, AuthenticationException
 
 
+# Seconds between transport keepalives, so pooled sessions survive idle NAT/firewall timeouts
+KEEPALIVE_INTERVAL = 30
+
+
+class SSHConnectionPool:
+    """LRU pool of authenticated SSH clients keyed by (user, host, port)"""
+
+    def __init__(self, max_size: int = 4, idle_timeout: int = 300):
+        """
+        Initialize connection pool
+
+        Args:
+            max_size: Maximum number of idle clients kept open
+            idle_timeout: Seconds an unused client is kept before it is closed
+        """
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._clients: "OrderedDict[Tuple[str, str, int], Tuple[SSHClient, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def health_check(client: SSHClient) -> bool:
+        """
+        Check that a pooled client can still run commands
+
+        Args:
+            client: Pooled SSH client
+
+        Returns:
+            True if the transport is alive and answers a no-op command
+        """
+        transport = client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+
+        try:
+            _, stdout, _ = client.exec_command("true", timeout=5)
+            return stdout.channel.recv_exit_status() == 0
+        except Exception:
+            return False
+
+    def acquire(self, key: Tuple[str, str, int]) -> Optional[SSHClient]:
+        """
+        Take a healthy client for key out of the pool
+
+        Args:
+            key: (user, host, port) tuple
+
+        Returns:
+            Reusable SSHClient or None if no healthy client is pooled
+        """
+        with self._lock:
+            entry = self._clients.pop(key, None)
+
+        if entry is None:
+            return None
+
+        client, released_at = entry
+        if time.monotonic() - released_at > self.idle_timeout or not self.health_check(client):
+            client.close()
+            return None
+
+        return client
+
+    def release(self, key: Tuple[str, str, int], client: SSHClient) -> None:
+        """
+        Return a client to the pool, evicting the least recently used one
+
+        Args:
+            key: (user, host, port) tuple
+            client: SSH client to keep open for reuse
+        """
+        evicted = []
+        with self._lock:
+            previous = self._clients.pop(key, None)
+            if previous is not None and previous[0] is not client:
+                evicted.append(previous[0])
+            self._clients[key] = (client, time.monotonic())
+            while len(self._clients) > self.max_size:
+                _, (oldest, _) = self._clients.popitem(last=False)
+                evicted.append(oldest)
+
+        for stale in evicted:
+            stale.close()
+
+    def close_all(self) -> None:
+        """Close every pooled client"""
+        with self._lock:
+            clients = [client for client, _ in self._clients.values()]
+            self._clients.clear()
+
+        for client in clients:
+            client.close()
+
+
+class TailBuffer:
+    """Byte buffer that only keeps the last max_bytes written to it"""
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize tail buffer
+
+        Args:
+            max_bytes: Number of trailing bytes to keep
+        """
+        self.max_bytes = max_bytes
+        self._chunks: deque = deque()
+        self._size = 0
+
+    def append(self, data: bytes) -> None:
+        """Add a chunk, dropping old chunks no longer needed for the tail"""
+        self._chunks.append(data)
+        self._size += len(data)
+        while self._chunks and self._size - len(self._chunks[0]) >= self.max_bytes:
+            self._size -= len(self._chunks.popleft())
+
+    def getvalue(self) -> bytes:
+        """Get the retained tail"""
+        return b"".join(self._chunks)[-self.max_bytes:]
+
+
+class PersistentShell:
+    """Long-running remote shell (e.g. 'docker exec -i <container> sh') fed commands over stdin"""
+
+    def __init__(self, channel):
+        """
+        Initialize persistent shell
+
+        Args:
+            channel: paramiko Channel already running the shell command
+        """
+        self.channel = channel
+        self._marker = f"__VW_EXIT_{uuid.uuid4().hex}__"
+        self._lock = threading.Lock()
+
+    def run(self, command: str, timeout: int = 30) -> Tuple[int, str, str]:
+        """
+        Run one command inside the shell
+
+        The command's exit status is echoed after a unique marker on stdout,
+        and the marker is echoed on stderr too, so both streams can be split
+        per command. Calls are serialized.
+
+        Args:
+            command: Shell command to execute
+            timeout: Command timeout in seconds
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        marker = self._marker
+        script = f'{{ {command}\n}} </dev/null\necho "{marker}:$?"\necho {marker} >&2\n'
+
+        out_marker = f"{marker}:".encode('utf-8')
+        err_marker = marker.encode('utf-8')
+        # Enough trailing bytes to spot a marker split across two reads
+        keep = len(out_marker)
+
+        with self._lock:
+            try:
+                self.channel.sendall(script.encode('utf-8'))
+                out: List[bytes] = []
+                err: List[bytes] = []
+                out_tail = err_tail = b""
+                out_done = err_done = False
+                deadline = time.monotonic() + timeout
+
+                while not (out_done and err_done):
+                    if self.channel.recv_ready():
+                        chunk = self.channel.recv(32768)
+                        out.append(chunk)
+                        window = out_tail + chunk
+                        out_done = out_done or out_marker in window
+                        out_tail = window[-keep:]
+                    elif self.channel.recv_stderr_ready():
+                        chunk = self.channel.recv_stderr(32768)
+                        err.append(chunk)
+                        window = err_tail + chunk
+                        err_done = err_done or err_marker in window
+                        err_tail = window[-keep:]
+                    elif self.channel.exit_status_ready():
+                        raise RuntimeError("remote shell exited")
+                    elif time.monotonic() > deadline:
+                        raise TimeoutError(f"timed out after {timeout}s")
+                    else:
+                        time.sleep(0.01)
+
+                # Wait for the rest of the exit status line
+                while not out_tail.endswith(b"\n") and time.monotonic() <= deadline:
+                    if self.channel.recv_ready():
+                        chunk = self.channel.recv(32768)
+                        out.append(chunk)
+                        out_tail = (out_tail + chunk)[-keep:]
+                    else:
+                        time.sleep(0.01)
+
+            except Exception as e:
+                # The shell state is unknown after a failure; do not reuse it
+                self.close()
+                raise RuntimeError(f"Command execution failed: {e}")
+
+        stdout_text = b"".join(out).decode('utf-8', errors='replace')
+        stderr_text = b"".join(err).decode('utf-8', errors='replace')
+        stdout_part, _, status = stdout_text.rpartition(f"{marker}:")
+        stderr_part = stderr_text.rpartition(marker)[0]
+        return int(status.strip() or 1), stdout_part.strip(), stderr_part.strip()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the remote shell has exited or been closed"""
+        return self.channel.closed or self.channel.exit_status_ready()
+
+    def close(self) -> None:
+        """Stop the remote shell"""
+        try:
+            if not self.channel.closed:
+                self.channel.sendall(b"exit\n")
+        except Exception:
+            pass
+        self.channel.close()
+
+
+# Process-wide pool so repeated connect()/disconnect() cycles reuse one session
+connection_pool = SSHConnectionPool()
+atexit.register(connection_pool.close_all)
+
+
 class SSHManager:
     """Manages SSH connections to VPS"""
 
-    def __init__(self, host: str, port: int, user: str, key_path: str):
+    def __init__(self, host: str, port: int, user: str, key_path: str, pooled: bool = True):
         """
         Initialize SSH manager
 
@@ -20,13 +254,20 @@ class SSHManager:
             port: SSH port
             user: SSH username
             key_path: Path to SSH private key
+            pooled: Reuse authenticated sessions from the shared connection pool
         """
         self.host = host
         self.port = port
         self.user = user
         self.key_path = Path(key_path).expanduser()
+        self.pooled = pooled
         self.client: Optional[SSHClient] = None
 
+    @property
+    def pool_key(self) -> Tuple[str, str, int]:
+        """Connection pool key for this manager"""
+        return (self.user, self.host, self.port)
+
     def connect(self) -> bool:
         """
         Establish SSH connection
@@ -47,6 +288,12 @@ class SSHManager:
                     f"Should be 600 or 400"
                 )
 
+            # Reuse a pooled session (skips TCP handshake, key exchange and auth)
+            if self.pooled:
+                self.client = connection_pool.acquire(self.pool_key)
+                if self.client is not None:
+                    return True
+
             # Create SSH client
             self.client = SSHClient()
             self.client.set_missing_host_key_policy(AutoAddPolicy())
@@ -62,6 +309,11 @@ class SSHManager:
                 auth_timeout=10
             )
 
+            # Keep the session alive while it sits in the pool between commands
+            transport = self.client.get_transport()
+            if transport is not None:
+                transport.set_keepalive(KEEPALIVE_INTERVAL)
+
             return True
 
         except FileNotFoundError as e:
@@ -74,9 +326,19 @@ class SSHManager:
             raise Exception(f"Unexpected SSH error: {e}")
 
     def disconnect(self) -> None:
-        """Close SSH connection"""
+        """
+        Close SSH connection
+
+        Pooled sessions are only returned to the shared pool and stay open
+        for reuse (until they idle out or the process exits). To really
+        close them, call connection_pool.close_all() or create the manager
+        with pooled=False.
+        """
         if self.client:
-            self.client.close()
+            if self.pooled:
+                connection_pool.release(self.pool_key, self.client)
+            else:
+                self.client.close()
             self.client = None
 
     def run_command(self, command: str, timeout: int = 30) -> Tuple[int, str, str]:
@@ -104,6 +366,189 @@ class SSHManager:
         except Exception as e:
             raise RuntimeError(f"Command execution failed: {e}")
 
+    def run_command_stream(self, command: str, timeout: int = 30) -> Iterator[str]:
+        """
+        Execute command on remote VPS yielding stdout line by line
+
+        Output is parsed as it arrives instead of being buffered whole, so
+        long listings (rclone ls on large buckets) run in constant memory.
+
+        Args:
+            command: Shell command to execute
+            timeout: Command timeout in seconds
+
+        Yields:
+            Lines of stdout without trailing newlines
+
+        Raises:
+            RuntimeError: If execution fails or the command exits non-zero
+        """
+        if not self.client:
+            raise RuntimeError("SSH not connected. Call connect() first.")
+
+        try:
+            _, stdout, stderr = self.client.exec_command(command, timeout=timeout)
+            for line in stdout:
+                yield line.rstrip('\r\n')
+            exit_code = stdout.channel.recv_exit_status()
+            stderr_text = stderr.read().decode('utf-8', errors='replace').strip()
+        except Exception as e:
+            raise RuntimeError(f"Command execution failed: {e}")
+
+        if exit_code != 0:
+            raise RuntimeError(f"Command exited with status {exit_code}: {stderr_text}")
+
+    def run_command_tail(
+        self,
+        command: str,
+        timeout: int = 30,
+        tail_bytes: int = 8192
+    ) -> Tuple[int, str, str]:
+        """
+        Execute command on remote VPS keeping only the end of its output
+
+        Useful for chatty commands (wp core/plugin install) whose output is
+        only inspected for a status message near the end.
+
+        Args:
+            command: Shell command to execute
+            timeout: Command timeout in seconds
+            tail_bytes: Number of trailing bytes kept per stream
+
+        Returns:
+            Tuple of (exit_code, stdout tail, stderr tail)
+        """
+        if not self.client:
+            raise RuntimeError("SSH not connected. Call connect() first.")
+
+        try:
+            _, stdout, _ = self.client.exec_command(command, timeout=timeout)
+            channel = stdout.channel
+            out_tail = TailBuffer(tail_bytes)
+            err_tail = TailBuffer(tail_bytes)
+            deadline = time.monotonic() + timeout
+
+            while True:
+                if channel.recv_ready():
+                    out_tail.append(channel.recv(32768))
+                elif channel.recv_stderr_ready():
+                    err_tail.append(channel.recv_stderr(32768))
+                elif channel.exit_status_ready():
+                    # Exit status arrives after the last data; drain and stop
+                    while channel.recv_ready():
+                        out_tail.append(channel.recv(32768))
+                    while channel.recv_stderr_ready():
+                        err_tail.append(channel.recv_stderr(32768))
+                    break
+                elif time.monotonic() > deadline:
+                    channel.close()
+                    raise TimeoutError(f"timed out after {timeout}s")
+                else:
+                    time.sleep(0.01)
+
+            exit_code = channel.recv_exit_status()
+            stdout_text = out_tail.getvalue().decode('utf-8', errors='replace').strip()
+            stderr_text = err_tail.getvalue().decode('utf-8', errors='replace').strip()
+
+            return exit_code, stdout_text, stderr_text
+
+        except Exception as e:
+            raise RuntimeError(f"Command execution failed: {e}")
+
+    def open_shell(self, command: str) -> PersistentShell:
+        """
+        Start a long-running remote shell on its own channel
+
+        Args:
+            command: Command that reads shell commands from stdin
+                (e.g. 'docker exec -i <container> sh')
+
+        Returns:
+            PersistentShell wrapping the channel
+        """
+        if not self.client:
+            raise RuntimeError("SSH not connected. Call connect() first.")
+
+        try:
+            channel = self.client.get_transport().open_session()
+            channel.exec_command(command)
+            return PersistentShell(channel)
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to open remote shell: {e}")
+
+    def run_argv(
+        self,
+        argv: List[str],
+        timeout: int = 30,
+        tail_bytes: Optional[int] = None
+    ) -> Tuple[int, str, str]:
+        """
+        Execute an argv list on remote VPS
+
+        Every token is quoted exactly once here, so callers pass raw values
+        and no nested "sh -c" is needed on the remote side.
+
+        Args:
+            argv: Command and arguments
+            timeout: Command timeout in seconds
+            tail_bytes: Only keep this many trailing bytes of output (see run_command_tail)
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        command = shlex.join(argv)
+        if tail_bytes:
+            return self.run_command_tail(command, timeout=timeout, tail_bytes=tail_bytes)
+        return self.run_command(command, timeout=timeout)
+
+    def run_script(
+        self,
+        commands: List[str],
+        timeout: int = 60,
+        container: Optional[str] = None
+    ) -> List[Tuple[int, str, str]]:
+        """
+        Execute several commands in one remote exec
+
+        Each command is followed by a unique numbered marker carrying its exit
+        status on stdout (and the bare marker on stderr), so a single round
+        trip yields per-command results. A failing command does not stop the
+        ones after it.
+
+        Args:
+            commands: Shell commands to execute, in order
+            timeout: Timeout in seconds for the whole script
+            container: Run the whole script inside this Docker container with
+                a single 'docker exec ... sh -c'
+
+        Returns:
+            List of (exit_code, stdout, stderr) tuples, one per command
+        """
+        if not commands:
+            return []
+
+        marker = f"__VIBEWP_SEP_{uuid.uuid4().hex}_"
+        script = "".join(
+            f'{{ {command}\n}} </dev/null\necho "{marker}{i}:$?"\necho {marker}{i} >&2\n'
+            for i, command in enumerate(commands)
+        )
+        if container:
+            script = f"docker exec {shlex.quote(container)} sh -c {shlex.quote(script)}"
+        _, stdout, stderr = self.run_command(script, timeout=timeout)
+
+        # re.split yields [chunk, index, status, chunk, index, status, ..., rest]
+        out_parts = re.split(rf"{marker}(\d+):(\d+)\n?", stdout)
+        err_parts = re.split(rf"{marker}(\d+)\n?", stderr)
+
+        results = [(1, "", "")] * len(commands)
+        errors = {int(err_parts[i + 1]): err_parts[i].strip() for i in range(0, len(err_parts) - 1, 2)}
+        for i in range(0, len(out_parts) - 1, 3):
+            index = int(out_parts[i + 1])
+            results[index] = (int(out_parts[i + 2]), out_parts[i].strip(), errors.get(index, ""))
+
+        return results
+
     def upload_file(self, local_path: str, remote_path: str) -> None:
         """
         Upload file to VPS via SFTP
@@ -168,11 +613,6 @@ class SSHManager:
         except Exception as e:
             raise RuntimeError(f"File check failed: {e}")
 
-    def __enter__(self):
-        """Context manager entry"""
-        self.connect()
-        return self
-
     def read_file(self, remote_path: str) -> str:
         """
         Read file content from VPS
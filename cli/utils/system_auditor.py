@@ -1,9 +1,235 @@
 """System-level security auditing for VPS infrastructure"""
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import re
 
+from cli.utils.slots import SlottedDataclass
+
+
+# Upper bound on system checks run at once over the shared SSH connection
+MAX_AUDIT_WORKERS = 9
+
+
+# One pass over the whole buffer per parser; [^\S\n] is whitespace within a line
+_SSH_CONFIG_RE = re.compile(
+    r'^[^\S\n]*(?P<key>[^#\s]\S*)[^\S\n]+(?P<value>\S(?:[^\n]*\S)?)',
+    re.MULTILINE
+)
+_UFW_HEADER_RE = re.compile(
+    r'^(?=[^\n]*To)(?=[^\n]*Action)(?=[^\n]*From)[^\n]*$', re.MULTILINE
+)
+_UFW_RULE_RE = re.compile(
+    r'^[^\S\n]*(?!-)(?P<to>\S*/\S*|\d+|(?i:anywhere|any))'
+    r'[^\S\n]+(?P<action>\S+)[^\S\n]+(?P<from>\S[^\n]*)',
+    re.MULTILINE
+)
+_SS_LINE_RE = re.compile(
+    r'^[^\S\n]*(?P<protocol>\S+)(?:[^\S\n]+\S+){3}[^\S\n]+'
+    r'(?P<address>\S*):(?P<port>[^\s:]*)(?!\S)'
+    r'(?:[^\S\n]+\S+(?:[^\S\n]+(?P<process>\S+))?)?',
+    re.MULTILINE
+)
+_STAT_PERMS_RE = re.compile(r'^(\S+) ([0-7]+)$', re.MULTILINE)
+
+# One pass over auth.log: failed SSH login count, then "IP <addr> <n>" for
+# addresses over the offender threshold, then "SUDO <line>" for the last 10
+# sudo entries. The address sits before "port <n> ssh2" in sshd's message.
+_SSH_OFFENDER_THRESHOLD = 5
+_AUTH_LOG_AWK = (
+    '/Failed password/ {failed++; ip[$(NF-3)]++} '
+    '/sudo:/ {sudo[n++ % 10] = $0} '
+    'END {print failed + 0; '
+    f'for (i in ip) if (ip[i] > {_SSH_OFFENDER_THRESHOLD}) print "IP", i, ip[i]; '
+    'for (k = (n > 10 ? n - 10 : 0); k < n; k++) print "SUDO", sudo[k % 10]}'
+)
+
+# Services that should never run on a hardened host, in reporting order
+_INSECURE_SERVICES = ('telnet', 'rsh', 'rlogin', 'vsftpd', 'xinetd')
+
+# Ports whose services should not be reachable beyond localhost
+_RISKY_PORTS = {
+    '3306': 'MySQL',
+    '5432': 'PostgreSQL',
+    '6379': 'Redis',
+    '27017': 'MongoDB',
+    '9200': 'Elasticsearch',
+    '8080': 'HTTP Proxy',
+    '2375': 'Docker API (unencrypted)',
+    '2376': 'Docker API'
+}
+
+
+@dataclass(frozen=True)
+class FindingTemplate(SlottedDataclass):
+    """Fixed text of one system finding; {name} fields are filled per hit"""
+    # The field order is the key order of emitted findings
+    __slots__ = ('id', 'severity', 'title', 'description', 'impact', 'remediation', 'auto_fix')
+
+    id: str
+    severity: str
+    title: str
+    description: str
+    impact: str
+    remediation: str
+    auto_fix: Optional[str]
+
+    def emit(self, **params) -> Dict:
+        """
+        Build the finding dict reported for one hit
+
+        Args:
+            **params: Values for the {name} placeholders in the text fields
+
+        Returns:
+            Finding dictionary
+        """
+        finding = {key: getattr(self, key) for key in self.__slots__}
+        if params:
+            for key in _TEMPLATE_FIELDS:
+                finding[key] = finding[key].format(**params)
+        return finding
+
+
+# Text fields that may carry {name} placeholders
+_TEMPLATE_FIELDS = frozenset({'id', 'title', 'description', 'remediation'})
+
+_SSH_001 = FindingTemplate(
+    'SSH-001', 'high', 'Root login enabled',
+    'SSH allows direct root login',
+    'Increases brute-force attack surface',
+    'Edit /etc/ssh/sshd_config: PermitRootLogin no',
+    None
+)
+_SSH_002 = FindingTemplate(
+    'SSH-002', 'high', 'Password authentication enabled',
+    'SSH allows password-based login',
+    'Vulnerable to brute-force and credential stuffing attacks',
+    'Edit /etc/ssh/sshd_config: PasswordAuthentication no',
+    None
+)
+_SSH_003 = FindingTemplate(
+    'SSH-003', 'medium', 'Default SSH port in use',
+    'SSH running on default port 22',
+    'Easier target for automated attacks',
+    'Change SSH port to non-standard value',
+    'vibewp ssh change-port <port>'
+)
+_SSH_004 = FindingTemplate(
+    'SSH-004', 'high', 'Public key authentication disabled',
+    'SSH public key authentication is not enabled',
+    'Cannot use key-based authentication',
+    'Edit /etc/ssh/sshd_config: PubkeyAuthentication yes',
+    None
+)
+_SSH_005 = FindingTemplate(
+    'SSH-005', 'critical', 'SSH Protocol 1 enabled',
+    'Insecure SSH Protocol 1 is enabled',
+    'Vulnerable to known protocol attacks',
+    'Edit /etc/ssh/sshd_config: Protocol 2',
+    None
+)
+_FW_001 = FindingTemplate(
+    'FW-001', 'critical', 'UFW not installed',
+    'Uncomplicated Firewall (UFW) is not installed',
+    'No firewall protection',
+    'Install UFW: sudo apt-get install ufw',
+    None
+)
+_FW_002 = FindingTemplate(
+    'FW-002', 'critical', 'Firewall inactive',
+    'UFW firewall is installed but not active',
+    'All ports exposed to internet',
+    'Enable firewall: sudo ufw enable',
+    'vibewp firewall enable'
+)
+_FW_003 = FindingTemplate(
+    'FW-003', 'medium', 'Unrestricted access on port {port}',
+    'Port {port} allows connections from any IP',
+    'Increased attack surface',
+    'Restrict access to specific IPs if possible',
+    None
+)
+_FW_004 = FindingTemplate(
+    'FW-004', 'high', 'Permissive default incoming policy',
+    'Default incoming policy is not deny',
+    'Ports not explicitly denied are accessible',
+    'Set default deny: sudo ufw default deny incoming',
+    None
+)
+_F2B_001 = FindingTemplate(
+    'F2B-001', 'medium', 'fail2ban not installed',
+    'fail2ban intrusion prevention not installed',
+    'No automatic IP banning for brute-force attacks',
+    'Install fail2ban: sudo apt-get install fail2ban',
+    None
+)
+_F2B_002 = FindingTemplate(
+    'F2B-002', 'medium', 'fail2ban not running',
+    'fail2ban service is not active',
+    'No protection against brute-force attacks',
+    'Start fail2ban: sudo systemctl start fail2ban',
+    None
+)
+_F2B_003 = FindingTemplate(
+    'F2B-003', 'medium', 'SSH jail not configured',
+    'fail2ban sshd jail is not active',
+    'SSH not protected by fail2ban',
+    'Enable sshd jail in /etc/fail2ban/jail.local',
+    None
+)
+_PORT_EXPOSED = FindingTemplate(
+    'PORT-{port}', 'high', '{service} exposed',
+    '{service} (port {port}) is listening on {address}',
+    'Service accessible from network',
+    'Bind {service} to localhost only',
+    None
+)
+_SVC_INSECURE = FindingTemplate(
+    'SVC-{unit}', 'high', 'Insecure service running: {service}',
+    '{service} service is running',
+    'Potential security vulnerability',
+    'Disable service: sudo systemctl disable {service}',
+    None
+)
+_USER_NO_PASSWORD = FindingTemplate(
+    'USER-{user}', 'high', 'User without password: {user}',
+    'User account {user} has no password set',
+    'Potential unauthorized access',
+    'Set password: sudo passwd {user}',
+    None
+)
+_UPD_001 = FindingTemplate(
+    'UPD-001', 'high', '{count} security updates available',
+    'System has {count} pending security updates',
+    'Known vulnerabilities may be exploitable',
+    'Install updates: sudo apt-get upgrade',
+    'vibewp security install-updates --security-only'
+)
+_UPD_002 = FindingTemplate(
+    'UPD-002', 'medium', '{count} total updates available',
+    'System has {count} pending updates',
+    'System may be missing important patches',
+    'Install updates: sudo apt-get upgrade',
+    'vibewp security install-updates'
+)
+_LOG_001 = FindingTemplate(
+    'LOG-001', 'medium', '{count} failed SSH login attempts',
+    'Detected {count} failed SSH authentication attempts',
+    'Possible brute-force attack in progress',
+    'Review /var/log/auth.log and consider fail2ban',
+    None
+)
+_FS_PERMISSIONS = FindingTemplate(
+    'FS-{slug}', 'medium', 'Incorrect permissions on {path}',
+    '{path} has permissions {actual}, expected {expected}',
+    'Sensitive file may be accessible to unauthorized users',
+    'Fix permissions: sudo chmod {expected} {path}',
+    None
+)
+
 
 class SystemAuditor:
     """Comprehensive system-level security auditor"""
@@ -17,26 +243,38 @@ class SystemAuditor:
         """
         self.ssh = ssh_manager
 
-    def audit_all(self) -> Dict:
+    def audit_all(self, max_workers: int = MAX_AUDIT_WORKERS) -> Dict:
         """
         Run all system-level security audits
 
+        The checks share no state, so they run concurrently and the audit
+        takes about as long as the slowest check instead of their sum.
+
+        Args:
+            max_workers: Maximum checks run at once
+
         Returns:
             Dictionary with all audit results
         """
-        return {
-            'ssh': self.audit_ssh_config(),
-            'firewall': self.audit_firewall(),
-            'fail2ban': self.audit_fail2ban(),
-            'ports': self.audit_open_ports(),
-            'services': self.audit_services(),
-            'users': self.audit_users(),
-            'updates': self.audit_updates(),
-            'logs': self.audit_logs(),
-            'filesystem': self.audit_filesystem_permissions(),
-            'timestamp': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        checks = {
+            'ssh': self.audit_ssh_config,
+            'firewall': self.audit_firewall,
+            'fail2ban': self.audit_fail2ban,
+            'ports': self.audit_open_ports,
+            'services': self.audit_services,
+            'users': self.audit_users,
+            'updates': self.audit_updates,
+            'logs': self.audit_logs,
+            'filesystem': self.audit_filesystem_permissions,
         }
 
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(checks)))) as executor:
+            futures = {name: executor.submit(check) for name, check in checks.items()}
+            results = {name: future.result() for name, future in futures.items()}
+
+        results['timestamp'] = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        return results
+
     def audit_ssh_config(self) -> Dict:
         """
         Audit SSH configuration for security issues
@@ -57,67 +295,27 @@ class SystemAuditor:
         # Check root login
         permit_root = config_dict.get('permitrootlogin', 'yes').lower()
         if permit_root not in ['no', 'prohibit-password']:
-            findings.append({
-                'id': 'SSH-001',
-                'severity': 'high',
-                'title': 'Root login enabled',
-                'description': 'SSH allows direct root login',
-                'impact': 'Increases brute-force attack surface',
-                'remediation': 'Edit /etc/ssh/sshd_config: PermitRootLogin no',
-                'auto_fix': None
-            })
+            findings.append(_SSH_001.emit())
 
         # Check password authentication
         password_auth = config_dict.get('passwordauthentication', 'yes').lower()
         if password_auth == 'yes':
-            findings.append({
-                'id': 'SSH-002',
-                'severity': 'high',
-                'title': 'Password authentication enabled',
-                'description': 'SSH allows password-based login',
-                'impact': 'Vulnerable to brute-force and credential stuffing attacks',
-                'remediation': 'Edit /etc/ssh/sshd_config: PasswordAuthentication no',
-                'auto_fix': None
-            })
+            findings.append(_SSH_002.emit())
 
         # Check SSH port
         port = config_dict.get('port', '22')
         if port == '22':
-            findings.append({
-                'id': 'SSH-003',
-                'severity': 'medium',
-                'title': 'Default SSH port in use',
-                'description': 'SSH running on default port 22',
-                'impact': 'Easier target for automated attacks',
-                'remediation': 'Change SSH port to non-standard value',
-                'auto_fix': 'vibewp ssh change-port <port>'
-            })
+            findings.append(_SSH_003.emit())
 
         # Check key-based authentication
         pubkey_auth = config_dict.get('pubkeyauthentication', 'yes').lower()
         if pubkey_auth != 'yes':
-            findings.append({
-                'id': 'SSH-004',
-                'severity': 'high',
-                'title': 'Public key authentication disabled',
-                'description': 'SSH public key authentication is not enabled',
-                'impact': 'Cannot use key-based authentication',
-                'remediation': 'Edit /etc/ssh/sshd_config: PubkeyAuthentication yes',
-                'auto_fix': None
-            })
+            findings.append(_SSH_004.emit())
 
         # Check protocol version
         protocol = config_dict.get('protocol', '2')
         if '1' in protocol:
-            findings.append({
-                'id': 'SSH-005',
-                'severity': 'critical',
-                'title': 'SSH Protocol 1 enabled',
-                'description': 'Insecure SSH Protocol 1 is enabled',
-                'impact': 'Vulnerable to known protocol attacks',
-                'remediation': 'Edit /etc/ssh/sshd_config: Protocol 2',
-                'auto_fix': None
-            })
+            findings.append(_SSH_005.emit())
 
         return {'findings': findings, 'config': config_dict}
 
@@ -134,57 +332,24 @@ class SystemAuditor:
         exit_code, status, _ = self.ssh.run_command("sudo ufw status verbose")
 
         if exit_code != 0:
-            findings.append({
-                'id': 'FW-001',
-                'severity': 'critical',
-                'title': 'UFW not installed',
-                'description': 'Uncomplicated Firewall (UFW) is not installed',
-                'impact': 'No firewall protection',
-                'remediation': 'Install UFW: sudo apt-get install ufw',
-                'auto_fix': None
-            })
+            findings.append(_FW_001.emit())
             return {'findings': findings, 'active': False, 'rules': []}
 
         firewall_active = 'Status: active' in status
         if not firewall_active:
-            findings.append({
-                'id': 'FW-002',
-                'severity': 'critical',
-                'title': 'Firewall inactive',
-                'description': 'UFW firewall is installed but not active',
-                'impact': 'All ports exposed to internet',
-                'remediation': 'Enable firewall: sudo ufw enable',
-                'auto_fix': 'vibewp firewall enable'
-            })
-
-        # Parse firewall rules
-        rules = self._parse_ufw_rules(status)
-
-        # Check for overly permissive rules
-        for rule in rules:
+            findings.append(_FW_002.emit())
+
+        # Parse firewall rules and check for overly permissive ones in the same pass
+        rules = []
+        for rule in self._iter_ufw_records(status):
+            rules.append(rule)
             if rule.get('from') == 'Anywhere' and rule.get('to').startswith('Anywhere'):
-                findings.append({
-                    'id': 'FW-003',
-                    'severity': 'medium',
-                    'title': f"Unrestricted access on port {rule.get('to_port', 'unknown')}",
-                    'description': f"Port {rule.get('to_port')} allows connections from any IP",
-                    'impact': 'Increased attack surface',
-                    'remediation': f"Restrict access to specific IPs if possible",
-                    'auto_fix': None
-                })
+                findings.append(_FW_003.emit(port=rule.get('to_port', 'unknown')))
 
         # Check default policy
         default_incoming = 'Default: deny (incoming)' in status
         if not default_incoming:
-            findings.append({
-                'id': 'FW-004',
-                'severity': 'high',
-                'title': 'Permissive default incoming policy',
-                'description': 'Default incoming policy is not deny',
-                'impact': 'Ports not explicitly denied are accessible',
-                'remediation': 'Set default deny: sudo ufw default deny incoming',
-                'auto_fix': None
-            })
+            findings.append(_FW_004.emit())
 
         return {
             'findings': findings,
@@ -205,15 +370,7 @@ class SystemAuditor:
         # Check if fail2ban is installed
         exit_code, _, _ = self.ssh.run_command("which fail2ban-client")
         if exit_code != 0:
-            findings.append({
-                'id': 'F2B-001',
-                'severity': 'medium',
-                'title': 'fail2ban not installed',
-                'description': 'fail2ban intrusion prevention not installed',
-                'impact': 'No automatic IP banning for brute-force attacks',
-                'remediation': 'Install fail2ban: sudo apt-get install fail2ban',
-                'auto_fix': None
-            })
+            findings.append(_F2B_001.emit())
             return {'findings': findings, 'active': False, 'jails': []}
 
         # Check if fail2ban is running
@@ -223,15 +380,7 @@ class SystemAuditor:
 
         fail2ban_active = 'active' in status.lower() and 'inactive' not in status.lower()
         if not fail2ban_active:
-            findings.append({
-                'id': 'F2B-002',
-                'severity': 'medium',
-                'title': 'fail2ban not running',
-                'description': 'fail2ban service is not active',
-                'impact': 'No protection against brute-force attacks',
-                'remediation': 'Start fail2ban: sudo systemctl start fail2ban',
-                'auto_fix': None
-            })
+            findings.append(_F2B_002.emit())
             return {'findings': findings, 'active': False, 'jails': []}
 
         # Get jail list
@@ -245,15 +394,7 @@ class SystemAuditor:
 
         # Check for sshd jail
         if 'sshd' not in jails:
-            findings.append({
-                'id': 'F2B-003',
-                'severity': 'medium',
-                'title': 'SSH jail not configured',
-                'description': 'fail2ban sshd jail is not active',
-                'impact': 'SSH not protected by fail2ban',
-                'remediation': 'Enable sshd jail in /etc/fail2ban/jail.local',
-                'auto_fix': None
-            })
+            findings.append(_F2B_003.emit())
 
         return {
             'findings': findings,
@@ -278,35 +419,17 @@ class SystemAuditor:
         if exit_code != 0:
             return {'findings': [], 'ports': []}
 
-        ports = self._parse_ss_output(output)
-
-        # Flag potentially risky open ports
-        risky_ports = {
-            '3306': 'MySQL',
-            '5432': 'PostgreSQL',
-            '6379': 'Redis',
-            '27017': 'MongoDB',
-            '9200': 'Elasticsearch',
-            '8080': 'HTTP Proxy',
-            '2375': 'Docker API (unencrypted)',
-            '2376': 'Docker API'
-        }
-
-        for port_info in ports:
+        # Collect listening ports and flag risky ones in the same pass
+        ports = []
+        for port_info in self._iter_ss_records(output):
+            ports.append(port_info)
             port = port_info.get('port')
             address = port_info.get('address')
+            service = _RISKY_PORTS.get(port)
 
             # Check if database/service is exposed to public
-            if port in risky_ports and address != '127.0.0.1':
-                findings.append({
-                    'id': f'PORT-{port}',
-                    'severity': 'high',
-                    'title': f'{risky_ports[port]} exposed',
-                    'description': f'{risky_ports[port]} (port {port}) is listening on {address}',
-                    'impact': 'Service accessible from network',
-                    'remediation': f'Bind {risky_ports[port]} to localhost only',
-                    'auto_fix': None
-                })
+            if service and address != '127.0.0.1':
+                findings.append(_PORT_EXPOSED.emit(port=port, service=service, address=address))
 
         return {
             'findings': findings,
@@ -332,19 +455,11 @@ class SystemAuditor:
 
         services = self._parse_systemctl_output(output)
 
-        # Flag unnecessary services
-        unnecessary_services = ['telnet', 'rsh', 'rlogin', 'vsftpd', 'xinetd']
-        for service_name in unnecessary_services:
-            if any(service_name in s.lower() for s in services):
-                findings.append({
-                    'id': f'SVC-{service_name.upper()}',
-                    'severity': 'high',
-                    'title': f'Insecure service running: {service_name}',
-                    'description': f'{service_name} service is running',
-                    'impact': 'Potential security vulnerability',
-                    'remediation': f'Disable service: sudo systemctl disable {service_name}',
-                    'auto_fix': None
-                })
+        # Flag unnecessary services; template instances (telnet@1) count as the base unit
+        running = {s.lower().split('@', 1)[0] for s in services}
+        for service_name in _INSECURE_SERVICES:
+            if service_name in running:
+                findings.append(_SVC_INSECURE.emit(service=service_name, unit=service_name.upper()))
 
         return {
             'findings': findings,
@@ -360,22 +475,20 @@ class SystemAuditor:
         """
         findings = []
 
-        # Get users with sudo access
-        exit_code, sudo_users, _ = self.ssh.run_command(
-            "grep -Po '^sudo.+:\\K.*$' /etc/group"
-        )
+        # Sudo members, login-shell users and password-less accounts in one round trip
+        (sudo_exit, sudo_users, _), (passwd_exit, passwd, _), (shadow_exit, shadow_check, _) = \
+            self.ssh.run_script([
+                "grep -Po '^sudo.+:\\K.*$' /etc/group",
+                "getent passwd | grep -v '/nologin\\|/false'",
+                "sudo awk -F: '($2 == \"\" ) {print $1}' /etc/shadow",
+            ])
 
         users_with_sudo = []
-        if exit_code == 0 and sudo_users.strip():
+        if sudo_exit == 0 and sudo_users.strip():
             users_with_sudo = [u.strip() for u in sudo_users.split(',')]
 
-        # Get users with login shells
-        exit_code, passwd, _ = self.ssh.run_command(
-            "getent passwd | grep -v '/nologin\\|/false'"
-        )
-
         login_users = []
-        if exit_code == 0:
+        if passwd_exit == 0:
             for line in passwd.split('\n'):
                 if line.strip():
                     parts = line.split(':')
@@ -386,25 +499,13 @@ class SystemAuditor:
                             login_users.append(username)
 
         # Check for users without password
-        exit_code, shadow_check, _ = self.ssh.run_command(
-            "sudo awk -F: '($2 == \"\" ) {print $1}' /etc/shadow"
-        )
-
         users_no_password = []
-        if exit_code == 0 and shadow_check.strip():
+        if shadow_exit == 0 and shadow_check.strip():
             users_no_password = [u.strip() for u in shadow_check.split('\n') if u.strip()]
 
         for user in users_no_password:
             if user != 'root':  # Root typically checked separately
-                findings.append({
-                    'id': f'USER-{user}',
-                    'severity': 'high',
-                    'title': f'User without password: {user}',
-                    'description': f'User account {user} has no password set',
-                    'impact': 'Potential unauthorized access',
-                    'remediation': f'Set password: sudo passwd {user}',
-                    'auto_fix': None
-                })
+                findings.append(_USER_NO_PASSWORD.emit(user=user))
 
         return {
             'findings': findings,
@@ -437,26 +538,10 @@ class SystemAuditor:
         security_updates = int(security.strip()) if security.strip().isdigit() else 0
 
         if security_updates > 0:
-            findings.append({
-                'id': 'UPD-001',
-                'severity': 'high',
-                'title': f'{security_updates} security updates available',
-                'description': f'System has {security_updates} pending security updates',
-                'impact': 'Known vulnerabilities may be exploitable',
-                'remediation': 'Install updates: sudo apt-get upgrade',
-                'auto_fix': 'vibewp security install-updates --security-only'
-            })
+            findings.append(_UPD_001.emit(count=security_updates))
 
         if total_updates > 10:
-            findings.append({
-                'id': 'UPD-002',
-                'severity': 'medium',
-                'title': f'{total_updates} total updates available',
-                'description': f'System has {total_updates} pending updates',
-                'impact': 'System may be missing important patches',
-                'remediation': 'Install updates: sudo apt-get upgrade',
-                'auto_fix': 'vibewp security install-updates'
-            })
+            findings.append(_UPD_002.emit(count=total_updates))
 
         return {
             'findings': findings,
@@ -473,36 +558,35 @@ class SystemAuditor:
         """
         findings = []
 
-        # Check for failed SSH login attempts
-        exit_code, failed_ssh, _ = self.ssh.run_command(
-            "sudo grep 'Failed password' /var/log/auth.log 2>/dev/null | wc -l"
-        )
-
-        failed_attempts = int(failed_ssh.strip()) if failed_ssh.strip().isdigit() else 0
-
-        if failed_attempts > 100:
-            findings.append({
-                'id': 'LOG-001',
-                'severity': 'medium',
-                'title': f'{failed_attempts} failed SSH login attempts',
-                'description': f'Detected {failed_attempts} failed SSH authentication attempts',
-                'impact': 'Possible brute-force attack in progress',
-                'remediation': 'Review /var/log/auth.log and consider fail2ban',
-                'auto_fix': None
-            })
-
-        # Check for sudo usage
-        exit_code, sudo_usage, _ = self.ssh.run_command(
-            "sudo grep 'sudo:' /var/log/auth.log 2>/dev/null | tail -20"
+        # Count failed SSH logins, tally offender IPs and keep recent sudo lines
+        # in a single awk pass over auth.log instead of one grep per question
+        exit_code, output, _ = self.ssh.run_command(
+            f"sudo awk '{_AUTH_LOG_AWK}' /var/log/auth.log 2>/dev/null"
         )
 
+        failed_attempts = 0
+        offenders = []
         recent_sudo = []
         if exit_code == 0:
-            recent_sudo = sudo_usage.split('\n')[:10]  # Last 10 entries
+            count, _, records = output.partition('\n')
+            failed_attempts = int(count.strip()) if count.strip().isdigit() else 0
+            for record in records.split('\n'):
+                kind, _, value = record.partition(' ')
+                if kind == 'IP':
+                    ip, _, attempts = value.rpartition(' ')
+                    if attempts.isdigit():
+                        offenders.append({'ip': ip, 'attempts': int(attempts)})
+                elif kind == 'SUDO':
+                    recent_sudo.append(value)
+            offenders.sort(key=lambda o: o['attempts'], reverse=True)
+
+        if failed_attempts > 100:
+            findings.append(_LOG_001.emit(count=failed_attempts))
 
         return {
             'findings': findings,
             'failed_ssh_attempts': failed_attempts,
+            'ssh_offenders': offenders,
             'recent_sudo': recent_sudo
         }
 
@@ -523,25 +607,22 @@ class SystemAuditor:
             '/etc/ssh/sshd_config': '600'
         }
 
-        for filepath, expected_perms in sensitive_files.items():
-            exit_code, perms, _ = self.ssh.run_command(
-                f"stat -c '%a' {filepath} 2>/dev/null"
-            )
+        # One stat for every file; missing files simply print no line
+        _, output, _ = self.ssh.run_command(
+            f"stat -c '%n %a' {' '.join(sensitive_files)} 2>/dev/null"
+        )
+        perms_by_file = dict(_STAT_PERMS_RE.findall(output))
 
-            if exit_code != 0:
+        for filepath, expected_perms in sensitive_files.items():
+            actual_perms = perms_by_file.get(filepath)
+            if actual_perms is None:
                 continue
 
-            actual_perms = perms.strip()
             if actual_perms != expected_perms:
-                findings.append({
-                    'id': f'FS-{filepath.replace("/", "-")}',
-                    'severity': 'medium',
-                    'title': f'Incorrect permissions on {filepath}',
-                    'description': f'{filepath} has permissions {actual_perms}, expected {expected_perms}',
-                    'impact': 'Sensitive file may be accessible to unauthorized users',
-                    'remediation': f'Fix permissions: sudo chmod {expected_perms} {filepath}',
-                    'auto_fix': None
-                })
+                findings.append(_FS_PERMISSIONS.emit(
+                    path=filepath, slug=filepath.replace('/', '-'),
+                    actual=actual_perms, expected=expected_perms
+                ))
 
         return {
             'findings': findings
@@ -550,70 +631,41 @@ class SystemAuditor:
     # Helper methods
     def _parse_ssh_config(self, config: str) -> Dict[str, str]:
         """Parse SSH config into dictionary"""
-        config_dict = {}
-        for line in config.split('\n'):
-            line = line.strip()
-            if line and not line.startswith('#'):
-                parts = line.split(None, 1)
-                if len(parts) == 2:
-                    key = parts[0].lower()
-                    value = parts[1]
-                    config_dict[key] = value
-        return config_dict
-
-    def _parse_ufw_rules(self, status: str) -> List[Dict]:
-        """Parse UFW status output into rule list"""
-        rules = []
-        in_rules_section = False
+        return {
+            match.group('key').lower(): match.group('value')
+            for match in _SSH_CONFIG_RE.finditer(config)
+        }
 
-        for line in status.split('\n'):
-            line = line.strip()
+    def _iter_ufw_records(self, status: str) -> Iterator[Dict]:
+        """Yield UFW rules from status output as they are matched"""
+        header = _UFW_HEADER_RE.search(status)
+        if not header:
+            return
 
-            if 'To' in line and 'Action' in line and 'From' in line:
-                in_rules_section = True
-                continue
+        for match in _UFW_RULE_RE.finditer(status, header.end()):
+            yield {
+                'to': match.group('to'),
+                'action': match.group('action'),
+                'from': ' '.join(match.group('from').split())
+            }
 
-            if in_rules_section and line:
-                parts = line.split()
-                # Skip header separator lines and ensure valid rule format
-                if len(parts) >= 3 and not line.startswith('-'):
-                    # Additional validation: check if first part contains port/service info
-                    if '/' in parts[0] or parts[0].isdigit() or parts[0].lower() in ['anywhere', 'any']:
-                        rules.append({
-                            'to': parts[0],
-                            'action': parts[1],
-                            'from': ' '.join(parts[2:])
-                        })
-
-        return rules
+    def _parse_ufw_rules(self, status: str) -> List[Dict]:
+        """Parse UFW status output into rule list"""
+        return list(self._iter_ufw_records(status))
+
+    def _iter_ss_records(self, output: str) -> Iterator[Dict]:
+        """Yield listening sockets from ss output as they are matched"""
+        for match in _SS_LINE_RE.finditer(output):
+            yield {
+                'protocol': match.group('protocol'),
+                'address': match.group('address').replace('[', '').replace(']', ''),
+                'port': match.group('port'),
+                'process': match.group('process') or 'unknown'
+            }
 
     def _parse_ss_output(self, output: str) -> List[Dict]:
         """Parse ss command output"""
-        ports = []
-        for line in output.split('\n'):
-            if not line.strip():
-                continue
-
-            parts = line.split()
-            if len(parts) >= 5:
-                # Extract address and port from local address
-                local_addr = parts[4]
-                if ':' in local_addr:
-                    addr_parts = local_addr.rsplit(':', 1)
-                    address = addr_parts[0].replace('[', '').replace(']', '')
-                    port = addr_parts[1]
-
-                    # Extract process name if available
-                    process = parts[6] if len(parts) > 6 else 'unknown'
-
-                    ports.append({
-                        'protocol': parts[0],
-                        'address': address,
-                        'port': port,
-                        'process': process
-                    })
-
-        return ports
+        return list(self._iter_ss_records(output))
 
     def _parse_systemctl_output(self, output: str) -> List[str]:
         """Parse systemctl list output"""
@@ -1,5 +1,7 @@
 """Update manager for VibeWP CLI self-update functionality."""
 
+import importlib.util
+import json
 import os
 import sys
 import subprocess
@@ -8,25 +10,33 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
+from functools import lru_cache
+from importlib.metadata import Distribution, PackageNotFoundError, distribution
 import logging
 
 from cli.utils.github import GitHubClient, GitHubRelease
+from cli.utils.slots import SlottedDataclass
 from cli.utils.version import parse_version, compare_versions
 from cli import __version__
 
 logger = logging.getLogger(__name__)
 
+# Latest release lookups persist here so most CLI runs skip the GitHub call
+RELEASE_CACHE_FILE = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'vibewp' / 'releases.json'
 
-class InstallMethod(Enum):
-    """Installation method types."""
+
+class InstallMethod(str, Enum):
+    """Installation method types (members compare equal to their values)."""
     PIP_EDITABLE = "pip_editable"  # pip install -e .
     PIP_PACKAGE = "pip_package"    # pip install vibewp
     SCRIPT_INSTALL = "script"       # install.sh
 
 
-@dataclass
-class UpdateInfo:
-    """Update information."""
+@dataclass(eq=False)
+class UpdateInfo(SlottedDataclass):
+    """Update information (read field by field, never compared)."""
+    __slots__ = ('current_version', 'latest_version', 'update_available', 'release', 'install_method')
+
     current_version: str
     latest_version: str
     update_available: bool
@@ -39,59 +49,85 @@ class UpdateError(Exception):
     pass
 
 
-class UpdateManager:
-    """Manages VibeWP CLI updates."""
-
-    def __init__(self):
-        """Initialize update manager."""
-        self.current_version = __version__
-        self.github_client = GitHubClient()
-        self.install_method = self._detect_install_method()
-
-    def _detect_install_method(self) -> InstallMethod:
-        """
-        Detect how VibeWP was installed.
-
-        Returns:
-            InstallMethod enum value
+def _installed_distribution() -> Optional[Distribution]:
+    """
+    Look up the installed vibewp distribution metadata in-process.
 
-        Detection logic:
-        1. Check if /opt/vibewp/.git exists (script install)
-        2. Check if installed via pip editable mode
-        3. Default to pip package install
-        """
-        # Check for script install (git repo in /opt/vibewp)
-        script_install_path = Path("/opt/vibewp/.git")
-        if script_install_path.exists():
-            logger.debug("Detected script installation method")
-            return InstallMethod.SCRIPT_INSTALL
+    Returns:
+        Distribution for vibewp or None if it is not installed
+    """
+    try:
+        return distribution("vibewp")
+    except PackageNotFoundError:
+        return None
 
-        # Check pip installation method
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "show", "-f", "vibewp"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
 
-            if result.returncode == 0:
-                output = result.stdout
+def _is_editable(dist: Distribution) -> bool:
+    """
+    Check the PEP 610 direct_url.json record for an editable install.
+
+    Args:
+        dist: Installed vibewp distribution
+
+    Returns:
+        True if pip installed it in editable mode
+    """
+    direct_url = dist.read_text("direct_url.json")
+    if not direct_url:
+        return False
+
+    try:
+        return bool(json.loads(direct_url).get("dir_info", {}).get("editable"))
+    except (ValueError, AttributeError):
+        return False
+
+
+@lru_cache(maxsize=None)
+def _detect_install_method() -> InstallMethod:
+    """
+    Detect how VibeWP was installed.
+
+    The answer cannot change while the process runs, so the probes (a
+    filesystem check and a metadata lookup) run once per process.
+
+    Returns:
+        InstallMethod enum value
+
+    Detection logic:
+    1. Check if /opt/vibewp/.git exists (script install)
+    2. Check if installed via pip editable mode
+    3. Default to pip package install
+    """
+    # Check for script install (git repo in /opt/vibewp)
+    script_install_path = Path("/opt/vibewp/.git")
+    if script_install_path.exists():
+        logger.debug("Detected script installation method")
+        return InstallMethod.SCRIPT_INSTALL
+
+    # Check pip installation method from the installed metadata
+    dist = _installed_distribution()
+    if dist is not None:
+        if _is_editable(dist):
+            logger.debug("Detected pip editable installation method")
+            return InstallMethod.PIP_EDITABLE
+
+        logger.debug("Detected pip package installation method")
+        return InstallMethod.PIP_PACKAGE
 
-                # Check for editable install
-                if "Editable project location:" in output or "editable" in output.lower():
-                    logger.debug("Detected pip editable installation method")
-                    return InstallMethod.PIP_EDITABLE
+    # Default to pip package
+    logger.debug("Defaulting to pip package installation method")
+    return InstallMethod.PIP_PACKAGE
 
-                logger.debug("Detected pip package installation method")
-                return InstallMethod.PIP_PACKAGE
 
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired) as e:
-            logger.warning(f"Failed to detect installation method via pip: {e}")
+class UpdateManager:
+    """Manages VibeWP CLI updates."""
 
-        # Default to pip package
-        logger.debug("Defaulting to pip package installation method")
-        return InstallMethod.PIP_PACKAGE
+    def __init__(self):
+        """Initialize update manager."""
+        self.current_version = __version__
+        self.github_client = GitHubClient(release_cache_file=RELEASE_CACHE_FILE)
+        self.install_method = _detect_install_method()
+        self._installation_info: Optional[Dict[str, Any]] = None
 
     def _get_install_path(self) -> Optional[Path]:
         """
@@ -103,32 +139,25 @@ class UpdateManager:
         if self.install_method == InstallMethod.SCRIPT_INSTALL:
             return Path("/opt/vibewp")
 
-        # For pip installs, try to get the location
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "show", "vibewp"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if line.startswith('Location:'):
-                        location = line.split(':', 1)[1].strip()
-                        return Path(location) / "vibewp"
-
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired):
-            pass
+        # For pip installs, the metadata directory sits in site-packages
+        dist = _installed_distribution()
+        if dist is not None:
+            return Path(dist.locate_file("")) / "vibewp"
 
         return None
 
-    def check_for_updates(self, include_prerelease: bool = False) -> UpdateInfo:
+    def check_for_updates(self, include_prerelease: bool = False, revalidate: bool = False) -> UpdateInfo:
         """
         Check if updates are available.
 
+        Passive checks may answer from the on-disk release cache; explicit
+        user commands should pass revalidate=True so a release published
+        since the last lookup is seen.
+
         Args:
             include_prerelease: Include pre-release versions
+            revalidate: Confirm the cached release with GitHub (see
+                GitHubClient.get_latest_release)
 
         Returns:
             UpdateInfo object with version comparison
@@ -139,7 +168,8 @@ class UpdateManager:
         try:
             # Get latest release from GitHub
             latest_release = self.github_client.get_latest_release(
-                include_prerelease=include_prerelease
+                include_prerelease=include_prerelease,
+                revalidate=revalidate
             )
 
             if latest_release is None:
@@ -291,7 +321,12 @@ class UpdateManager:
         """
         logger.info("Updating via pip...")
 
-        cmd = [sys.executable, "-m", "pip", "install", "--upgrade"]
+        # Only upgrade dependencies the new release actually requires; pins the
+        # strategy even when the user's pip config asks for "eager"
+        cmd = [
+            sys.executable, "-m", "pip", "install", "--upgrade",
+            "--upgrade-strategy", "only-if-needed"
+        ]
 
         if force:
             cmd.append("--force-reinstall")
@@ -322,10 +357,13 @@ class UpdateManager:
             True if installation is valid
         """
         try:
-            # Try importing CLI
-            import cli.main
-            return True
-        except ImportError as e:
+            # Locate the CLI entry module without executing it; importing it
+            # would pull in every command module for a yes/no answer
+            if importlib.util.find_spec("cli.main") is not None:
+                return True
+            logger.error("Installation verification failed: cli.main not found")
+            return False
+        except (ImportError, ValueError) as e:
             logger.error(f"Installation verification failed: {e}")
             return False
 
@@ -333,13 +371,19 @@ class UpdateManager:
         """
         Get detailed installation information.
 
+        None of the details change while the process runs, so they are
+        gathered on the first call and later calls return a copy.
+
         Returns:
             Dict with installation details
         """
-        return {
-            "version": self.current_version,
-            "install_method": self.install_method.value,
-            "install_path": str(self._get_install_path()) if self._get_install_path() else "unknown",
-            "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-            "python_executable": sys.executable
-        }
+        if self._installation_info is None:
+            install_path = self._get_install_path()
+            self._installation_info = {
+                "version": self.current_version,
+                "install_method": self.install_method.value,
+                "install_path": str(install_path) if install_path else "unknown",
+                "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+                "python_executable": sys.executable
+            }
+        return dict(self._installation_info)
@@ -3,16 +3,42 @@
 from typing import Tuple, Optional
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
+from cli.utils.slots import SlottedDataclass
+
+# Matches: major.minor.patch[-prerelease][+build]
+_SEMVER_RE = re.compile(r'^(\d+)\.(\d+)\.(\d+)(?:-([a-zA-Z0-9.-]+))?(?:\+([a-zA-Z0-9.-]+))?$')
+
+
+@dataclass(frozen=True, init=False)
+class SemanticVersion(SlottedDataclass):
+    """Semantic version representation (immutable, so parsed instances can be shared)."""
+    # Slotted fields cannot carry class-level defaults, so __init__ supplies
+    # them. _key holds the cached _sort_key and is not a dataclass field
+    __slots__ = ('major', 'minor', 'patch', 'prerelease', 'build', '_key')
 
-@dataclass
-class SemanticVersion:
-    """Semantic version representation."""
     major: int
     minor: int
     patch: int
-    prerelease: Optional[str] = None
-    build: Optional[str] = None
+    prerelease: Optional[str]
+    build: Optional[str]
+
+    def __init__(
+        self,
+        major: int,
+        minor: int,
+        patch: int,
+        prerelease: Optional[str] = None,
+        build: Optional[str] = None
+    ):
+        """Set the fields of the frozen instance."""
+        set_field = object.__setattr__
+        set_field(self, 'major', major)
+        set_field(self, 'minor', minor)
+        set_field(self, 'patch', patch)
+        set_field(self, 'prerelease', prerelease)
+        set_field(self, 'build', build)
 
     def __str__(self) -> str:
         """Return version string."""
@@ -34,27 +60,43 @@ class SemanticVersion:
             self.prerelease == other.prerelease
         )
 
+    def __hash__(self) -> int:
+        """Hash the fields equality compares (build metadata is ignored)."""
+        return hash((self.major, self.minor, self.patch, self.prerelease))
+
     def __lt__(self, other) -> bool:
         """Compare versions (less than)."""
         if not isinstance(other, SemanticVersion):
             return NotImplemented
-
-        # Compare major.minor.patch
-        if (self.major, self.minor, self.patch) != (other.major, other.minor, other.patch):
-            return (self.major, self.minor, self.patch) < (other.major, other.minor, other.patch)
-
-        # Handle pre-release comparison
-        # No prerelease > prerelease (1.0.0 > 1.0.0-beta)
-        if self.prerelease is None and other.prerelease is not None:
-            return False
-        if self.prerelease is not None and other.prerelease is None:
-            return True
-
-        # Both have prerelease, compare alphabetically
-        if self.prerelease and other.prerelease:
-            return self.prerelease < other.prerelease
-
-        return False
+        return self._sort_key < other._sort_key
+
+    @property
+    def _sort_key(self) -> Tuple:
+        """
+        Precedence key, built on first comparison and kept on the instance.
+
+        A release sorts after its prereleases (1.0.0-beta < 1.0.0). Prerelease
+        identifiers compare numerically when numeric, and numeric ones sort
+        before alphanumeric ones (rc.2 < rc.10 < rc.a).
+        """
+        try:
+            return self._key
+        except AttributeError:
+            pass
+
+        if self.prerelease is None:
+            key = (self.major, self.minor, self.patch, 1, ())
+        else:
+            identifiers = tuple(
+                # The raw text breaks ties so "01" and "1", which are not
+                # equal, still order consistently with __eq__
+                (0, int(part), part) if part.isdecimal() else (1, part)
+                for part in self.prerelease.split('.')
+            )
+            key = (self.major, self.minor, self.patch, 0, identifiers)
+
+        object.__setattr__(self, '_key', key)
+        return key
 
     def __le__(self, other) -> bool:
         """Compare versions (less than or equal)."""
@@ -69,6 +111,7 @@ class SemanticVersion:
         return not self < other
 
 
+@lru_cache(maxsize=256)
 def parse_version(version_str: str) -> Optional[SemanticVersion]:
     """
     Parse version string into SemanticVersion object.
@@ -86,26 +129,11 @@ def parse_version(version_str: str) -> Optional[SemanticVersion]:
     Returns:
         SemanticVersion object or None if invalid
     """
-    # Remove 'v' prefix if present
-    version_str = version_str.strip().lstrip('v')
-
-    # Regex pattern for semantic versioning
-    # Matches: major.minor.patch[-prerelease][+build]
-    pattern = r'^(\d+)\.(\d+)\.(\d+)(?:-([a-zA-Z0-9.-]+))?(?:\+([a-zA-Z0-9.-]+))?$'
-
-    match = re.match(pattern, version_str)
-    if not match:
+    fields = _split_version(version_str)
+    if fields is None:
         return None
 
-    major, minor, patch, prerelease, build = match.groups()
-
-    return SemanticVersion(
-        major=int(major),
-        minor=int(minor),
-        patch=int(patch),
-        prerelease=prerelease,
-        build=build
-    )
+    return SemanticVersion(*fields)
 
 
 def compare_versions(version1: str, version2: str) -> int:
@@ -140,6 +168,7 @@ def compare_versions(version1: str, version2: str) -> int:
         return 0
 
 
+@lru_cache(maxsize=256)
 def is_newer_version(current: str, latest: str) -> bool:
     """
     Check if latest version is newer than current.
@@ -151,6 +180,10 @@ def is_newer_version(current: str, latest: str) -> bool:
     Returns:
         True if latest > current, False otherwise
     """
+    # Identical strings are never newer, valid or not, so skip parsing
+    if current == latest:
+        return False
+
     try:
         return compare_versions(current, latest) < 0
     except ValueError:
@@ -171,7 +204,44 @@ def version_to_tuple(version_str: str) -> Tuple[int, int, int]:
     Raises:
         ValueError: If version string is invalid
     """
-    v = parse_version(version_str)
-    if v is None:
+    fields = _split_version(version_str)
+    if fields is None:
         raise ValueError(f"Invalid version string: {version_str}")
-    return (v.major, v.minor, v.patch)
+    return fields[:3]
+
+
+def _split_version(
+    version_str: str
+) -> Optional[Tuple[int, int, int, Optional[str], Optional[str]]]:
+    """
+    Split a version string into (major, minor, patch, prerelease, build).
+
+    Surrounding whitespace and a single 'v' or 'V' prefix are ignored. Plain
+    major.minor.patch strings, most release tags, are split with str
+    methods; anything with a prerelease or build suffix goes through
+    _SEMVER_RE.
+
+    Args:
+        version_str: Version string to split
+
+    Returns:
+        Version fields, or None if invalid
+    """
+    if not version_str:
+        return None
+
+    version_str = version_str.strip()
+    if version_str[:1] in ('v', 'V'):
+        version_str = version_str[1:]
+
+    parts = version_str.split('.')
+    # isdecimal() accepts exactly what the pattern's \d does
+    if len(parts) == 3 and all(part.isdecimal() for part in parts):
+        return int(parts[0]), int(parts[1]), int(parts[2]), None, None
+
+    match = _SEMVER_RE.match(version_str)
+    if not match:
+        return None
+
+    major, minor, patch, prerelease, build = match.groups()
+    return int(major), int(minor), int(patch), prerelease, build
@@ -1,34 +1,135 @@
 """WPScan API integration for WordPress vulnerability scanning"""
 
 import requests
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta, timezone
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional, Tuple
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 import json
+import re
+import threading
 import time
 
+from cli.utils import jsonio
+
+
+# Upper bound on WPScan requests in flight at once
+MAX_SCAN_WORKERS = 8
+
+# API collection for each component type
+_API_RESOURCES = {'plugin': 'plugins', 'theme': 'themes', 'core': 'wordpresses'}
+
+# Lowest CVSS score for each severity above 'low'
+_CVSS_THRESHOLDS = (4.0, 7.0, 9.0)
+_CVSS_SEVERITIES = ('low', 'medium', 'high', 'critical')
+
+
+_LEADING_DIGITS_RE = re.compile(r'\d+')
+
+
+@lru_cache(maxsize=1024)
+def _version_key(version: str) -> Tuple[Tuple[int, ...], int]:
+    """
+    Parse a version string into a key that orders like the version
+
+    Numeric release parts are compared as integers with trailing zeros
+    dropped (so 1.0 == 1.0.0). A pre-release ("-rc1", "beta2") sorts before
+    its release and "+build" metadata is ignored. Parsed once per distinct
+    string, since the same fixed_in values recur across sites.
+
+    Args:
+        version: Version string
+
+    Returns:
+        (release parts, 1 for a release or 0 for a pre-release)
+    """
+    release, dash, _ = version.split('+', 1)[0].partition('-')
+    prerelease = bool(dash)
+    parts = []
+    for part in release.split('.'):
+        match = _LEADING_DIGITS_RE.match(part)
+        if not match:
+            continue
+        parts.append(int(match.group()))
+        if match.end() < len(part):  # "0rc1"
+            prerelease = True
+            break
+
+    while parts and parts[-1] == 0:
+        parts.pop()
+
+    return tuple(parts), 0 if prerelease else 1
+
+
+def _index_fixed_in(vuln_list: List[Dict]) -> Tuple[List, List[int], List[int]]:
+    """
+    Order vulnerabilities by the version that fixed them
+
+    Args:
+        vuln_list: Vulnerabilities from an API response
+
+    Returns:
+        (sorted fixed_in keys, positions of those vulnerabilities in the same
+        order, positions of vulnerabilities without a fixed_in)
+    """
+    fixed = []
+    unfixed = []
+    for position, vuln in enumerate(vuln_list):
+        fixed_in = vuln.get('fixed_in')
+        if fixed_in:
+            fixed.append((_version_key(fixed_in), position))
+        else:
+            unfixed.append(position)
+
+    fixed.sort()
+    return [key for key, _ in fixed], [position for _, position in fixed], unfixed
+
 
 class VulnerabilityScanner:
     """WordPress vulnerability scanner using WPScan API"""
 
     WPSCAN_API_URL = "https://wpscan.com/api/v3"
     CACHE_DURATION = 3600  # 1 hour in seconds
+    CACHE_MAX_ENTRIES = 4096
     RATE_LIMIT_DELAY = 1  # Delay between requests in seconds
 
-    def __init__(self, api_token: Optional[str] = None):
+    def __init__(self, api_token: Optional[str] = None, cache_file: Optional[Path] = None):
         """
         Initialize vulnerability scanner
 
         Args:
             api_token: WPScan API token (optional)
+            cache_file: JSON file keeping scan results between runs (None keeps them in memory only)
         """
-        self.api_token = api_token
-        self._cache = {}
+        self.set_api_token(api_token)
+        # Every request path is appended to this prefix
+        self._api_url_prefix = f"{self.WPSCAN_API_URL}/"
+        self.cache_file = Path(cache_file) if cache_file else None
+        # One pooled session so consecutive lookups reuse the keep-alive
+        # connection instead of paying a TCP/TLS handshake per slug
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        # key -> (result, time.monotonic() expiry), least recently used first
+        self._cache: "OrderedDict[str, Tuple[Dict, float]]" = OrderedDict()
         self._last_request_time = 0
         self._request_count = 0
+        # API path -> future _fetch() result; one request per path for the
+        # scanner's lifetime (one audit run), whichever scan asks first
+        self._responses: Dict[str, Future] = {}
+        # Guards the rate limit slot, request count and _responses across scan threads
+        self._lock = threading.Lock()
+
+        if self.cache_file:
+            self._load_cache_file()
 
-    def set_api_token(self, token: str):
+    def set_api_token(self, token: Optional[str]):
         """Set WPScan API token"""
         self.api_token = token
+        # Built once per token rather than per request
+        self._headers = {"Authorization": f"Token token={token}"} if token else {}
 
     def scan_plugin(self, plugin_slug: str, version: Optional[str] = None) -> Dict:
         """
@@ -41,266 +142,263 @@ class VulnerabilityScanner:
         Returns:
             Dictionary with vulnerability information
         """
-        if not self.api_token:
-            return {
-                'slug': plugin_slug,
-                'version': version,
-                'vulnerabilities': [],
-                'error': 'No API token configured'
-            }
-
-        # Check cache
-        cache_key = f"plugin:{plugin_slug}:{version or 'latest'}"
-        if cache_key in self._cache:
-            cached_data, cached_time = self._cache[cache_key]
-            if (datetime.now(timezone.utc) - cached_time).total_seconds() < self.CACHE_DURATION:
-                return cached_data
-
-        # Rate limiting
-        self._apply_rate_limit()
-
-        # Make API request
-        url = f"{self.WPSCAN_API_URL}/plugins/{plugin_slug}"
-        headers = {"Authorization": f"Token token={self.api_token}"}
+        return self.scan_many([('plugin', plugin_slug, version)])[0]
 
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            self._request_count += 1
-
-            if response.status_code == 200:
-                data = response.json()
-                result = self._parse_plugin_response(data, plugin_slug, version)
-
-                # Cache result
-                self._cache[cache_key] = (result, datetime.now(timezone.utc))
+    def scan_theme(self, theme_slug: str, version: Optional[str] = None) -> Dict:
+        """
+        Scan theme for vulnerabilities
 
-                return result
+        Args:
+            theme_slug: WordPress theme slug
+            version: Theme version (optional)
 
-            elif response.status_code == 404:
-                return {
-                    'slug': plugin_slug,
-                    'version': version,
-                    'vulnerabilities': [],
-                    'not_found': True
-                }
+        Returns:
+            Dictionary with vulnerability information
+        """
+        return self.scan_many([('theme', theme_slug, version)])[0]
 
-            elif response.status_code == 429:
-                return {
-                    'slug': plugin_slug,
-                    'version': version,
-                    'vulnerabilities': [],
-                    'error': 'API rate limit exceeded'
-                }
+    def scan_wordpress_core(self, version: str) -> Dict:
+        """
+        Scan WordPress core version for vulnerabilities
 
-            else:
-                return {
-                    'slug': plugin_slug,
-                    'version': version,
-                    'vulnerabilities': [],
-                    'error': f'API error: {response.status_code}'
-                }
+        Args:
+            version: WordPress core version
 
-        except requests.exceptions.RequestException as e:
-            return {
-                'slug': plugin_slug,
-                'version': version,
-                'vulnerabilities': [],
-                'error': f'Request failed: {str(e)}'
-            }
-        except Exception as e:
-            return {
-                'slug': plugin_slug,
-                'version': version,
-                'vulnerabilities': [],
-                'error': f'Unexpected error: {str(e)}'
-            }
+        Returns:
+            Dictionary with vulnerability information
+        """
+        return self.scan_many([('core', version, version)])[0]
 
-    def scan_theme(self, theme_slug: str, version: Optional[str] = None) -> Dict:
+    def scan_many(
+        self,
+        components: List[Tuple[str, str, Optional[str]]],
+        max_workers: int = MAX_SCAN_WORKERS
+    ) -> List[Dict]:
         """
-        Scan theme for vulnerabilities
+        Scan plugins, themes and core versions with overlapping requests
+
+        WPScan serves one slug per request with its full vulnerability
+        history, so each distinct resource is requested once and every
+        version asked for is filtered from that response locally. Requests
+        run on a thread pool; the rate limit still spaces their starts.
 
         Args:
-            theme_slug: WordPress theme slug
-            version: Theme version (optional)
+            components: (type, slug, version) triples; type is 'plugin',
+                'theme' or 'core' (core passes its version as the slug)
+            max_workers: Maximum concurrent API requests
 
         Returns:
-            Dictionary with vulnerability information
+            Scan results in the same order as components
         """
         if not self.api_token:
-            return {
-                'slug': theme_slug,
-                'version': version,
-                'vulnerabilities': [],
-                'error': 'No API token configured'
-            }
+            return self._no_token_results(components)
 
-        # Check cache
-        cache_key = f"theme:{theme_slug}:{version or 'latest'}"
-        if cache_key in self._cache:
-            cached_data, cached_time = self._cache[cache_key]
-            if (datetime.now(timezone.utc) - cached_time).total_seconds() < self.CACHE_DURATION:
-                return cached_data
+        results, pending = self._split_cached(components)
 
-        # Rate limiting
-        self._apply_rate_limit()
+        if pending:
+            if len(pending) == 1:
+                responses = {path: self._fetch_once(path) for path in pending}
+            else:
+                with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+                    responses = dict(zip(pending, executor.map(self._fetch_once, pending)))
 
-        # Make API request
-        url = f"{self.WPSCAN_API_URL}/themes/{theme_slug}"
-        headers = {"Authorization": f"Token token={self.api_token}"}
+            self._fill_results(components, results, pending, responses)
 
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            self._request_count += 1
+        return results
 
-            if response.status_code == 200:
-                data = response.json()
-                result = self._parse_theme_response(data, theme_slug, version)
+    def _no_token_results(self, components: List[Tuple[str, str, Optional[str]]]) -> List[Dict]:
+        """Results for components that cannot be scanned without an API token"""
+        return [
+            self._unscanned_result(kind, slug, version, {'error': 'No API token configured'})
+            for kind, slug, version in components
+        ]
 
-                # Cache result
-                self._cache[cache_key] = (result, datetime.now(timezone.utc))
+    def _split_cached(
+        self,
+        components: List[Tuple[str, str, Optional[str]]]
+    ) -> Tuple[List[Optional[Dict]], Dict[str, List[int]]]:
+        """
+        Answer components from the cache and group the rest by API path
 
-                return result
+        Args:
+            components: (type, slug, version) triples
 
-            elif response.status_code == 404:
-                return {
-                    'slug': theme_slug,
-                    'version': version,
-                    'vulnerabilities': [],
-                    'not_found': True
-                }
+        Returns:
+            (results with cached entries filled in, API path -> indexes of
+            the components it answers)
+        """
+        results = [None] * len(components)
+        pending = {}
+        for index, (kind, slug, version) in enumerate(components):
+            cached = self._get_cached(self._cache_key(kind, slug, version))
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.setdefault(f"{_API_RESOURCES[kind]}/{slug}", []).append(index)
 
-            elif response.status_code == 429:
-                return {
-                    'slug': theme_slug,
-                    'version': version,
-                    'vulnerabilities': [],
-                    'error': 'API rate limit exceeded'
-                }
+        return results, pending
 
-            else:
-                return {
-                    'slug': theme_slug,
-                    'version': version,
-                    'vulnerabilities': [],
-                    'error': f'API error: {response.status_code}'
-                }
+    def _fill_results(
+        self,
+        components: List[Tuple[str, str, Optional[str]]],
+        results: List[Optional[Dict]],
+        pending: Dict[str, List[int]],
+        responses: Dict[str, Tuple[Optional[Dict], Dict]]
+    ):
+        """
+        Parse fetched responses into results and cache them
 
-        except requests.exceptions.RequestException as e:
-            return {
-                'slug': theme_slug,
-                'version': version,
-                'vulnerabilities': [],
-                'error': f'Request failed: {str(e)}'
-            }
-        except Exception as e:
-            return {
-                'slug': theme_slug,
-                'version': version,
-                'vulnerabilities': [],
-                'error': f'Unexpected error: {str(e)}'
-            }
+        Args:
+            components: (type, slug, version) triples
+            results: Results to fill in place
+            pending: API path -> indexes of the components it answers
+            responses: API path -> _fetch() result
+        """
+        for path, indexes in pending.items():
+            data, failure = responses[path]
+            fixed_indexes = {}  # Shared by every version filtered from this response
+            for index in indexes:
+                kind, slug, version = components[index]
+                if failure:
+                    results[index] = self._unscanned_result(kind, slug, version, failure)
+                    continue
+
+                if kind == 'plugin':
+                    result = self._parse_plugin_response(data, slug, version, fixed_indexes)
+                elif kind == 'theme':
+                    result = self._parse_theme_response(data, slug, version, fixed_indexes)
+                else:
+                    result = self._parse_core_response(data, slug)
+
+                self._set_cached(self._cache_key(kind, slug, version), result)
+                results[index] = result
+
+    @staticmethod
+    def _cache_key(kind: str, slug: str, version: Optional[str]) -> str:
+        """Cache key for one component scan"""
+        if kind == 'core':
+            return f"core:{slug}"
+        return f"{kind}:{slug}:{version or 'latest'}"
+
+    @staticmethod
+    def _unscanned_result(kind: str, slug: str, version: Optional[str], failure: Dict) -> Dict:
+        """Scan result for a component whose vulnerabilities could not be fetched"""
+        if kind == 'core':
+            return {'version': slug, 'vulnerabilities': [], **failure}
+        return {'slug': slug, 'version': version, 'vulnerabilities': [], **failure}
+
+    def _get_cached(self, cache_key: str) -> Optional[Dict]:
+        """Return a cached scan result that has not expired yet, dropping it once stale"""
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+
+        cached_data, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._cache[cache_key]
+            return None
+
+        self._cache.move_to_end(cache_key)
+        return cached_data
+
+    def _set_cached(self, cache_key: str, result: Dict) -> None:
+        """
+        Cache a scan result
 
-    def scan_wordpress_core(self, version: str) -> Dict:
+        The least recently used entry is evicted once the cache holds
+        CACHE_MAX_ENTRIES, so memory stays bounded on long-running hosts.
         """
-        Scan WordPress core version for vulnerabilities
+        self._cache[cache_key] = (result, time.monotonic() + self.CACHE_DURATION)
+        self._cache.move_to_end(cache_key)
+        if len(self._cache) > self.CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+    def _fetch_once(self, path: str) -> Tuple[Optional[Dict], Dict]:
+        """
+        _fetch() an API path at most once per scanner
+
+        Sites sharing a plugin at different versions, or failing the same
+        lookup, reuse the first response; a caller arriving while that
+        request is in flight waits for it instead of sending its own.
 
         Args:
-            version: WordPress core version
+            path: API path below WPSCAN_API_URL (e.g. "plugins/akismet")
 
         Returns:
-            Dictionary with vulnerability information
+            The _fetch() result for path
         """
-        if not self.api_token:
-            return {
-                'version': version,
-                'vulnerabilities': [],
-                'error': 'No API token configured'
-            }
+        with self._lock:
+            future = self._responses.get(path)
+            is_owner = future is None
+            if is_owner:
+                future = self._responses[path] = Future()
+
+        if is_owner:
+            try:
+                future.set_result(self._fetch(path))
+            except BaseException as e:
+                future.set_exception(e)  # Don't leave waiters blocked
+                raise
+
+        return future.result()
+
+    def _fetch(self, path: str) -> Tuple[Optional[Dict], Dict]:
+        """
+        Request one WPScan API resource, honouring the rate limit
 
-        # Check cache
-        cache_key = f"core:{version}"
-        if cache_key in self._cache:
-            cached_data, cached_time = self._cache[cache_key]
-            if (datetime.now(timezone.utc) - cached_time).total_seconds() < self.CACHE_DURATION:
-                return cached_data
+        Args:
+            path: API path below WPSCAN_API_URL (e.g. "plugins/akismet")
 
+        Returns:
+            (response data, {}) on success, otherwise (None, result fields
+            describing the failure: 'not_found' or 'error')
+        """
         # Rate limiting
         self._apply_rate_limit()
 
-        # Make API request
-        url = f"{self.WPSCAN_API_URL}/wordpresses/{version}"
-        headers = {"Authorization": f"Token token={self.api_token}"}
-
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            self._request_count += 1
+            response = self._session.get(self._api_url_prefix + path, headers=self._headers, timeout=10)
+            with self._lock:
+                self._request_count += 1
 
             if response.status_code == 200:
-                data = response.json()
-                result = self._parse_core_response(data, version)
-
-                # Cache result
-                self._cache[cache_key] = (result, datetime.now(timezone.utc))
-
-                return result
-
+                return self._decode(response), {}
             elif response.status_code == 404:
-                return {
-                    'version': version,
-                    'vulnerabilities': [],
-                    'not_found': True
-                }
-
+                return None, {'not_found': True}
             elif response.status_code == 429:
-                return {
-                    'version': version,
-                    'vulnerabilities': [],
-                    'error': 'API rate limit exceeded'
-                }
-
+                return None, {'error': 'API rate limit exceeded'}
             else:
-                return {
-                    'version': version,
-                    'vulnerabilities': [],
-                    'error': f'API error: {response.status_code}'
-                }
+                return None, {'error': f'API error: {response.status_code}'}
 
         except requests.exceptions.RequestException as e:
-            return {
-                'version': version,
-                'vulnerabilities': [],
-                'error': f'Request failed: {str(e)}'
-            }
+            return None, {'error': f'Request failed: {str(e)}'}
         except Exception as e:
-            return {
-                'version': version,
-                'vulnerabilities': [],
-                'error': f'Unexpected error: {str(e)}'
-            }
+            return None, {'error': f'Unexpected error: {str(e)}'}
 
-    def _parse_plugin_response(self, data: Dict, slug: str, version: Optional[str]) -> Dict:
+    @staticmethod
+    def _decode(response: requests.Response) -> Dict:
+        """Decode a JSON response body from its raw bytes"""
+        try:
+            return jsonio.loads(response.content)
+        except (TypeError, ValueError):
+            pass  # Body not UTF-8 JSON; let requests detect the encoding
+        return response.json()
+
+    def _parse_plugin_response(
+        self,
+        data: Dict,
+        slug: str,
+        version: Optional[str],
+        fixed_indexes: Optional[Dict] = None
+    ) -> Dict:
         """Parse WPScan API plugin response"""
-        vulnerabilities = []
-
         plugin_data = data.get(slug, {})
         vuln_list = plugin_data.get('vulnerabilities', [])
 
-        for vuln in vuln_list:
-            # Check if vulnerability affects the current version
-            if version:
-                fixed_in = vuln.get('fixed_in')
-                if fixed_in and self._version_compare(version, fixed_in) >= 0:
-                    continue  # Version is fixed
-
-            vulnerability = {
-                'title': vuln.get('title', 'Unknown vulnerability'),
-                'type': vuln.get('vuln_type', 'Unknown'),
-                'fixed_in': vuln.get('fixed_in'),
-                'references': vuln.get('references', {}).get('url', []),
-                'cvss': vuln.get('cvss', {}).get('score'),
-            }
-
-            vulnerabilities.append(vulnerability)
+        vulnerabilities = [
+            self._vulnerability_entry(vuln)
+            for vuln in self._affected_vulnerabilities(vuln_list, version, fixed_indexes)
+        ]
 
         return {
             'slug': slug,
@@ -310,29 +408,21 @@ class VulnerabilityScanner:
             'popular': plugin_data.get('popular', False)
         }
 
-    def _parse_theme_response(self, data: Dict, slug: str, version: Optional[str]) -> Dict:
+    def _parse_theme_response(
+        self,
+        data: Dict,
+        slug: str,
+        version: Optional[str],
+        fixed_indexes: Optional[Dict] = None
+    ) -> Dict:
         """Parse WPScan API theme response"""
-        vulnerabilities = []
-
         theme_data = data.get(slug, {})
         vuln_list = theme_data.get('vulnerabilities', [])
 
-        for vuln in vuln_list:
-            # Check if vulnerability affects the current version
-            if version:
-                fixed_in = vuln.get('fixed_in')
-                if fixed_in and self._version_compare(version, fixed_in) >= 0:
-                    continue  # Version is fixed
-
-            vulnerability = {
-                'title': vuln.get('title', 'Unknown vulnerability'),
-                'type': vuln.get('vuln_type', 'Unknown'),
-                'fixed_in': vuln.get('fixed_in'),
-                'references': vuln.get('references', {}).get('url', []),
-                'cvss': vuln.get('cvss', {}).get('score'),
-            }
-
-            vulnerabilities.append(vulnerability)
+        vulnerabilities = [
+            self._vulnerability_entry(vuln)
+            for vuln in self._affected_vulnerabilities(vuln_list, version, fixed_indexes)
+        ]
 
         return {
             'slug': slug,
@@ -343,27 +433,63 @@ class VulnerabilityScanner:
 
     def _parse_core_response(self, data: Dict, version: str) -> Dict:
         """Parse WPScan API WordPress core response"""
-        vulnerabilities = []
-
         core_data = data.get(version, {})
-        vuln_list = core_data.get('vulnerabilities', [])
-
-        for vuln in vuln_list:
-            vulnerability = {
-                'title': vuln.get('title', 'Unknown vulnerability'),
-                'type': vuln.get('vuln_type', 'Unknown'),
-                'fixed_in': vuln.get('fixed_in'),
-                'references': vuln.get('references', {}).get('url', []),
-                'cvss': vuln.get('cvss', {}).get('score'),
-            }
-
-            vulnerabilities.append(vulnerability)
+        vulnerabilities = [
+            self._vulnerability_entry(vuln)
+            for vuln in core_data.get('vulnerabilities', [])
+        ]
 
         return {
             'version': version,
             'vulnerabilities': vulnerabilities
         }
 
+    @staticmethod
+    def _vulnerability_entry(vuln: Dict) -> Dict:
+        """Reduce one API vulnerability record to the fields reported"""
+        return {
+            'title': vuln.get('title', 'Unknown vulnerability'),
+            'type': vuln.get('vuln_type', 'Unknown'),
+            'fixed_in': vuln.get('fixed_in'),
+            'references': vuln.get('references', {}).get('url', []),
+            'cvss': vuln.get('cvss', {}).get('score'),
+        }
+
+    @staticmethod
+    def _affected_vulnerabilities(
+        vuln_list: List[Dict],
+        version: Optional[str],
+        fixed_indexes: Optional[Dict] = None
+    ) -> List[Dict]:
+        """
+        Select the vulnerabilities that still affect an installed version
+
+        The list is ordered by fixed_in once, so each version is a single
+        bisect rather than one version comparison per vulnerability.
+
+        Args:
+            vuln_list: Vulnerabilities from an API response
+            version: Installed version (None keeps every vulnerability)
+            fixed_indexes: Memo of built indexes keyed by id(vuln_list), shared
+                by the versions filtered from one response
+
+        Returns:
+            Affected vulnerabilities in API order
+        """
+        if not version:
+            return vuln_list
+
+        if fixed_indexes is None:
+            fixed_indexes = {}
+        index = fixed_indexes.get(id(vuln_list))
+        if index is None:
+            index = fixed_indexes[id(vuln_list)] = _index_fixed_in(vuln_list)
+
+        fixed_keys, fixed_positions, unfixed_positions = index
+        # Everything fixed in a version above the installed one still applies
+        start = bisect_right(fixed_keys, _version_key(version))
+        return [vuln_list[position] for position in sorted(unfixed_positions + fixed_positions[start:])]
+
     def convert_to_findings(self, scan_result: Dict, site_name: str, component_type: str) -> List[Dict]:
         """
         Convert vulnerability scan results to standard finding format
@@ -378,35 +504,34 @@ class VulnerabilityScanner:
         """
         findings = []
 
-        if 'error' in scan_result:
-            # Don't create findings for errors
+        vulnerabilities = scan_result.get('vulnerabilities')
+        if 'error' in scan_result or not vulnerabilities:
+            # Don't create findings for errors; up-to-date components have none left
             return findings
 
         slug = scan_result.get('slug', scan_result.get('version', 'unknown'))
         version = scan_result.get('version', 'unknown')
 
-        for idx, vuln in enumerate(scan_result.get('vulnerabilities', [])):
+        # Shared by every finding for this component
+        id_prefix = f'VULN-{site_name}-{component_type.upper()}-{slug}-'
+        title = f'{component_type.capitalize()} vulnerability: {slug}'
+        impact = f'Vulnerable {component_type} may be exploited'
+
+        for idx, vuln in enumerate(vulnerabilities, 1):
             # Determine severity from CVSS score
             cvss = vuln.get('cvss')
             if cvss:
-                if cvss >= 9.0:
-                    severity = 'critical'
-                elif cvss >= 7.0:
-                    severity = 'high'
-                elif cvss >= 4.0:
-                    severity = 'medium'
-                else:
-                    severity = 'low'
+                severity = _CVSS_SEVERITIES[bisect_right(_CVSS_THRESHOLDS, cvss)]
             else:
                 severity = 'high'  # Default to high if no CVSS
 
             # Build finding
             finding = {
-                'id': f'VULN-{site_name}-{component_type.upper()}-{slug}-{idx+1}',
+                'id': f'{id_prefix}{idx}',
                 'severity': severity,
-                'title': f'{component_type.capitalize()} vulnerability: {slug}',
+                'title': title,
                 'description': vuln.get('title', 'Unknown vulnerability'),
-                'impact': f'Vulnerable {component_type} may be exploited',
+                'impact': impact,
                 'remediation': f"Update {slug} to version {vuln.get('fixed_in', 'latest')}",
                 'auto_fix': None,
                 'cvss': cvss,
@@ -418,14 +543,14 @@ class VulnerabilityScanner:
         return findings
 
     def _apply_rate_limit(self):
-        """Apply rate limiting between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - time_since_last)
+        """Reserve the next request slot and wait for it (safe across threads)"""
+        with self._lock:
+            current_time = time.time()
+            start = max(current_time, self._last_request_time + self.RATE_LIMIT_DELAY)
+            self._last_request_time = start
 
-        self._last_request_time = time.time()
+        if start > current_time:
+            time.sleep(start - current_time)
 
     def _version_compare(self, version1: str, version2: str) -> int:
         """
@@ -438,24 +563,9 @@ class VulnerabilityScanner:
         Returns:
             -1 if version1 < version2, 0 if equal, 1 if version1 > version2
         """
-        def normalize(v):
-            return [int(x) for x in v.split('.') if x.isdigit()]
-
-        v1_parts = normalize(version1)
-        v2_parts = normalize(version2)
-
-        # Pad with zeros
-        max_len = max(len(v1_parts), len(v2_parts))
-        v1_parts += [0] * (max_len - len(v1_parts))
-        v2_parts += [0] * (max_len - len(v2_parts))
-
-        for i in range(max_len):
-            if v1_parts[i] < v2_parts[i]:
-                return -1
-            elif v1_parts[i] > v2_parts[i]:
-                return 1
-
-        return 0
+        key1 = _version_key(version1)
+        key2 = _version_key(version2)
+        return (key1 > key2) - (key1 < key2)
 
     def get_request_count(self) -> int:
         """Get number of API requests made in current session"""
@@ -463,19 +573,58 @@ class VulnerabilityScanner:
 
     def clear_cache(self):
         """Clear vulnerability cache"""
-        self._cache = {}
+        self._cache.clear()
+        with self._lock:
+            self._responses.clear()
+
+    def _load_cache_file(self) -> None:
+        """Seed the cache with unexpired results saved by an earlier run (unreadable files are ignored)"""
+        now = time.time()
+        try:
+            entries = json.loads(self.cache_file.read_text())
+            fresh = sorted(
+                (stored_at, key, result)
+                for key, (result, stored_at) in entries.items()
+                if now - stored_at < self.CACHE_DURATION
+            )
+        except (OSError, ValueError, TypeError, AttributeError):
+            return
+
+        # Oldest first, so the least recently stored entries are evicted first.
+        # The file keeps wall-clock store times; expiry here is monotonic.
+        expiry_offset = time.monotonic() + self.CACHE_DURATION - now
+        for stored_at, key, result in fresh:
+            self._cache[key] = (result, stored_at + expiry_offset)
+
+    def save_cache(self) -> None:
+        """Write unexpired scan results to cache_file for the next run (failures are ignored)"""
+        if not self.cache_file:
+            return
+
+        now = time.monotonic()
+        # Store times go back to wall-clock epoch seconds, comparable across runs
+        stored_at_offset = time.time() - now - self.CACHE_DURATION
+        entries = {
+            key: [result, expires_at + stored_at_offset]
+            for key, (result, expires_at) in self._cache.items()
+            if expires_at > now
+        }
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_text(json.dumps(entries))
+        except OSError:
+            pass
 
     def get_cache_stats(self) -> Dict:
         """Get cache statistics"""
         total = len(self._cache)
-        expired = 0
-
-        for _, (_, cached_time) in self._cache.items():
-            if (datetime.now(timezone.utc) - cached_time).total_seconds() >= self.CACHE_DURATION:
-                expired += 1
+        now = time.monotonic()
+        expired = sum(1 for _, expires_at in self._cache.values() if expires_at <= now)
 
         return {
             'total_entries': total,
             'expired_entries': expired,
-            'active_entries': total - expired
+            'active_entries': total - expired,
+            'max_entries': self.CACHE_MAX_ENTRIES
         }
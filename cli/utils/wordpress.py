@@ -1,13 +1,81 @@
 """WordPress management utilities for VibeWP CLI"""
 
 import base64
+import functools
+import json
+import re
 import shlex
-from typing import Dict, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from cli.utils.credentials import CredentialGenerator
+from cli.utils.permissions import PermissionsManager
+
+
+# Marker echoed between batched commands so per-step output can be recovered
+BATCH_SEPARATOR = "---VW-SEP---"
+
+# Install commands are only checked for a trailing status line
+OUTPUT_TAIL_BYTES = 8192
+
+# WP-CLI release phar and the SHA-512 checksum published next to it
+WPCLI_PHAR_URL = "https://raw.githubusercontent.com/wp-cli/builds/gh-pages/phar/wp-cli.phar"
+WPCLI_SHA512_URL = f"{WPCLI_PHAR_URL}.sha512"
+
+# Case-insensitive match avoids lower-casing the whole output
+ALREADY_INSTALLED_RE = re.compile(r"already installed", re.IGNORECASE)
+
+
+def _wrap_errors(message: str):
+    """
+    Re-raise any exception from the decorated method as RuntimeError
+
+    Args:
+        message: Prefix for the RuntimeError message
+
+    Returns:
+        Decorator chaining the original exception as __cause__
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                raise RuntimeError(f"{message}: {e}") from e
+        return wrapper
+    return decorator
 
 
 class WordPressManager:
     """Manages WordPress installations via WP-CLI"""
 
+    # Prebuilt "--path=... --allow-root" suffixes shared by every WP-CLI call
+    _PATH_SUFFIX = {
+        "frankenwp": "--path=/var/www/html --allow-root",
+        "wordpress": "--path=/var/www/html --allow-root",
+        "ols": "--path=/var/www/vhosts --allow-root",
+    }
+    _PATH_ARGS = {wp_type: suffix.split() for wp_type, suffix in _PATH_SUFFIX.items()}
+
+    # Prebuilt WP-CLI argv fragments; only per-call values are appended
+    _WP_PLUGIN_INSTALL = ("wp", "plugin", "install")
+    _WP_PLUGIN_ACTIVATE = ("wp", "plugin", "activate")
+    _WP_PLUGIN_LIST = ("wp", "plugin", "list", "--fields=name,status", "--format=json")
+    _WP_CORE_VERSION = ("wp", "core", "version")
+    _WP_USER_CREATE = ("wp", "user", "create")
+    _WP_OPTION_UPDATE = ("wp", "option", "update")
+
+    # 'wp plugin list' statuses that count as active
+    _ACTIVE_STATUSES = ("active", "active-network")
+
+    # Containers with a wp-cli.yml pinning the path only need --allow-root
+    # (WP-CLI does not read allow-root from config files)
+    WPCLI_CONFIG_PATH = "/var/www/wp-cli.yml"
+    _CONFIGURED_SUFFIX = "--allow-root"
+    _CONFIGURED_ARGS = ["--allow-root"]
+
     def __init__(self, ssh_manager):
         """
         Initialize WordPress manager
@@ -16,7 +84,158 @@ class WordPressManager:
             ssh_manager: SSHManager instance for remote operations
         """
         self.ssh = ssh_manager
+        self._perm_mgr = PermissionsManager(ssh_manager)
+        self._owns_connection = False
+        self._wpcli_configured: Set[str] = set()
+        self._wpcli_installed = False
+        self._wp_version_cache: Dict[str, str] = {}
+
+    def __enter__(self):
+        """Context manager entry - pins one SSH session for the whole batch"""
+        if not self.ssh.client:
+            self.ssh.connect()
+            self._owns_connection = True
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - releases the session if this manager opened it"""
+        if self._owns_connection:
+            self.ssh.disconnect()
+            self._owns_connection = False
+
+    def _run_in_container(
+        self,
+        container_name: str,
+        argv: List[str],
+        timeout: int = 30,
+        tail_bytes: Optional[int] = None
+    ) -> Tuple[int, str, str]:
+        """
+        Run a command inside a container with one docker exec
+
+        Args:
+            container_name: Container name
+            argv: Command and arguments to run inside the container
+            timeout: Command timeout in seconds
+            tail_bytes: Only keep this many trailing bytes of output
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        return self.ssh.run_argv(["docker", "exec", container_name, *argv], timeout=timeout, tail_bytes=tail_bytes)
+
+    def configure_wpcli(
+        self,
+        container_name: str,
+        wp_type: str = "frankenwp",
+        domain: Optional[str] = None
+    ) -> bool:
+        """
+        Pin the WordPress path for WP-CLI in a container-wide wp-cli.yml
+
+        WP-CLI looks for wp-cli.yml in the working directory and its parents,
+        so /var/www/wp-cli.yml covers both /var/www/html and /var/www/vhosts.
+        The file is only trusted once a path-less 'wp core version' succeeds
+        in the same round-trip; afterwards commands for this container omit
+        --path.
+
+        Args:
+            container_name: WordPress container name
+            wp_type: WordPress type (frankenwp or ols)
+            domain: Domain name (required for ols)
+
+        Returns:
+            True if the container is configured
+        """
+        if container_name in self._wpcli_configured:
+            return True
+
+        if wp_type in ("frankenwp", "wordpress"):
+            wp_path = "/var/www/html"
+        else:
+            wp_path = f"/var/www/vhosts/{domain}" if domain else "/var/www/vhosts"
+        commands = [
+            f"printf 'path: %s\\n' {shlex.quote(wp_path)} > {self.WPCLI_CONFIG_PATH}",
+            f"wp core version {self._CONFIGURED_SUFFIX}"
+        ]
+
+        try:
+            exit_code, _, _ = self._run_batched(commands, timeout=30, container_name=container_name)
+        except Exception:
+            return False
+
+        if exit_code == 0:
+            self._wpcli_configured.add(container_name)
+        return exit_code == 0
+
+    def _suffix(
+        self,
+        wp_type: str,
+        domain: Optional[str] = None,
+        container_name: Optional[str] = None
+    ) -> str:
+        """
+        Get the common WP-CLI flag suffix for a site
 
+        Args:
+            wp_type: WordPress type (frankenwp or ols)
+            domain: Domain name (OLS sites live under /var/www/vhosts/<domain>)
+            container_name: Container name (configured containers skip --path)
+
+        Returns:
+            "--path=<wp_path> --allow-root" string
+        """
+        if container_name in self._wpcli_configured:
+            return self._CONFIGURED_SUFFIX
+        if domain and wp_type not in ("frankenwp", "wordpress"):
+            return f"--path=/var/www/vhosts/{domain} --allow-root"
+        return self._PATH_SUFFIX.get(wp_type, self._PATH_SUFFIX["ols"])
+
+    def _path_args(self, wp_type: str, container_name: Optional[str] = None) -> List[str]:
+        """
+        Get the common WP-CLI flags for a site as argv tokens
+
+        Args:
+            wp_type: WordPress type (frankenwp or ols)
+            container_name: Container name (configured containers skip --path)
+
+        Returns:
+            ["--path=<wp_path>", "--allow-root"]
+        """
+        if container_name in self._wpcli_configured:
+            return self._CONFIGURED_ARGS
+        return self._PATH_ARGS.get(wp_type, self._PATH_ARGS["ols"])
+
+    def _run_batched(
+        self,
+        commands: List[str],
+        timeout: int = 30,
+        container_name: Optional[str] = None
+    ) -> Tuple[int, List[str], str]:
+        """
+        Run several commands in a single SSH round-trip
+
+        Commands are chained with && so execution stops at the first failure.
+        A separator is echoed between steps so each step's stdout can be
+        inspected individually.
+
+        Args:
+            commands: Shell commands to run in order
+            timeout: Command timeout in seconds
+            container_name: Run the chain inside this container (one docker exec)
+
+        Returns:
+            Tuple of (exit_code, per-command stdout list, stderr)
+        """
+        script = f" && echo {BATCH_SEPARATOR} && ".join(commands)
+        if container_name:
+            script = f"docker exec {shlex.quote(container_name)} sh -c {shlex.quote(script)}"
+
+        exit_code, stdout, stderr = self.ssh.run_command(script, timeout=timeout)
+        outputs = [chunk.strip() for chunk in stdout.split(BATCH_SEPARATOR)]
+        return exit_code, outputs, stderr
+
+    @_wrap_errors("Failed to install WP-CLI")
     def install_wpcli(self) -> bool:
         """
         Install WP-CLI on VPS if not already installed
@@ -24,31 +243,46 @@ class WordPressManager:
         Returns:
             True if installation successful or already installed
         """
-        try:
-            # Check if WP-CLI is already installed
-            exit_code, stdout, stderr = self.ssh.run_command("which wp")
-            if exit_code == 0:
-                return True
+        if self._wpcli_installed:
+            return True
 
-            # Install WP-CLI
-            commands = [
-                "curl -O https://raw.githubusercontent.com/wp-cli/builds/gh-pages/phar/wp-cli.phar",
-                "chmod +x wp-cli.phar",
-                "sudo mv wp-cli.phar /usr/local/bin/wp"
-            ]
+        # Check if WP-CLI is already installed
+        exit_code, stdout, stderr = self.ssh.run_command("which wp")
+        if exit_code == 0:
+            self._wpcli_installed = True
+            return True
 
-            for cmd in commands:
-                exit_code, stdout, stderr = self.ssh.run_command(cmd, timeout=60)
-                if exit_code != 0:
-                    raise RuntimeError(f"WP-CLI installation failed: {stderr}")
+        # Download, verify checksum and install WP-CLI (single round-trip)
+        commands = [
+            f"curl -fsSL --compressed -o /tmp/wp-cli.phar {WPCLI_PHAR_URL}",
+            f"curl -fsSL -o /tmp/wp-cli.phar.sha512 {WPCLI_SHA512_URL}",
+            "printf '%s  /tmp/wp-cli.phar\\n' \"$(cut -d' ' -f1 /tmp/wp-cli.phar.sha512)\" | sha512sum -c -",
+            "sudo install -m 0755 /tmp/wp-cli.phar /usr/local/bin/wp",
+            "rm -f /tmp/wp-cli.phar /tmp/wp-cli.phar.sha512"
+        ]
 
-            # Verify installation
-            exit_code, stdout, stderr = self.ssh.run_command("wp --info")
-            return exit_code == 0
+        exit_code, _, stderr = self._run_batched(commands, timeout=60)
+        if exit_code != 0:
+            raise RuntimeError(f"WP-CLI installation failed: {stderr}")
+
+        # Checksum and install -m 0755 succeeded, so the binary is in place
+        self._wpcli_installed = True
+        return True
+
+    def verify_wpcli(self) -> bool:
+        """
+        Check that WP-CLI runs on VPS
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to install WP-CLI: {e}")
+        Returns:
+            True if 'wp --info' succeeds
+        """
+        try:
+            exit_code, _, _ = self.ssh.run_command("wp --info")
+            return exit_code == 0
+        except Exception:
+            return False
 
+    @_wrap_errors("Failed to install WordPress")
     def core_install(
         self,
         container_name: str,
@@ -66,93 +300,80 @@ class WordPressManager:
         Returns:
             True if installation successful
         """
-        try:
-            # Determine WordPress path based on type
-            wp_path = "/var/www/html" if wp_type in ["frankenwp", "wordpress"] else f"/var/www/vhosts/{site_config['domain']}"
-
-            # Escape all user inputs to prevent command injection
-            safe_title = shlex.quote(site_config.get('site_title', site_config['domain']))
-            safe_user = shlex.quote(site_config['wp_admin_user'])
-            safe_password = shlex.quote(site_config['wp_admin_password'])
-            safe_email = shlex.quote(site_config['wp_admin_email'])
-            safe_url = shlex.quote(f"https://{site_config['domain']}")
-
-            # Build WP-CLI command with escaped parameters
-            # Build WP-CLI command with escaped parameters
-            # 1. Create wp-config.php
-            safe_db_name = shlex.quote(site_config['db_name'])
-            safe_db_user = shlex.quote(site_config['db_user'])
-            safe_db_pass = shlex.quote(site_config['db_password'])
-            safe_db_host = shlex.quote(site_config['db_host'])
-
-            # Use PHP flags for memory limit
-            php_flags = "php -d memory_limit=512M /usr/local/bin/wp"
-
-            # Wait for database container to be healthy (depends_on healthcheck should handle this)
-            # But add extra wait for MariaDB user initialization (separate from container health)
-            import time
-            time.sleep(20)  # Give MariaDB extra time to initialize users after becoming "healthy"
-
-            # Create wp-config.php using PHP (more robust than sed for special chars in password)
-            # Base64-encode password to avoid shell/quote escaping issues
-            db_pass_b64 = base64.b64encode(site_config['db_password'].encode()).decode()
-            cmd_config = f"""docker exec -u root {container_name} php -r "
-                \\$config = file_get_contents('{wp_path}/wp-config-sample.php');
-                \\$config = str_replace('database_name_here', '{site_config["db_name"]}', \\$config);
-                \\$config = str_replace('username_here', '{site_config["db_user"]}', \\$config);
-                \\$config = str_replace('password_here', base64_decode('{db_pass_b64}'), \\$config);
-                \\$config = str_replace('localhost', '{site_config["db_host"]}', \\$config);
-                file_put_contents('{wp_path}/wp-config.php', \\$config);
-            " """
-
-            exit_code, stdout, stderr = self.ssh.run_command(cmd_config, timeout=60)
-            if exit_code != 0:
-                raise RuntimeError(f"Failed to create wp-config.php: {stderr}")
-
-            # 1.5 Add SSL proxy detection for reverse proxy setups (Caddy/nginx)
-            # This ensures WordPress trusts HTTPS from the reverse proxy
-            ssl_fix_cmd = f'''docker exec -u root {container_name} php -r "
-                \\$f = '{wp_path}/wp-config.php';
-                \\$c = file_get_contents(\\$f);
-                \\$ssl = \\"\\n// Force HTTPS behind reverse proxy\\nif (isset(\\\\\\$_SERVER['HTTP_X_FORWARDED_PROTO']) && \\\\\\$_SERVER['HTTP_X_FORWARDED_PROTO'] === 'https') {{\\n    \\\\\\$_SERVER['HTTPS'] = 'on';\\n}}\\n\\";
-                \\$c = str_replace('<?php', '<?php' . \\$ssl, \\$c);
-                file_put_contents(\\$f, \\$c);
-            "'''
-            self.ssh.run_command(ssl_fix_cmd, timeout=30)
-
-            # 2. Install WordPress (as root)
-            cmd = f"""docker exec -u root {container_name} {php_flags} core install \\
-                --path={wp_path} \\
-                --url={safe_url} \\
-                --title={safe_title} \\
-                --admin_user={safe_user} \\
-                --admin_password={safe_password} \\
-                --admin_email={safe_email} \\
-                --skip-email --allow-root"""
-
-            exit_code, stdout, stderr = self.ssh.run_command(cmd, timeout=120)
-
-            if exit_code != 0:
-                # Check if already installed
-                if "already installed" in stderr.lower() or "already installed" in stdout.lower():
-                    # Set permissions even if already installed
-                    from cli.utils.permissions import PermissionsManager
-                    perm_mgr = PermissionsManager(self.ssh)
-                    perm_mgr.set_wordpress_permissions(site_config['name'], wp_type, domain=site_config.get('domain'))
-                    return True
-                raise RuntimeError(f"WordPress installation failed: {stderr}")
-
-            # Set correct permissions after installation (systematic)
-            from cli.utils.permissions import PermissionsManager
-            perm_mgr = PermissionsManager(self.ssh)
-            if not perm_mgr.set_wordpress_permissions(site_config['name'], wp_type, domain=site_config.get('domain')):
-                raise RuntimeError("Failed to set WordPress permissions")
+        # Determine WordPress path based on type
+        wp_path = "/var/www/html" if wp_type in ["frankenwp", "wordpress"] else f"/var/www/vhosts/{site_config['domain']}"
+
+        # 1. Create wp-config.php
+        # Wait for database container to be healthy (depends_on healthcheck should handle this)
+        # But add extra wait for MariaDB user initialization (separate from container health)
+        time.sleep(20)  # Give MariaDB extra time to initialize users after becoming "healthy"
+
+        # Create wp-config.php using PHP (more robust than sed for special chars in password)
+        # Base64-encode password to avoid shell/quote escaping issues
+        db_pass_b64 = base64.b64encode(site_config['db_password'].encode()).decode()
+        config_php = " ".join([
+            f"$config = file_get_contents('{wp_path}/wp-config-sample.php');",
+            f"$config = str_replace('database_name_here', '{site_config['db_name']}', $config);",
+            f"$config = str_replace('username_here', '{site_config['db_user']}', $config);",
+            f"$config = str_replace('password_here', base64_decode('{db_pass_b64}'), $config);",
+            f"$config = str_replace('localhost', '{site_config['db_host']}', $config);",
+            f"file_put_contents('{wp_path}/wp-config.php', $config);",
+        ])
+
+        exit_code, stdout, stderr = self.ssh.run_argv(
+            ["docker", "exec", "-u", "root", container_name, "php", "-r", config_php],
+            timeout=60
+        )
+        if exit_code != 0:
+            raise RuntimeError(f"Failed to create wp-config.php: {stderr}")
+
+        # 1.5 Add SSL proxy detection for reverse proxy setups (Caddy/nginx)
+        # This ensures WordPress trusts HTTPS from the reverse proxy
+        ssl_fix_php = " ".join([
+            f"$f = '{wp_path}/wp-config.php';",
+            "$c = file_get_contents($f);",
+            "$ssl = \"\\n// Force HTTPS behind reverse proxy\\n"
+            "if (isset(\\$_SERVER['HTTP_X_FORWARDED_PROTO']) && \\$_SERVER['HTTP_X_FORWARDED_PROTO'] === 'https') "
+            "{\\n    \\$_SERVER['HTTPS'] = 'on';\\n}\\n\";",
+            "$c = str_replace('<?php', '<?php' . $ssl, $c);",
+            "file_put_contents($f, $c);",
+        ])
+        self.ssh.run_argv(
+            ["docker", "exec", "-u", "root", container_name, "php", "-r", ssl_fix_php],
+            timeout=30
+        )
+
+        # 2. Install WordPress (as root, with PHP memory limit raised)
+        # User inputs are quoted once by run_argv to prevent command injection
+        argv = [
+            "docker", "exec", "-u", "root", container_name,
+            "php", "-d", "memory_limit=512M", "/usr/local/bin/wp", "core", "install",
+            f"--path={wp_path}",
+            f"--url=https://{site_config['domain']}",
+            f"--title={site_config.get('site_title', site_config['domain'])}",
+            f"--admin_user={site_config['wp_admin_user']}",
+            f"--admin_password={site_config['wp_admin_password']}",
+            f"--admin_email={site_config['wp_admin_email']}",
+            "--skip-email", "--allow-root"
+        ]
+
+        exit_code, stdout, stderr = self.ssh.run_argv(argv, timeout=120, tail_bytes=OUTPUT_TAIL_BYTES)
+
+        if exit_code != 0:
+            # Check if already installed
+            if ALREADY_INSTALLED_RE.search(stderr) or ALREADY_INSTALLED_RE.search(stdout):
+                # Set permissions even if already installed
+                self._perm_mgr.set_wordpress_permissions(site_config['name'], wp_type, domain=site_config.get('domain'))
+                return True
+            raise RuntimeError(f"WordPress installation failed: {stderr}")
 
-            return True
+        # Set correct permissions after installation (systematic)
+        if not self._perm_mgr.set_wordpress_permissions(site_config['name'], wp_type, domain=site_config.get('domain')):
+            raise RuntimeError("Failed to set WordPress permissions")
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to install WordPress: {e}")
+        return True
 
+    @_wrap_errors("Failed to update site URL")
     def update_site_url(
         self,
         container_name: str,
@@ -172,37 +393,33 @@ class WordPressManager:
         Returns:
             True if update successful
         """
-        try:
-            # Determine WordPress path based on type
-            if wp_type in ["frankenwp", "wordpress"]:
-                wp_path = "/var/www/html"
-            else:  # ols
-                if not domain:
-                    raise ValueError("Domain is required for OLS WordPress type")
-                wp_path = f"/var/www/vhosts/{domain}"
-
-            safe_url = shlex.quote(url)
-            commands = [
-                f"docker exec {container_name} wp option update siteurl {safe_url} --path={wp_path} --allow-root",
-                f"docker exec {container_name} wp option update home {safe_url} --path={wp_path} --allow-root"
-            ]
-
-            for cmd in commands:
-                exit_code, stdout, stderr = self.ssh.run_command(cmd, timeout=30)
-                if exit_code != 0:
-                    raise RuntimeError(f"URL update failed: {stderr}")
-
-            return True
-
-        except Exception as e:
-            raise RuntimeError(f"Failed to update site URL: {e}")
-
+        if wp_type not in ["frankenwp", "wordpress"] and not domain:
+            raise ValueError("Domain is required for OLS WordPress type")
+
+        suffix = self._suffix(wp_type, domain, container_name)
+        safe_url = shlex.quote(url)
+        commands = [
+            f"wp option update siteurl {safe_url} {suffix}",
+            f"wp option update home {safe_url} {suffix}"
+        ]
+
+        # Both options are set within one docker exec
+        exit_code, _, stderr = self._run_batched(
+            commands, timeout=30, container_name=container_name
+        )
+        if exit_code != 0:
+            raise RuntimeError(f"URL update failed: {stderr}")
+
+        return True
+
+    @_wrap_errors("Failed to install plugin")
     def plugin_install(
         self,
         container_name: str,
         plugin_slug: str,
         activate: bool = True,
-        wp_type: str = "frankenwp"
+        wp_type: str = "frankenwp",
+        known_installed: Optional[Set[str]] = None
     ) -> bool:
         """
         Install WordPress plugin
@@ -212,27 +429,167 @@ class WordPressManager:
             plugin_slug: Plugin slug
             activate: Activate after installation
             wp_type: WordPress type (frankenwp or ols)
+            known_installed: Slugs already in the desired state (see
+                list_installed_plugins); these are skipped without a remote call
 
         Returns:
             True if installation successful
         """
+        if known_installed is not None and plugin_slug in known_installed:
+            return True
+
+        argv = [*self._WP_PLUGIN_INSTALL, plugin_slug, *self._path_args(wp_type, container_name)]
+        if activate:
+            argv.append("--activate")
+
+        exit_code, stdout, stderr = self._run_in_container(
+            container_name, argv, timeout=120, tail_bytes=OUTPUT_TAIL_BYTES
+        )
+
+        if exit_code != 0 and not ALREADY_INSTALLED_RE.search(stderr):
+            raise RuntimeError(f"Plugin installation failed: {stderr}")
+
+        return True
+
+    def plugin_install_many(
+        self,
+        container_name: str,
+        plugin_slugs: List[str],
+        activate: bool = True,
+        wp_type: str = "frankenwp",
+        max_workers: int = 4
+    ) -> Dict[str, bool]:
+        """
+        Install several WordPress plugins concurrently
+
+        Plugins already installed are filtered out with a single list call
+        first. Remaining installs each run on their own channel of the shared
+        SSH transport, so plugin downloads inside the container overlap
+        instead of queueing. Activation rewrites the active_plugins option,
+        so concurrent 'install --activate' calls would overwrite each other;
+        every plugin that needs it is activated with one call after all
+        installs finish instead.
+
+        Args:
+            container_name: WordPress container name
+            plugin_slugs: Plugin slugs to install
+            activate: Activate after installation
+            wp_type: WordPress type (frankenwp or ols)
+            max_workers: Maximum concurrent installs
+
+        Returns:
+            Dictionary mapping plugin slug to installation success
+        """
+        statuses = self._plugin_statuses(container_name, wp_type)
+        installed = set(statuses)
+
+        results = self._run_concurrently(
+            lambda slug: self.plugin_install(container_name, slug, False, wp_type, installed),
+            plugin_slugs,
+            max_workers
+        )
+
+        if activate:
+            pending = [
+                slug for slug in results
+                if results[slug] and statuses.get(slug) not in self._ACTIVE_STATUSES
+            ]
+            if pending and not self._plugin_activate(container_name, pending, wp_type):
+                results.update(dict.fromkeys(pending, False))
+
+        return results
+
+    def _plugin_activate(self, container_name: str, plugin_slugs: List[str], wp_type: str) -> bool:
+        """
+        Activate several installed plugins with one WP-CLI call
+
+        Args:
+            container_name: WordPress container name
+            plugin_slugs: Plugin slugs to activate
+            wp_type: WordPress type (frankenwp or ols)
+
+        Returns:
+            True if every plugin was activated
+        """
+        argv = [*self._WP_PLUGIN_ACTIVATE, *plugin_slugs, *self._path_args(wp_type, container_name)]
+
+        try:
+            exit_code, _, _ = self._run_in_container(container_name, argv, timeout=120)
+        except Exception:
+            return False
+        return exit_code == 0
+
+    def _plugin_statuses(self, container_name: str, wp_type: str = "frankenwp") -> Dict[str, str]:
+        """
+        Get the status of every installed WordPress plugin
+
+        Args:
+            container_name: WordPress container name
+            wp_type: WordPress type (frankenwp or ols)
+
+        Returns:
+            Dictionary mapping plugin slug to status (empty if listing failed)
+        """
+        argv = [*self._WP_PLUGIN_LIST, *self._path_args(wp_type, container_name)]
+
         try:
-            wp_path = "/var/www/html" if wp_type in ["frankenwp", "wordpress"] else "/var/www/vhosts"
-            safe_plugin = shlex.quote(plugin_slug)
+            exit_code, stdout, stderr = self._run_in_container(container_name, argv, timeout=60)
+            if exit_code != 0:
+                return {}
+            plugins = json.loads(stdout)
+        except Exception:
+            return {}
 
-            cmd = f"docker exec {container_name} wp plugin install {safe_plugin} --path={wp_path} --allow-root"
-            if activate:
-                cmd += " --activate"
+        return {plugin['name']: plugin.get('status') for plugin in plugins}
 
-            exit_code, stdout, stderr = self.ssh.run_command(cmd, timeout=120)
+    def list_installed_plugins(
+        self,
+        container_name: str,
+        wp_type: str = "frankenwp",
+        active_only: bool = False
+    ) -> Set[str]:
+        """
+        Get slugs of installed WordPress plugins
 
-            if exit_code != 0 and "already installed" not in stderr.lower():
-                raise RuntimeError(f"Plugin installation failed: {stderr}")
+        Args:
+            container_name: WordPress container name
+            wp_type: WordPress type (frankenwp or ols)
+            active_only: Only return active plugins
 
-            return True
+        Returns:
+            Set of plugin slugs (empty if listing failed)
+        """
+        return {
+            name for name, status in self._plugin_statuses(container_name, wp_type).items()
+            if not active_only or status in self._ACTIVE_STATUSES
+        }
+
+    @staticmethod
+    def _run_concurrently(func, keys: List[str], max_workers: int) -> Dict[str, bool]:
+        """
+        Run func for every key on a bounded thread pool
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to install plugin: {e}")
+        Args:
+            func: Callable taking a key and returning a bool
+            keys: Keys to process
+            max_workers: Maximum concurrent workers
+
+        Returns:
+            Dictionary mapping key to result (False if func raised)
+        """
+        if not keys:
+            return {}
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(keys)))) as executor:
+            futures = {key: executor.submit(func, key) for key in keys}
+            for key, future in futures.items():
+                try:
+                    results[key] = bool(future.result())
+                except Exception:
+                    results[key] = False
+
+        return results
 
     def get_wp_version(
         self,
@@ -249,22 +606,40 @@ class WordPressManager:
         Returns:
             WordPress version string or None if error
         """
-        try:
-            wp_path = "/var/www/html" if wp_type in ["frankenwp", "wordpress"] else "/var/www/vhosts"
+        cached = self._wp_version_cache.get(container_name)
+        if cached:
+            return cached
 
-            exit_code, stdout, stderr = self.ssh.run_command(
-                f"docker exec {container_name} wp core version --path={wp_path} --allow-root",
+        try:
+            exit_code, stdout, stderr = self._run_in_container(
+                container_name,
+                [*self._WP_CORE_VERSION, *self._path_args(wp_type, container_name)],
                 timeout=30
             )
 
             if exit_code == 0:
-                return stdout.strip()
+                version = stdout.strip()
+                self._wp_version_cache[container_name] = version
+                return version
 
         except Exception:
             pass
 
         return None
 
+    def invalidate_cache(self, container_name: Optional[str] = None) -> None:
+        """
+        Drop cached WP-CLI / version lookups
+
+        Args:
+            container_name: Only forget this container's version (default: everything)
+        """
+        if container_name is None:
+            self._wpcli_installed = False
+            self._wp_version_cache.clear()
+        else:
+            self._wp_version_cache.pop(container_name, None)
+
     def create_user(
         self,
         container_name: str,
@@ -287,23 +662,16 @@ class WordPressManager:
             Generated password or None if error
         """
         try:
-            from cli.utils.credentials import CredentialGenerator
-
             password = CredentialGenerator.generate_password(16, False)
-            wp_path = "/var/www/html" if wp_type in ["frankenwp", "wordpress"] else "/var/www/vhosts"
-
-            safe_username = shlex.quote(username)
-            safe_email = shlex.quote(email)
-            safe_password = shlex.quote(password)
-            safe_role = shlex.quote(role)
 
-            cmd = f"""docker exec {container_name} wp user create {safe_username} {safe_email} \\
-                --role={safe_role} \\
-                --user_pass={safe_password} \\
-                --path={wp_path} \\
-                --allow-root"""
+            argv = [
+                *self._WP_USER_CREATE, username, email,
+                f"--role={role}",
+                f"--user_pass={password}",
+                *self._path_args(wp_type, container_name)
+            ]
 
-            exit_code, stdout, stderr = self.ssh.run_command(cmd, timeout=60)
+            exit_code, stdout, stderr = self._run_in_container(container_name, argv, timeout=60)
 
             if exit_code == 0:
                 return password
@@ -333,14 +701,9 @@ class WordPressManager:
             True if update successful
         """
         try:
-            wp_path = "/var/www/html" if wp_type in ["frankenwp", "wordpress"] else "/var/www/vhosts"
-
-            safe_option_name = shlex.quote(option_name)
-            safe_option_value = shlex.quote(option_value)
-
-            cmd = f"docker exec {container_name} wp option update {safe_option_name} {safe_option_value} --path={wp_path} --allow-root"
+            argv = [*self._WP_OPTION_UPDATE, option_name, option_value, *self._path_args(wp_type, container_name)]
 
-            exit_code, stdout, stderr = self.ssh.run_command(cmd, timeout=30)
+            exit_code, stdout, stderr = self._run_in_container(container_name, argv, timeout=30)
             return exit_code == 0
 
         except Exception:
@@ -1,58 +1,246 @@
 """WordPress-specific security auditing"""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
+from pathlib import Path
+import hashlib
 import re
 import shlex
+import time
+
+from cli.utils import jsonio
+from cli.utils.slots import SlottedDataclass
+
+SECURITY_KEYS = (
+    'AUTH_KEY', 'SECURE_AUTH_KEY', 'LOGGED_IN_KEY', 'NONCE_KEY',
+    'AUTH_SALT', 'SECURE_AUTH_SALT', 'LOGGED_IN_SALT', 'NONCE_SALT'
+)
+
+# Key values WordPress itself treats as unset (see wp_salt())
+DEFAULT_KEY_VALUES = ('', 'put your unique phrase here')
+
+_WP_DEBUG_RE = re.compile(r"define\s*\(\s*['\"]WP_DEBUG['\"]\s*,\s*true", re.IGNORECASE)
+_KEYS_RE = re.compile(r"define\s*\(\s*['\"](" + "|".join(SECURITY_KEYS) + r")['\"]")
+# Any security key defined with a default value, found in one scan
+_DEFAULT_KEY_RE = re.compile(
+    r"define\s*\(\s*['\"](?:" + "|".join(SECURITY_KEYS) + r")['\"]\s*,\s*(['\"])(?:"
+    + "|".join(re.escape(value) for value in DEFAULT_KEY_VALUES if value) + r")?\1\s*\)",
+    re.IGNORECASE
+)
+_DISALLOW_FILE_EDIT_RE = re.compile(
+    r"define\s*\(\s*['\"]DISALLOW_FILE_EDIT['\"]\s*,\s*true", re.IGNORECASE
+)
+
+# Only wp-config lines that _audit_wp_config looks at are fetched
+_CONFIG_GREP_PATTERN = "|".join(
+    ('WP_DEBUG', 'DISALLOW_FILE_EDIT', 'put your unique phrase here') + SECURITY_KEYS
+)
+
+# Sites share one SSH transport; each probe opens its own channel, so keep
+# concurrency under sshd's default MaxSessions (10)
+MAX_AUDIT_WORKERS = 8
+
+# Cached findings are reused only while the site is unchanged and at most
+# this old, so newly published core/plugin updates are still picked up
+AUDIT_CACHE_TTL = 24 * 3600
+
+# Reads $table_prefix from wp-config.php for the database state probe
+_TABLE_PREFIX_SED = r"""s/^[[:space:]]*\$table_prefix[[:space:]]*=[[:space:]]*['"]\([A-Za-z0-9_]*\)['"].*/\1/p"""
+
+# Database state the findings depend on: user logins with their roles, and
+# the active plugin list (${p} is the table prefix, expanded by the shell)
+_DB_STATE_SQL = (
+    "SELECT u.user_login, m.meta_value FROM ${p}users u "
+    "LEFT JOIN ${p}usermeta m ON m.user_id = u.ID AND m.meta_key = '${p}capabilities' "
+    "ORDER BY u.ID; "
+    "SELECT option_value FROM ${p}options WHERE option_name = 'active_plugins'"
+)
+
+
+def _parse_json_list(output: str) -> List[Dict]:
+    """
+    Parse wp-cli '--format=json' list output
+
+    Args:
+        output: Raw command output
+
+    Returns:
+        List of item dictionaries (empty if output is not a JSON list)
+    """
+    try:
+        items = jsonio.loads(output)
+    except ValueError:
+        return []
+    return [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
+
+
+def _finding(
+    finding_id: str,
+    severity: str,
+    title: str,
+    description: str,
+    impact: str,
+    remediation: str
+) -> Dict:
+    """
+    Build a finding dictionary
+
+    Args:
+        finding_id: Unique finding ID
+        severity: critical, high, medium or low
+        title: Short title
+        description: What was found
+        impact: Why it matters
+        remediation: How to fix it
+
+    Returns:
+        Finding dictionary
+    """
+    return {
+        'id': finding_id,
+        'severity': severity,
+        'title': title,
+        'description': description,
+        'impact': impact,
+        'remediation': remediation,
+        'auto_fix': None
+    }
+
+
+@dataclass(frozen=True)
+class SiteContext(SlottedDataclass):
+    """Container name and paths for one site, computed once per audit"""
+    __slots__ = ('site', 'container', 'wp_path', 'site_path', 'config_path', 'uploads_path')
+
+    site: str
+    container: str
+    wp_path: str
+    site_path: str
+    config_path: str
+    uploads_path: str
+
+    @classmethod
+    def for_site(cls, site_name: str, domain: str, wp_type: str) -> 'SiteContext':
+        """
+        Build the context for a configured site
+
+        Args:
+            site_name: Site name
+            domain: Site domain
+            wp_type: WordPress type (frankenwp or ols)
+
+        Returns:
+            SiteContext instance
+        """
+        if wp_type in ["frankenwp", "wordpress"]:
+            wp_path = site_path = "/var/www/html"
+        else:
+            wp_path = "/var/www/vhosts"
+            site_path = f"/var/www/vhosts/{domain}"
+
+        return cls(
+            site=site_name,
+            container=f"{site_name}-wp",
+            wp_path=wp_path,
+            site_path=site_path,
+            config_path=f"{site_path}/wp-config.php",
+            uploads_path=f"{site_path}/wp-content/uploads"
+        )
 
 
 class WordPressAuditor:
     """WordPress security auditor for all sites on VPS"""
 
-    def __init__(self, ssh_manager, config_manager):
+    def __init__(self, ssh_manager, config_manager, cache_dir: Optional[Path] = None):
         """
         Initialize WordPress auditor
 
         Args:
             ssh_manager: SSHManager instance
             config_manager: ConfigManager instance
+            cache_dir: Directory for per-site result cache (None disables caching)
         """
         self.ssh = ssh_manager
         self.config = config_manager
+        self.cache_dir = Path(cache_dir) if cache_dir else None
 
-    def audit_all_sites(self) -> Dict:
+    def audit_all_sites(self, max_workers: int = MAX_AUDIT_WORKERS) -> Dict:
         """
         Audit all WordPress sites
 
+        Sites are independent, so they are audited concurrently over the
+        shared SSH connection. Results keep the configured site order.
+
+        Args:
+            max_workers: Maximum sites audited at once
+
         Returns:
             Dictionary with audit results for all sites
         """
+        timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
         sites = self.config.get_sites()
 
         if not sites:
-            return {
-                'sites_audited': 0,
-                'findings': [],
-                'sites': {},
-                'timestamp': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-            }
+            return self._merge_site_results([], [], timestamp)
+
+        running = self._running_containers()
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sites)))) as executor:
+            futures = [
+                executor.submit(
+                    self.audit_site, site.name, site.domain, site.type,
+                    is_running=None if running is None else f"{site.name}-wp" in running
+                )
+                for site in sites
+            ]
+            site_audits = [future.result() for future in futures]
+
+        return self._merge_site_results(sites, site_audits, timestamp)
+
+    def _running_containers(self) -> Optional[Set[str]]:
+        """
+        List running container names in one call
 
-        all_findings = []
-        site_results = {}
+        Returns:
+            Set of container names, or None if docker could not be queried
+        """
+        exit_code, output, _ = self.ssh.run_command("docker ps --format '{{.Names}}'")
+
+        if exit_code != 0:
+            return None
+
+        return set(output.split())
+
+    @staticmethod
+    def _merge_site_results(sites: List, site_audits: List[Dict], timestamp: str) -> Dict:
+        """
+        Combine per-site audits into the audit_all_sites result
 
-        for site in sites:
-            site_audit = self.audit_site(site.name, site.domain, site.type)
-            site_results[site.name] = site_audit
-            all_findings.extend(site_audit['findings'])
+        Args:
+            sites: Site configs, in configured order
+            site_audits: audit_site results, in the same order
+            timestamp: Audit start timestamp
 
+        Returns:
+            Dictionary with audit results for all sites
+        """
         return {
             'sites_audited': len(sites),
-            'findings': all_findings,
-            'sites': site_results,
-            'timestamp': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+            'findings': list(chain.from_iterable(audit['findings'] for audit in site_audits)),
+            'sites': {site.name: audit for site, audit in zip(sites, site_audits)},
+            'timestamp': timestamp
         }
 
-    def audit_site(self, site_name: str, domain: str, wp_type: str) -> Dict:
+    def audit_site(
+        self,
+        site_name: str,
+        domain: str,
+        wp_type: str,
+        is_running: Optional[bool] = None
+    ) -> Dict:
         """
         Audit a single WordPress site
 
@@ -60,87 +248,214 @@ class WordPressAuditor:
             site_name: Site name
             domain: Site domain
             wp_type: WordPress type (frankenwp or ols)
+            is_running: Known container state (None probes it with docker ps)
 
         Returns:
             Dictionary with site audit results
         """
         findings = []
-        container_name = f"{site_name}-wp"
+        ctx = SiteContext.for_site(site_name, domain, wp_type)
+        container_name = ctx.container
 
-        # Check if container is running
-        exit_code, _, _ = self.ssh.run_command(
-            f"docker ps --filter name={container_name} --format '{{{{.Names}}}}'"
-        )
+        # Check if container is running ('docker ps' exits 0 even when nothing matches)
+        if is_running is None:
+            exit_code, running, _ = self.ssh.run_command(
+                f"docker ps -q --filter {shlex.quote(f'name=^{container_name}$')}"
+            )
+            is_running = exit_code == 0 and bool(running.strip())
 
-        if exit_code != 0:
+        if not is_running:
             return {
                 'site': site_name,
                 'status': 'container_not_running',
-                'findings': [{
-                    'id': f'WP-{site_name}-OFFLINE',
-                    'severity': 'high',
-                    'title': f'WordPress container offline: {site_name}',
-                    'description': f'Container {container_name} is not running',
-                    'impact': 'Site unavailable for security checks',
-                    'remediation': f'Start container: docker start {container_name}',
-                    'auto_fix': None
-                }]
+                'findings': [_finding(
+                    f'WP-{site_name}-OFFLINE',
+                    'high',
+                    f'WordPress container offline: {site_name}',
+                    f'Container {container_name} is not running',
+                    'Site unavailable for security checks',
+                    f'Start container: docker start {container_name}'
+                )]
             }
 
+        cache_key = self._site_fingerprint(ctx) if self.cache_dir else None
+        if cache_key:
+            cached = self._load_cached_result(site_name, cache_key)
+            if cached is not None:
+                return cached
+
+        # Collect every probe in one SSH round trip and one docker exec, then parse locally
+        commands = self._site_commands(ctx)
+        outputs = dict(zip(
+            commands,
+            self.ssh.run_script(list(commands.values()), container=container_name)
+        ))
+
         # Run all WordPress-specific audits
-        findings.extend(self._audit_core_version(container_name, site_name, wp_type))
-        findings.extend(self._audit_file_permissions(container_name, site_name, wp_type, domain))
-        findings.extend(self._audit_wp_config(container_name, site_name, wp_type, domain))
-        findings.extend(self._audit_plugins(container_name, site_name, wp_type))
-        findings.extend(self._audit_themes(container_name, site_name, wp_type))
-        findings.extend(self._audit_users(container_name, site_name, wp_type))
+        findings.extend(self._audit_core_version(ctx, outputs))
+        findings.extend(self._audit_file_permissions(ctx, outputs))
+        findings.extend(self._audit_wp_config(ctx, outputs))
 
-        return {
+        # wp-cli probes were skipped when the core version check failed
+        if outputs['core_version'][0] == 0:
+            findings.extend(self._audit_plugins(ctx, outputs))
+            findings.extend(self._audit_themes(ctx, outputs))
+            findings.extend(self._audit_users(ctx, outputs))
+
+        result = {
             'site': site_name,
             'domain': domain,
             'status': 'audited',
             'findings': findings
         }
 
-    def _audit_core_version(self, container: str, site: str, wp_type: str) -> List[Dict]:
+        if cache_key:
+            self._store_cached_result(site_name, cache_key, result)
+
+        return result
+
+    def _site_fingerprint(self, ctx: SiteContext) -> Optional[str]:
+        """
+        Fingerprint the site state that audit findings depend on
+
+        Combines the container image ID, the ctimes (content, permission and
+        ownership changes) of wp-config.php, wp-includes/version.php and the
+        plugins/themes/uploads directories, and the users, roles and active
+        plugins read straight from the database. The database query skips
+        loading WordPress, so one probe replaces the full wp-cli audit.
+
+        Args:
+            ctx: Site context
+
+        Returns:
+            Hex digest, or None if the state could not be read
+        """
+        paths = " ".join(
+            shlex.quote(path)
+            for path in (
+                ctx.config_path,
+                f"{ctx.site_path}/wp-includes/version.php",
+                f"{ctx.site_path}/wp-content/plugins",
+                f"{ctx.site_path}/wp-content/themes",
+                ctx.uploads_path,
+            )
+        )
+        script = (
+            f"stat -c '%n %Z' {paths} 2>/dev/null; "
+            f"p=$(sed -n {shlex.quote(_TABLE_PREFIX_SED)} {shlex.quote(ctx.config_path)}); "
+            f'wp db query "{_DB_STATE_SQL}" --skip-column-names --path={ctx.wp_path} --allow-root 2>/dev/null'
+        )
+        container = shlex.quote(ctx.container)
+        exit_code, output, _ = self.ssh.run_command(
+            f"docker inspect --format '{{{{.Image}}}}' {container} && "
+            f"docker exec {container} sh -c {shlex.quote(script)}"
+        )
+
+        if exit_code != 0 or not output.strip():
+            return None
+
+        return hashlib.blake2b(output.strip().encode('utf-8'), digest_size=16).hexdigest()
+
+    def _load_cached_result(self, site_name: str, cache_key: str) -> Optional[Dict]:
+        """
+        Load a cached site result if it matches the current fingerprint
+
+        Args:
+            site_name: Cache entry name (the site name, or e.g. "<site>.plugins")
+            cache_key: Current site fingerprint
+
+        Returns:
+            Cached result, or None on miss
+        """
+        try:
+            entry = jsonio.loads((self.cache_dir / f"{site_name}.json").read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if entry.get('key') != cache_key or time.time() - entry.get('cached_at', 0) > AUDIT_CACHE_TTL:
+            return None
+
+        return entry.get('result')
+
+    def _store_cached_result(self, site_name: str, cache_key: str, result: Dict) -> None:
+        """
+        Save a site result under its fingerprint (failures are ignored)
+
+        Args:
+            site_name: Cache entry name (the site name, or e.g. "<site>.plugins")
+            cache_key: Site fingerprint
+            result: Result to cache (site audit result or parsed plugin list)
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            payload = jsonio.dumps({'key': cache_key, 'cached_at': time.time(), 'result': result})
+            (self.cache_dir / f"{site_name}.json").write_bytes(payload)
+        except OSError:
+            pass
+
+    def _site_commands(self, ctx: SiteContext) -> Dict[str, str]:
+        """
+        Build every probe command needed to audit one site
+
+        Commands run inside the site container, so they carry no
+        'docker exec' prefix. Site-derived paths are shell-quoted.
+
+        Args:
+            ctx: Site context
+
+        Returns:
+            Ordered mapping of output name to shell command
+        """
+        wp_path = ctx.wp_path
+        config_path = shlex.quote(ctx.config_path)
+        uploads_path = shlex.quote(ctx.uploads_path)
+        # All probes share one shell; once 'wp core version' fails, later wp-cli
+        # probes are skipped instead of each bootstrapping PHP just to fail
+        wp = 'test -z "$vw_no_wpcli" && wp'
+
+        return {
+            'core_version': f"wp core version --path={wp_path} --allow-root 2>/dev/null || {{ vw_no_wpcli=1; false; }}",
+            'core_updates': f"{wp} core check-update --path={wp_path} --format=json --allow-root 2>/dev/null",
+            'config_perms': f"stat -c '%a' {config_path} 2>/dev/null",
+            'uploads_perms': f"stat -c '%a' {uploads_path} 2>/dev/null",
+            # grep exits 1 when nothing matches; fall back to the full file then
+            'config': f"grep -iE {shlex.quote(_CONFIG_GREP_PATTERN)} {config_path} 2>/dev/null || cat {config_path} 2>/dev/null",
+            'plugins': f"{wp} plugin list --path={wp_path} --fields=name,status,update --format=json --allow-root 2>/dev/null",
+            'themes': f"{wp} theme list --path={wp_path} --fields=name,status,update --format=json --allow-root 2>/dev/null",
+            'users': f"{wp} user list --path={wp_path} --fields=user_login,roles --format=json --allow-root 2>/dev/null",
+        }
+
+    def _audit_core_version(self, ctx: SiteContext, outputs: Dict) -> List[Dict]:
         """Check WordPress core version"""
         findings = []
-        wp_path = "/var/www/html" if wp_type in ["frankenwp", "wordpress"] else "/var/www/vhosts"
+        site, container, wp_path = ctx.site, ctx.container, ctx.wp_path
 
-        # Get current WP version
-        exit_code, current_version, _ = self.ssh.run_command(
-            f"docker exec {container} wp core version --path={wp_path} --allow-root 2>/dev/null"
-        )
+        exit_code, current_version, _ = outputs['core_version']
 
         if exit_code != 0:
-            findings.append({
-                'id': f'WP-{site}-CORE-001',
-                'severity': 'medium',
-                'title': f'Cannot verify WordPress version: {site}',
-                'description': 'Unable to check WordPress core version',
-                'impact': 'Cannot verify if core is up to date',
-                'remediation': 'Verify WP-CLI is working properly',
-                'auto_fix': None
-            })
+            findings.append(_finding(
+                f'WP-{site}-CORE-001',
+                'medium',
+                f'Cannot verify WordPress version: {site}',
+                'Unable to check WordPress core version',
+                'Cannot verify if core is up to date',
+                'Verify WP-CLI is working properly'
+            ))
             return findings
 
         current_version = current_version.strip()
 
-        # Check for updates
-        exit_code, update_check, _ = self.ssh.run_command(
-            f"docker exec {container} wp core check-update --path={wp_path} --format=json --allow-root 2>/dev/null"
-        )
+        exit_code, update_check, _ = outputs['core_updates']
 
         if exit_code == 0 and update_check.strip() and update_check.strip() != '[]':
-            findings.append({
-                'id': f'WP-{site}-CORE-002',
-                'severity': 'high',
-                'title': f'WordPress core outdated: {site}',
-                'description': f'WordPress {current_version} has updates available',
-                'impact': 'May contain known security vulnerabilities',
-                'remediation': f'Update WordPress: docker exec {container} wp core update --path={wp_path} --allow-root',
-                'auto_fix': None
-            })
+            findings.append(_finding(
+                f'WP-{site}-CORE-002',
+                'high',
+                f'WordPress core outdated: {site}',
+                f'WordPress {current_version} has updates available',
+                'May contain known security vulnerabilities',
+                f'Update WordPress: docker exec {container} wp core update --path={wp_path} --allow-root'
+            ))
 
         # Check if version is very outdated (rough check)
         try:
@@ -150,286 +465,241 @@ class WordPressAuditor:
 
             # If major version is less than 6 or version is 6.0-6.3, it's quite old
             if major < 6 or (major == 6 and minor < 4):
-                findings.append({
-                    'id': f'WP-{site}-CORE-003',
-                    'severity': 'critical',
-                    'title': f'WordPress version critically outdated: {site}',
-                    'description': f'WordPress {current_version} is significantly outdated',
-                    'impact': 'Multiple known security vulnerabilities likely present',
-                    'remediation': f'Urgently update WordPress: docker exec {container} wp core update --path={wp_path} --allow-root',
-                    'auto_fix': None
-                })
+                findings.append(_finding(
+                    f'WP-{site}-CORE-003',
+                    'critical',
+                    f'WordPress version critically outdated: {site}',
+                    f'WordPress {current_version} is significantly outdated',
+                    'Multiple known security vulnerabilities likely present',
+                    f'Urgently update WordPress: docker exec {container} wp core update --path={wp_path} --allow-root'
+                ))
         except (ValueError, IndexError):
             pass
 
         return findings
 
-    def _audit_file_permissions(self, container: str, site: str, wp_type: str, domain: str) -> List[Dict]:
+    def _audit_file_permissions(self, ctx: SiteContext, outputs: Dict) -> List[Dict]:
         """Audit WordPress file permissions"""
         findings = []
-
-        if wp_type in ["frankenwp", "wordpress"]:
-            wp_path = "/var/www/html"
-            config_path = f"{wp_path}/wp-config.php"
-            uploads_path = f"{wp_path}/wp-content/uploads"
-        else:
-            wp_path = f"/var/www/vhosts/{domain}"
-            config_path = f"{wp_path}/wp-config.php"
-            uploads_path = f"{wp_path}/wp-content/uploads"
+        site, container = ctx.site, ctx.container
+        config_path, uploads_path = ctx.config_path, ctx.uploads_path
 
         # Check wp-config.php permissions
-        exit_code, perms, _ = self.ssh.run_command(
-            f"docker exec {container} stat -c '%a' {config_path} 2>/dev/null"
-        )
+        exit_code, perms, _ = outputs['config_perms']
 
         if exit_code == 0:
             perms = perms.strip()
             # wp-config.php should be 600 or 640, not 644 or 666
             if perms in ['644', '666', '777']:
-                findings.append({
-                    'id': f'WP-{site}-PERM-001',
-                    'severity': 'high',
-                    'title': f'Insecure wp-config.php permissions: {site}',
-                    'description': f'wp-config.php has permissions {perms}',
-                    'impact': 'Database credentials may be readable by other users',
-                    'remediation': f'docker exec {container} chmod 600 {config_path}',
-                    'auto_fix': None
-                })
+                findings.append(_finding(
+                    f'WP-{site}-PERM-001',
+                    'high',
+                    f'Insecure wp-config.php permissions: {site}',
+                    f'wp-config.php has permissions {perms}',
+                    'Database credentials may be readable by other users',
+                    f'docker exec {container} chmod 600 {config_path}'
+                ))
 
         # Check uploads directory permissions
-        exit_code, perms, _ = self.ssh.run_command(
-            f"docker exec {container} stat -c '%a' {uploads_path} 2>/dev/null"
-        )
+        exit_code, perms, _ = outputs['uploads_perms']
 
         if exit_code == 0:
             perms = perms.strip()
             # Uploads should not be 777
             if perms == '777':
-                findings.append({
-                    'id': f'WP-{site}-PERM-002',
-                    'severity': 'medium',
-                    'title': f'Overly permissive uploads directory: {site}',
-                    'description': f'Uploads directory has permissions {perms}',
-                    'impact': 'Anyone can write files to uploads',
-                    'remediation': f'docker exec {container} chmod 755 {uploads_path}',
-                    'auto_fix': None
-                })
+                findings.append(_finding(
+                    f'WP-{site}-PERM-002',
+                    'medium',
+                    f'Overly permissive uploads directory: {site}',
+                    f'Uploads directory has permissions {perms}',
+                    'Anyone can write files to uploads',
+                    f'docker exec {container} chmod 755 {uploads_path}'
+                ))
 
         return findings
 
-    def _audit_wp_config(self, container: str, site: str, wp_type: str, domain: str) -> List[Dict]:
+    def _audit_wp_config(self, ctx: SiteContext, outputs: Dict) -> List[Dict]:
         """Audit wp-config.php security settings"""
         findings = []
+        site = ctx.site
 
-        if wp_type in ["frankenwp", "wordpress"]:
-            config_path = "/var/www/html/wp-config.php"
-        else:
-            config_path = f"/var/www/vhosts/{domain}/wp-config.php"
-
-        # Read wp-config.php
-        exit_code, config, _ = self.ssh.run_command(
-            f"docker exec {container} cat {config_path} 2>/dev/null"
-        )
+        exit_code, config, _ = outputs['config']
 
         if exit_code != 0:
-            findings.append({
-                'id': f'WP-{site}-CFG-001',
-                'severity': 'critical',
-                'title': f'Cannot read wp-config.php: {site}',
-                'description': 'wp-config.php is missing or unreadable',
-                'impact': 'Cannot verify security configuration',
-                'remediation': 'Investigate WordPress installation integrity',
-                'auto_fix': None
-            })
+            findings.append(_finding(
+                f'WP-{site}-CFG-001',
+                'critical',
+                f'Cannot read wp-config.php: {site}',
+                'wp-config.php is missing or unreadable',
+                'Cannot verify security configuration',
+                'Investigate WordPress installation integrity'
+            ))
             return findings
 
         # Check for WP_DEBUG enabled in production
-        if re.search(r"define\s*\(\s*['\"]WP_DEBUG['\"]\s*,\s*true", config, re.IGNORECASE):
-            findings.append({
-                'id': f'WP-{site}-CFG-002',
-                'severity': 'medium',
-                'title': f'Debug mode enabled: {site}',
-                'description': 'WP_DEBUG is set to true',
-                'impact': 'Sensitive information may be exposed in error messages',
-                'remediation': 'Set WP_DEBUG to false in wp-config.php',
-                'auto_fix': None
-            })
-
-        # Check for security keys
-        security_keys = [
-            'AUTH_KEY', 'SECURE_AUTH_KEY', 'LOGGED_IN_KEY', 'NONCE_KEY',
-            'AUTH_SALT', 'SECURE_AUTH_SALT', 'LOGGED_IN_SALT', 'NONCE_SALT'
-        ]
-
-        for key in security_keys:
-            # Check if key is defined and not using default value
-            if key not in config:
-                findings.append({
-                    'id': f'WP-{site}-CFG-KEY-{key}',
-                    'severity': 'high',
-                    'title': f'Missing security key: {key} in {site}',
-                    'description': f'Security key {key} is not defined',
-                    'impact': 'Weakened authentication security',
-                    'remediation': 'Add security keys from https://api.wordpress.org/secret-key/1.1/salt/',
-                    'auto_fix': None
-                })
-            elif 'put your unique phrase here' in config.lower():
-                findings.append({
-                    'id': f'WP-{site}-CFG-003',
-                    'severity': 'critical',
-                    'title': f'Default security keys in use: {site}',
-                    'description': 'WordPress security keys are using default values',
-                    'impact': 'Authentication can be easily compromised',
-                    'remediation': 'Replace with unique keys from https://api.wordpress.org/secret-key/1.1/salt/',
-                    'auto_fix': None
-                })
-                break  # Only report once
+        if _WP_DEBUG_RE.search(config):
+            findings.append(_finding(
+                f'WP-{site}-CFG-002',
+                'medium',
+                f'Debug mode enabled: {site}',
+                'WP_DEBUG is set to true',
+                'Sensitive information may be exposed in error messages',
+                'Set WP_DEBUG to false in wp-config.php'
+            ))
+
+        # Check for security keys, collecting every defined key in one pass
+        defined_keys = set(_KEYS_RE.findall(config))
+
+        for key in SECURITY_KEYS:
+            if key not in defined_keys:
+                findings.append(_finding(
+                    f'WP-{site}-CFG-KEY-{key}',
+                    'high',
+                    f'Missing security key: {key} in {site}',
+                    f'Security key {key} is not defined',
+                    'Weakened authentication security',
+                    'Add security keys from https://api.wordpress.org/secret-key/1.1/salt/'
+                ))
+
+        # Check defined keys are not using the sample value
+        if defined_keys and _DEFAULT_KEY_RE.search(config):
+            findings.append(_finding(
+                f'WP-{site}-CFG-003',
+                'critical',
+                f'Default security keys in use: {site}',
+                'WordPress security keys are using default values',
+                'Authentication can be easily compromised',
+                'Replace with unique keys from https://api.wordpress.org/secret-key/1.1/salt/'
+            ))
 
         # Check for DISALLOW_FILE_EDIT
-        if 'DISALLOW_FILE_EDIT' not in config or 'DISALLOW_FILE_EDIT\' , false' in config.lower():
-            findings.append({
-                'id': f'WP-{site}-CFG-004',
-                'severity': 'medium',
-                'title': f'File editing not disabled: {site}',
-                'description': 'DISALLOW_FILE_EDIT is not set to true',
-                'impact': 'Compromised admin accounts can edit theme/plugin files',
-                'remediation': "Add to wp-config.php: define('DISALLOW_FILE_EDIT', true);",
-                'auto_fix': None
-            })
+        if not _DISALLOW_FILE_EDIT_RE.search(config):
+            findings.append(_finding(
+                f'WP-{site}-CFG-004',
+                'medium',
+                f'File editing not disabled: {site}',
+                'DISALLOW_FILE_EDIT is not set to true',
+                'Compromised admin accounts can edit theme/plugin files',
+                "Add to wp-config.php: define('DISALLOW_FILE_EDIT', true);"
+            ))
 
         return findings
 
-    def _audit_plugins(self, container: str, site: str, wp_type: str) -> List[Dict]:
+    def _audit_plugins(self, ctx: SiteContext, outputs: Dict) -> List[Dict]:
         """Audit WordPress plugins"""
         findings = []
-        wp_path = "/var/www/html" if wp_type in ["frankenwp", "wordpress"] else "/var/www/vhosts"
+        site, container, wp_path = ctx.site, ctx.container, ctx.wp_path
 
-        # Get list of plugins
-        exit_code, plugins_json, _ = self.ssh.run_command(
-            f"docker exec {container} wp plugin list --path={wp_path} --format=json --allow-root 2>/dev/null"
-        )
+        exit_code, plugins_json, _ = outputs['plugins']
 
         if exit_code != 0:
             return findings
 
-        # Parse JSON (basic parsing without import json module)
-        # Count inactive plugins
-        inactive_count = plugins_json.count('"status":"inactive"')
+        plugins = _parse_json_list(plugins_json)
+        inactive_count = sum(1 for p in plugins if p.get('status') == 'inactive')
 
         if inactive_count > 5:
-            findings.append({
-                'id': f'WP-{site}-PLG-001',
-                'severity': 'low',
-                'title': f'Many inactive plugins: {site}',
-                'description': f'{inactive_count} inactive plugins found',
-                'impact': 'Unused plugins may contain vulnerabilities',
-                'remediation': 'Remove unused plugins to reduce attack surface',
-                'auto_fix': None
-            })
+            findings.append(_finding(
+                f'WP-{site}-PLG-001',
+                'low',
+                f'Many inactive plugins: {site}',
+                f'{inactive_count} inactive plugins found',
+                'Unused plugins may contain vulnerabilities',
+                'Remove unused plugins to reduce attack surface'
+            ))
 
         # Check for plugin updates
-        exit_code, updates, _ = self.ssh.run_command(
-            f"docker exec {container} wp plugin list --path={wp_path} --update=available --format=count --allow-root 2>/dev/null"
-        )
-
-        if exit_code == 0 and updates.strip().isdigit():
-            update_count = int(updates.strip())
-            if update_count > 0:
-                findings.append({
-                    'id': f'WP-{site}-PLG-002',
-                    'severity': 'high',
-                    'title': f'{update_count} plugin updates available: {site}',
-                    'description': f'{update_count} plugins have updates available',
-                    'impact': 'Outdated plugins may have known vulnerabilities',
-                    'remediation': f'Update plugins: docker exec {container} wp plugin update --all --path={wp_path} --allow-root',
-                    'auto_fix': None
-                })
+        update_count = sum(1 for p in plugins if p.get('update') == 'available')
+
+        if update_count > 0:
+            findings.append(_finding(
+                f'WP-{site}-PLG-002',
+                'high',
+                f'{update_count} plugin updates available: {site}',
+                f'{update_count} plugins have updates available',
+                'Outdated plugins may have known vulnerabilities',
+                f'Update plugins: docker exec {container} wp plugin update --all --path={wp_path} --allow-root'
+            ))
 
         return findings
 
-    def _audit_themes(self, container: str, site: str, wp_type: str) -> List[Dict]:
+    def _audit_themes(self, ctx: SiteContext, outputs: Dict) -> List[Dict]:
         """Audit WordPress themes"""
         findings = []
-        wp_path = "/var/www/html" if wp_type in ["frankenwp", "wordpress"] else "/var/www/vhosts"
+        site, container, wp_path = ctx.site, ctx.container, ctx.wp_path
 
-        # Check for theme updates
-        exit_code, updates, _ = self.ssh.run_command(
-            f"docker exec {container} wp theme list --path={wp_path} --update=available --format=count --allow-root 2>/dev/null"
-        )
+        exit_code, themes_json, _ = outputs['themes']
 
-        if exit_code == 0 and updates.strip().isdigit():
-            update_count = int(updates.strip())
-            if update_count > 0:
-                findings.append({
-                    'id': f'WP-{site}-THM-001',
-                    'severity': 'medium',
-                    'title': f'{update_count} theme updates available: {site}',
-                    'description': f'{update_count} themes have updates available',
-                    'impact': 'Outdated themes may have vulnerabilities',
-                    'remediation': f'Update themes: docker exec {container} wp theme update --all --path={wp_path} --allow-root',
-                    'auto_fix': None
-                })
+        if exit_code != 0:
+            return findings
 
-        # Count inactive themes
-        exit_code, themes_json, _ = self.ssh.run_command(
-            f"docker exec {container} wp theme list --path={wp_path} --format=json --allow-root 2>/dev/null"
-        )
+        themes = _parse_json_list(themes_json)
 
-        if exit_code == 0:
-            inactive_count = themes_json.count('"status":"inactive"')
-
-            if inactive_count > 3:
-                findings.append({
-                    'id': f'WP-{site}-THM-002',
-                    'severity': 'low',
-                    'title': f'Many inactive themes: {site}',
-                    'description': f'{inactive_count} inactive themes found',
-                    'impact': 'Unused themes may contain vulnerabilities',
-                    'remediation': 'Remove unused themes to reduce attack surface',
-                    'auto_fix': None
-                })
+        # Check for theme updates
+        update_count = sum(1 for t in themes if t.get('update') == 'available')
+
+        if update_count > 0:
+            findings.append(_finding(
+                f'WP-{site}-THM-001',
+                'medium',
+                f'{update_count} theme updates available: {site}',
+                f'{update_count} themes have updates available',
+                'Outdated themes may have vulnerabilities',
+                f'Update themes: docker exec {container} wp theme update --all --path={wp_path} --allow-root'
+            ))
+
+        # Count inactive themes
+        inactive_count = sum(1 for t in themes if t.get('status') == 'inactive')
+
+        if inactive_count > 3:
+            findings.append(_finding(
+                f'WP-{site}-THM-002',
+                'low',
+                f'Many inactive themes: {site}',
+                f'{inactive_count} inactive themes found',
+                'Unused themes may contain vulnerabilities',
+                'Remove unused themes to reduce attack surface'
+            ))
 
         return findings
 
-    def _audit_users(self, container: str, site: str, wp_type: str) -> List[Dict]:
+    def _audit_users(self, ctx: SiteContext, outputs: Dict) -> List[Dict]:
         """Audit WordPress users"""
         findings = []
-        wp_path = "/var/www/html" if wp_type in ["frankenwp", "wordpress"] else "/var/www/vhosts"
+        site = ctx.site
 
-        # Get list of administrator users
-        exit_code, admins, _ = self.ssh.run_command(
-            f"docker exec {container} wp user list --path={wp_path} --role=administrator --format=count --allow-root 2>/dev/null"
-        )
+        exit_code, users_json, _ = outputs['users']
 
-        if exit_code == 0 and admins.strip().isdigit():
-            admin_count = int(admins.strip())
+        if exit_code != 0:
+            return findings
 
-            if admin_count > 5:
-                findings.append({
-                    'id': f'WP-{site}-USR-001',
-                    'severity': 'medium',
-                    'title': f'Too many administrator accounts: {site}',
-                    'description': f'{admin_count} administrator accounts found',
-                    'impact': 'Increased risk from compromised admin accounts',
-                    'remediation': 'Review and reduce number of admin accounts',
-                    'auto_fix': None
-                })
+        users = _parse_json_list(users_json)
 
-        # Check for default 'admin' username
-        exit_code, has_admin, _ = self.ssh.run_command(
-            f"docker exec {container} wp user get admin --path={wp_path} --allow-root 2>/dev/null"
+        # Count administrator users ('roles' is a comma-separated string)
+        admin_count = sum(
+            1 for u in users if 'administrator' in str(u.get('roles') or '').split(',')
         )
 
-        if exit_code == 0:
-            findings.append({
-                'id': f'WP-{site}-USR-002',
-                'severity': 'medium',
-                'title': f'Default admin username exists: {site}',
-                'description': 'User account with username "admin" exists',
-                'impact': 'Common target for brute-force attacks',
-                'remediation': 'Create new admin user and delete "admin" account',
-                'auto_fix': None
-            })
+        if admin_count > 5:
+            findings.append(_finding(
+                f'WP-{site}-USR-001',
+                'medium',
+                f'Too many administrator accounts: {site}',
+                f'{admin_count} administrator accounts found',
+                'Increased risk from compromised admin accounts',
+                'Review and reduce number of admin accounts'
+            ))
+
+        # Check for default 'admin' username
+        if any(u.get('user_login') == 'admin' for u in users):
+            findings.append(_finding(
+                f'WP-{site}-USR-002',
+                'medium',
+                f'Default admin username exists: {site}',
+                'User account with username "admin" exists',
+                'Common target for brute-force attacks',
+                'Create new admin user and delete "admin" account'
+            ))
 
         return findings
 
@@ -447,19 +717,29 @@ class WordPressAuditor:
         if not site:
             return []
 
-        container_name = f"{site_name}-wp"
-        wp_path = "/var/www/html" if site.type == "frankenwp" else "/var/www/vhosts"
+        ctx = SiteContext.for_site(site_name, site.domain, site.type)
+
+        # Plugin lists rarely change between runs; reuse the parsed list while
+        # the site fingerprint (plugin files and the database's active_plugins)
+        # is unchanged instead of booting WordPress for 'wp plugin list'
+        cache_name = f"{site_name}.plugins"
+        cache_key = self._site_fingerprint(ctx) if self.cache_dir else None
+        if cache_key:
+            cached = self._load_cached_result(cache_name, cache_key)
+            if cached is not None:
+                return cached
 
         exit_code, output, _ = self.ssh.run_command(
-            f"docker exec {container_name} wp plugin list --path={wp_path} --format=json --allow-root 2>/dev/null"
+            f"docker exec {shlex.quote(ctx.container)} wp plugin list --path={ctx.wp_path} --format=json --allow-root 2>/dev/null"
         )
 
         if exit_code != 0:
             return []
 
-        # Basic JSON parsing (without json module)
-        plugins = []
-        # This is a simplified parser - in production you'd use json.loads()
+        plugins = _parse_json_list(output)
+        if cache_key:
+            self._store_cached_result(cache_name, cache_key, plugins)
+
         return plugins
 
     def get_theme_list(self, site_name: str) -> List[Dict]:
@@ -476,15 +756,13 @@ class WordPressAuditor:
         if not site:
             return []
 
-        container_name = f"{site_name}-wp"
-        wp_path = "/var/www/html" if site.type == "frankenwp" else "/var/www/vhosts"
+        ctx = SiteContext.for_site(site_name, site.domain, site.type)
 
         exit_code, output, _ = self.ssh.run_command(
-            f"docker exec {container_name} wp theme list --path={wp_path} --format=json --allow-root 2>/dev/null"
+            f"docker exec {shlex.quote(ctx.container)} wp theme list --path={ctx.wp_path} --format=json --allow-root 2>/dev/null"
         )
 
         if exit_code != 0:
             return []
 
-        themes = []
-        return themes
+        return _parse_json_list(output)
@@ -0,0 +1,18 @@
+"""Shared pytest configuration for the unit test suite."""
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Send every pure test to the same xdist worker.
+
+    Pure tests finish in microseconds, so shipping them one by one to
+    whichever worker is free costs more in IPC than the test itself.
+    Only takes effect with ``--dist loadgroup`` (``make test-audit``).
+    """
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+
+    for item in items:
+        if item.get_closest_marker("pure"):
+            item.add_marker(pytest.mark.xdist_group("pure"))
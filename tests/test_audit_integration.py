@@ -2,38 +2,45 @@
 
 import pytest
 from unittest.mock import Mock, MagicMock, patch
-import json
 import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 from cli.utils.server_audit import ServerAuditManager
 from cli.utils.system_auditor import SystemAuditor
 from cli.utils.wordpress_auditor import WordPressAuditor
 from cli.utils.vulnerability_scanner import VulnerabilityScanner
 from cli.utils.audit_report import ReportGenerator
+from cli.utils import jsonio
 
 
-class TestAuditIntegration:
-    """Integration tests for full audit workflow."""
+@dataclass(frozen=True)
+class FakeSite:
+    """Plain stand-in for a configured site; tests only read its fields."""
+    name: str
+    domain: str
+    type: str
 
-    @pytest.fixture
-    def mock_ssh_comprehensive(self):
-        """Create comprehensive mock SSH with realistic responses."""
-        ssh = Mock()
 
-        def command_handler(cmd, *args, **kwargs):
-            """Handle different SSH commands with realistic responses."""
-            # SSH config
-            if 'sshd_config' in cmd:
-                return (0, """Port 2222
+def _make_config(sites=(), token=None):
+    """Build a lightweight config exposing the lookups the auditors use."""
+    sites = list(sites)
+    return SimpleNamespace(
+        get_sites=lambda: list(sites),
+        get_site=lambda name: next((s for s in sites if s.name == name), None),
+        get_wpscan_token=lambda: token,
+    )
+
+
+# Multi-line command outputs served by the comprehensive SSH mock
+_SSHD_RESP = (0, """Port 2222
 PermitRootLogin no
 PasswordAuthentication no
 PubkeyAuthentication yes
 Protocol 2
 """, "")
-
-            # UFW status
-            if 'ufw status' in cmd:
-                return (0, """Status: active
+_UFW_RESP = (0, """Status: active
 Default: deny (incoming), allow (outgoing), deny (routed)
 
 To                         Action      From
@@ -42,138 +49,199 @@ To                         Action      From
 80/tcp                     ALLOW       Anywhere
 443/tcp                    ALLOW       Anywhere
 """, "")
-
-            # fail2ban check
-            if 'which fail2ban-client' in cmd:
-                return (0, "/usr/bin/fail2ban-client", "")
-            if 'is-active fail2ban' in cmd:
-                return (0, "active", "")
-            if 'fail2ban-client status' in cmd:
-                return (0, "Jail list: sshd, apache-auth", "")
-
-            # Open ports
-            if 'ss -tulnp' in cmd:
-                return (0, """tcp   LISTEN 0      128        0.0.0.0:22        0.0.0.0:*    users:(("sshd",pid=1234))
+_SS_RESP = (0, """tcp   LISTEN 0      128        0.0.0.0:22        0.0.0.0:*    users:(("sshd",pid=1234))
 tcp   LISTEN 0      128        0.0.0.0:80        0.0.0.0:*    users:(("nginx",pid=5678))
 tcp   LISTEN 0      128      127.0.0.1:3306      0.0.0.0:*    users:(("mysqld",pid=9012))
 """, "")
-
-            # Services
-            if 'systemctl list-units' in cmd:
-                return (0, """sshd.service    loaded active running OpenSSH server
+_SYSTEMCTL_RESP = (0, """sshd.service    loaded active running OpenSSH server
 nginx.service   loaded active running Nginx web server
 docker.service  loaded active running Docker daemon
 """, "")
+_DOCKER_PS_RESP = (0, "\n".join(
+    ["testsite1-wp", "testsite2-wp"] + [f"site{i}-wp" for i in range(5)]
+), "")
+_EMPTY_RESP = (0, "", "")
+
+# Keys every finding must carry, and the severities a finding may have
+_REQUIRED_FINDING_KEYS = frozenset(
+    {'id', 'severity', 'title', 'description', 'impact', 'remediation'}
+)
+_SEVERITIES = frozenset({'critical', 'high', 'medium', 'low'})
+
+# Outputs for the single-purpose handlers defined inside individual tests
+_INSECURE_SSHD_RESP = (0, """Port 22
+PermitRootLogin yes
+PasswordAuthentication yes
+Protocol 1,2
+""", "")
+_PLUGIN_CSV_20 = "name,version,status\n" + "".join(
+    f"plugin{i},1.0.0,active\n" for i in range(20)
+)
+_WPCONFIG_RESP = (0, """define('DB_NAME', 'wordpress');
+define('AUTH_KEY', 'unique-key-here');
+define('WP_DEBUG', false);
+""", "")
 
-            # Users
-            if 'grep -Po' in cmd and '/etc/group' in cmd:
-                return (0, "user1,user2", "")
-            if 'getent passwd' in cmd:
-                return (0, "user1:x:1000:1000::/home/user1:/bin/bash", "")
-            if '/etc/shadow' in cmd and 'awk' in cmd:
-                return (0, "", "")  # No users without password
-
-            # Updates
-            if 'apt-get update' in cmd:
-                return (0, "", "")
-            if 'apt list --upgradable' in cmd and 'wc -l' in cmd:
-                return (0, "5", "")
-            if 'apt list --upgradable' in cmd and 'grep -i security' in cmd:
-                return (0, "2", "")
+# WP-CLI list responses keyed by command, then by the --format value
+_WP_LIST_RESPONSES = {
+    'wp plugin list': {
+        'json': (0, '[{"name":"akismet","version":"5.0","status":"active"}]', ""),
+        'count': (0, "0", ""),  # No updates
+        'csv': (0, "name,version,status\nakismet,5.0,active", ""),
+    },
+    'wp theme list': {
+        'json': (0, '[{"name":"twentytwentyfour","status":"active"}]', ""),
+        'count': (0, "0", ""),
+        'csv': (0, "name,version,status\ntwentytwentyfour,1.0,active", ""),
+    },
+}
+
+# Canned SSH responses for the comprehensive mock, as (substrings, response)
+# pairs.  A command matches an entry when it contains every substring; entries
+# are scanned in order, so more specific patterns come before general ones.
+_COMMAND_RESPONSES = (
+    # File permissions (one stat for all files; names sshd_config, so it goes first)
+    (('stat -c', '/etc/shadow'), (
+        0,
+        "/etc/passwd 644\n/etc/shadow 640\n/etc/group 644\n/etc/gshadow 644\n/etc/ssh/sshd_config 644",
+        ""
+    )),
+
+    # SSH config
+    (('sshd_config',), _SSHD_RESP),
+
+    # UFW status
+    (('ufw status',), _UFW_RESP),
+
+    # fail2ban check
+    (('which fail2ban-client',), (0, "/usr/bin/fail2ban-client", "")),
+    (('is-active fail2ban',), (0, "active", "")),
+    (('fail2ban-client status',), (0, "Jail list: sshd, apache-auth", "")),
+
+    # Open ports
+    (('ss -tulnp',), _SS_RESP),
+
+    # Services
+    (('systemctl list-units',), _SYSTEMCTL_RESP),
+
+    # Users
+    (('grep -Po', '/etc/group'), (0, "user1,user2", "")),
+    (('getent passwd',), (0, "user1:x:1000:1000::/home/user1:/bin/bash", "")),
+    (('/etc/shadow', 'awk'), _EMPTY_RESP),  # No users without password
+
+    # Updates
+    (('apt-get update',), _EMPTY_RESP),
+    (('apt list --upgradable', 'wc -l'), (0, "5", "")),
+    (('apt list --upgradable', 'grep -i security'), (0, "2", "")),
+
+    # Logs
+    (('Failed password', '/var/log/auth.log'), (0, "15\nSUDO Jan 10 user1 sudo: command", "")),
+
+    # Any other permission probe
+    (('stat -c',), (0, "644", "")),
+
+    # Docker container check
+    (('docker ps', '--filter'), (0, "testsite-wp", "")),
+    (('docker ps',), _DOCKER_PS_RESP),
+
+    # WordPress checks
+    (('wp core version',), (0, "6.4.0", "")),
+    (('wp core check-update',), (0, "[]", "")),  # No updates
+    (('wp-config.php', 'stat'), (0, "600", "")),
+    (('uploads', 'stat'), (0, "755", "")),
+    (('cat', 'wp-config.php'), _WPCONFIG_RESP),
+    (('wp user list', '--format=json'),
+     (0, '[{"user_login":"siteowner","roles":"administrator"}]', "")),
+
+    # Lynis
+    (('which lynis',), (1, "", "")),  # Not installed
+)
+
+
+@lru_cache(maxsize=256)
+def _response_for(cmd):
+    """Look up the canned response for a command.
+
+    Responses are immutable tuples and depend only on the command string,
+    so repeated commands across sites and tests are served from the cache.
+    """
+    for list_cmd, by_format in _WP_LIST_RESPONSES.items():
+        if list_cmd in cmd:
+            fmt = cmd.split('--format=', 1)[1].split()[0] if '--format=' in cmd else None
+            return by_format.get(fmt, _EMPTY_RESP)
+    for needles, response in _COMMAND_RESPONSES:
+        if all(needle in cmd for needle in needles):
+            return response
+    return _EMPTY_RESP
+
+
+def _command_handler(cmd, *args, **kwargs):
+    """Handle different SSH commands with realistic responses."""
+    return _response_for(cmd)
+
+
+def _stable(results):
+    """Return a copy of audit results with every ``timestamp`` key removed."""
+    if isinstance(results, dict):
+        return {k: _stable(v) for k, v in results.items() if k != 'timestamp'}
+    if isinstance(results, list):
+        return [_stable(item) for item in results]
+    return results
+
+
+@pytest.fixture(scope="session")
+def mock_ssh_comprehensive():
+    """Create comprehensive mock SSH with realistic responses.
+
+    Built once per session (once per worker under pytest-xdist);
+    ``reset_ssh_mock`` clears its call history before every test.
+    """
+    ssh = Mock()
+    ssh.run_command.side_effect = _command_handler
+    ssh.run_script.side_effect = lambda cmds, *args, **kwargs: [_command_handler(c) for c in cmds]
+    return ssh
 
-            # Logs
-            if 'Failed password' in cmd:
-                return (0, "15", "")
-            if 'grep sudo' in cmd:
-                return (0, "Jan 10 user1 sudo command", "")
 
-            # File permissions
-            if 'stat -c' in cmd:
-                if '/etc/shadow' in cmd:
-                    return (0, "640", "")
-                return (0, "644", "")
+@pytest.fixture(autouse=True)
+def reset_ssh_mock(mock_ssh_comprehensive):
+    """Clear call history recorded on the shared SSH mock by earlier tests."""
+    mock_ssh_comprehensive.reset_mock()
 
-            # Docker container check
-            if 'docker ps --filter' in cmd:
-                return (0, "testsite-wp", "")
 
-            # WordPress checks
-            if 'wp core version' in cmd:
-                return (0, "6.4.0", "")
-            if 'wp core check-update' in cmd:
-                return (0, "[]", "")  # No updates
-            if 'wp-config.php' in cmd and 'stat' in cmd:
-                return (0, "600", "")
-            if 'uploads' in cmd and 'stat' in cmd:
-                return (0, "755", "")
-            if 'cat' in cmd and 'wp-config.php' in cmd:
-                return (0, """define('DB_NAME', 'wordpress');
-define('AUTH_KEY', 'unique-key-here');
-define('WP_DEBUG', false);
-""", "")
-            if 'wp plugin list' in cmd:
-                if '--format=json' in cmd:
-                    return (0, '[{"name":"akismet","version":"5.0","status":"active"}]', "")
-                if '--format=count' in cmd:
-                    return (0, "0", "")  # No updates
-                if '--format=csv' in cmd:
-                    return (0, "name,version,status\nakismet,5.0,active", "")
-            if 'wp theme list' in cmd:
-                if '--format=count' in cmd:
-                    return (0, "0", "")
-                if '--format=json' in cmd:
-                    return (0, '[{"name":"twentytwentyfour","status":"active"}]', "")
-                if '--format=csv' in cmd:
-                    return (0, "name,version,status\ntwentytwentyfour,1.0,active", "")
-            if 'wp user list' in cmd:
-                if '--role=administrator' in cmd:
-                    return (0, "2", "")
-            if 'wp user get admin' in cmd:
-                return (1, "", "")  # admin user doesn't exist
-
-            # Lynis
-            if 'which lynis' in cmd:
-                return (1, "", "")  # Not installed
-
-            # Default
-            return (0, "", "")
+@pytest.fixture(scope="session")
+def mock_config_with_sites():
+    """Create config with test sites."""
+    return _make_config([
+        FakeSite("testsite1", "test1.com", "frankenwp"),
+        FakeSite("testsite2", "test2.com", "ols"),
+    ])
 
-        ssh.run_command.side_effect = command_handler
-        return ssh
 
-    @pytest.fixture
-    def mock_config_with_sites(self):
-        """Create mock config with test sites."""
-        config = Mock()
+@pytest.fixture(scope="session")
+def manager(mock_ssh_comprehensive, mock_config_with_sites):
+    """Create the audit manager for the comprehensive SSH mock and test sites.
 
-        site1 = Mock()
-        site1.name = "testsite1"
-        site1.domain = "test1.com"
-        site1.type = "frankenwp"
+    The manager keeps no state between runs, so one instance is shared.
+    """
+    return ServerAuditManager(mock_ssh_comprehensive, mock_config_with_sites)
 
-        site2 = Mock()
-        site2.name = "testsite2"
-        site2.domain = "test2.com"
-        site2.type = "ols"
 
-        config.get_sites.return_value = [site1, site2]
-        config.get_site.return_value = site1
-        config.get_wpscan_token.return_value = None
+@pytest.fixture(scope="session")
+def baseline_audit_results(manager):
+    """Run the default full audit once and share the results.
 
-        return config
+    Tests that only inspect the results of an unmodified audit use this
+    instead of running their own; none of them mutate the returned dict.
+    """
+    return manager.run_full_audit(verbose=False)
 
-    def test_full_audit_workflow_end_to_end(self, mock_ssh_comprehensive, mock_config_with_sites):
-        """Test complete audit workflow from start to finish."""
-        # Initialize manager
-        manager = ServerAuditManager(mock_ssh_comprehensive, mock_config_with_sites)
 
-        # Run full audit
-        results = manager.run_full_audit(
-            skip_wordpress=False,
-            skip_lynis=True,
-            wpscan_api_token=None,
-            verbose=False
-        )
+class TestAuditIntegration:
+    """Integration tests for full audit workflow."""
+
+    def test_full_audit_workflow_end_to_end(self, baseline_audit_results):
+        """Test complete audit workflow from start to finish."""
+        results = baseline_audit_results
 
         # Verify structure
         assert 'timestamp' in results
@@ -199,12 +267,10 @@ define('WP_DEBUG', false);
         # Verify score is valid
         assert 0 <= results['overall_score'] <= 100
 
-    def test_full_audit_with_vulnerability_scanning(self, mock_ssh_comprehensive, mock_config_with_sites):
+    def test_full_audit_with_vulnerability_scanning(self, manager):
         """Test audit workflow with vulnerability scanning enabled."""
-        manager = ServerAuditManager(mock_ssh_comprehensive, mock_config_with_sites)
-
         # Mock WPScan API responses
-        with patch('cli.utils.vulnerability_scanner.requests.get') as mock_get:
+        with patch('cli.utils.vulnerability_scanner.requests.Session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -230,6 +296,7 @@ define('WP_DEBUG', false);
         """Test audit handles SSH connection failures gracefully."""
         mock_ssh = Mock()
         mock_ssh.run_command.side_effect = Exception("Connection refused")
+        mock_ssh.run_script.side_effect = Exception("Connection refused")
 
         manager = ServerAuditManager(mock_ssh, mock_config_with_sites)
 
@@ -239,7 +306,7 @@ define('WP_DEBUG', false);
         assert len(results['errors']) > 0
         assert 'overall_score' in results
 
-    def test_audit_error_handling_partial_failure(self, mock_ssh_comprehensive, mock_config_with_sites):
+    def test_audit_error_handling_partial_failure(self, mock_ssh_comprehensive, manager):
         """Test audit continues when one component fails."""
         # Make WordPress audit fail
         def selective_failure(cmd, *args, **kwargs):
@@ -250,20 +317,21 @@ define('WP_DEBUG', false);
                 return (0, "PermitRootLogin no", "")
             return (0, "", "")
 
+        # The SSH mock is shared across the session, so restore its handler
+        original_handler = mock_ssh_comprehensive.run_command.side_effect
         mock_ssh_comprehensive.run_command.side_effect = selective_failure
-
-        manager = ServerAuditManager(mock_ssh_comprehensive, mock_config_with_sites)
-        results = manager.run_full_audit(verbose=False)
+        try:
+            results = manager.run_full_audit(verbose=False)
+        finally:
+            mock_ssh_comprehensive.run_command.side_effect = original_handler
 
         # System audit should complete
         assert 'system' in results
         # WordPress audit should have error
         assert len(results['errors']) > 0 or 'wordpress' in results
 
-    def test_audit_with_skip_options(self, mock_ssh_comprehensive, mock_config_with_sites):
+    def test_audit_with_skip_options(self, manager):
         """Test audit respects skip flags."""
-        manager = ServerAuditManager(mock_ssh_comprehensive, mock_config_with_sites)
-
         results = manager.run_full_audit(
             skip_wordpress=True,
             skip_lynis=True,
@@ -274,12 +342,9 @@ define('WP_DEBUG', false);
         assert results['lynis']['skipped'] is True
         assert 'system' in results  # System should still run
 
-    def test_report_generation_all_formats(self, mock_ssh_comprehensive, mock_config_with_sites):
+    def test_report_generation_all_formats(self, manager, baseline_audit_results):
         """Test report generation in all supported formats."""
-        manager = ServerAuditManager(mock_ssh_comprehensive, mock_config_with_sites)
-
-        # Run audit
-        results = manager.run_full_audit(verbose=False)
+        results = baseline_audit_results
 
         with tempfile.TemporaryDirectory() as tmpdir:
             # Test JSON format
@@ -289,8 +354,8 @@ define('WP_DEBUG', false);
             assert json_path.exists()
 
             # Verify JSON is valid
-            with open(json_path, 'r') as f:
-                json_data = json.load(f)
+            with open(json_path, 'rb') as f:
+                json_data = jsonio.loads(f.read())
                 assert 'security_score' in json_data
                 assert 'timestamp' in json_data
 
@@ -298,12 +363,11 @@ define('WP_DEBUG', false);
             console_report = manager.generate_report(results, 'console')
             assert console_report is not None or console_report == ""  # Console may print directly
 
-    def test_audit_performance_under_5_minutes(self, mock_ssh_comprehensive, mock_config_with_sites):
+    @pytest.mark.perf
+    def test_audit_performance_under_5_minutes(self, manager):
         """Test audit completes in reasonable time (simulated)."""
         import time
 
-        manager = ServerAuditManager(mock_ssh_comprehensive, mock_config_with_sites)
-
         start_time = time.time()
         results = manager.run_full_audit(verbose=False)
         elapsed = time.time() - start_time
@@ -312,12 +376,10 @@ define('WP_DEBUG', false);
         assert elapsed < 5.0  # Should be much faster with mocks
         assert 'overall_score' in results
 
-    def test_audit_data_consistency(self, mock_ssh_comprehensive, mock_config_with_sites):
+    def test_audit_data_consistency(self, manager, baseline_audit_results):
         """Test audit results are consistent across multiple runs."""
-        manager = ServerAuditManager(mock_ssh_comprehensive, mock_config_with_sites)
-
-        # Run audit twice
-        results1 = manager.run_full_audit(verbose=False)
+        # Compare a fresh run against the shared baseline run
+        results1 = baseline_audit_results
         results2 = manager.run_full_audit(verbose=False)
 
         # Scores should be consistent (same mock data)
@@ -326,10 +388,12 @@ define('WP_DEBUG', false);
         # Structure should be identical
         assert results1.keys() == results2.keys()
 
-    def test_audit_findings_categorization(self, mock_ssh_comprehensive, mock_config_with_sites):
+        # Everything except when each run happened should match exactly
+        assert _stable(results1) == _stable(results2)
+
+    def test_audit_findings_categorization(self, baseline_audit_results):
         """Test findings are properly categorized by severity."""
-        manager = ServerAuditManager(mock_ssh_comprehensive, mock_config_with_sites)
-        results = manager.run_full_audit(verbose=False)
+        results = baseline_audit_results
 
         # Collect all findings
         all_findings = []
@@ -345,15 +409,11 @@ define('WP_DEBUG', false);
                 if 'findings' in site_data:
                     all_findings.extend(site_data['findings'])
 
-        # Verify all findings have required fields
+        # Verify all findings have required fields and a known severity
         for finding in all_findings:
-            assert 'id' in finding
-            assert 'severity' in finding
-            assert finding['severity'] in ['critical', 'high', 'medium', 'low']
-            assert 'title' in finding
-            assert 'description' in finding
-            assert 'impact' in finding
-            assert 'remediation' in finding
+            missing = _REQUIRED_FINDING_KEYS - finding.keys()
+            assert not missing, f"{finding.get('id')} missing {sorted(missing)}"
+            assert finding['severity'] in _SEVERITIES
 
     def test_audit_with_insecure_system(self, mock_config_with_sites):
         """Test audit on intentionally insecure system configuration."""
@@ -361,12 +421,10 @@ define('WP_DEBUG', false);
         mock_ssh = Mock()
 
         def insecure_command_handler(cmd, *args, **kwargs):
+            if 'stat -c' in cmd:
+                return (0, "/etc/shadow 644", "")  # Wrong permissions
             if 'sshd_config' in cmd:
-                return (0, """Port 22
-PermitRootLogin yes
-PasswordAuthentication yes
-Protocol 1,2
-""", "")
+                return _INSECURE_SSHD_RESP
             if 'ufw status' in cmd:
                 return (0, "Status: inactive", "")
             if 'which fail2ban' in cmd:
@@ -377,13 +435,12 @@ Protocol 1,2
                 return (0, "15", "")  # Many security updates
             if 'Failed password' in cmd:
                 return (0, "500", "")  # Many failed attempts
-            if '/etc/shadow' in cmd and 'stat' in cmd:
-                return (0, "644", "")  # Wrong permissions
             if 'docker ps' in cmd:
                 return (0, "", "")  # No containers
             return (0, "", "")
 
         mock_ssh.run_command.side_effect = insecure_command_handler
+        mock_ssh.run_script.side_effect = lambda cmds, *args, **kwargs: [insecure_command_handler(c) for c in cmds]
 
         manager = ServerAuditManager(mock_ssh, mock_config_with_sites)
         results = manager.run_full_audit(skip_wordpress=True, verbose=False)
@@ -400,31 +457,24 @@ Protocol 1,2
         # Score should be low
         assert results['overall_score'] < 50
 
-    def test_audit_export_format_validation(self, mock_ssh_comprehensive, mock_config_with_sites):
+    def test_audit_export_format_validation(self, manager, baseline_audit_results):
         """Test exported reports are valid in their respective formats."""
-        manager = ServerAuditManager(mock_ssh_comprehensive, mock_config_with_sites)
-        results = manager.run_full_audit(verbose=False)
+        results = baseline_audit_results
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # JSON validation
-            json_path = Path(tmpdir) / "audit.json"
-            json_report = manager.generate_report(results, 'json')
-            manager.save_report(json_report, str(json_path), 'json')
+        # The disk round-trip is covered by test_report_generation_all_formats
+        json_report = manager.generate_report(results, 'json')
+        data = jsonio.loads(json_report)
 
-            with open(json_path, 'r') as f:
-                data = json.load(f)
-                # Validate required fields
-                assert 'timestamp' in data
-                assert 'security_score' in data
-                assert 'severity_counts' in data
-                assert isinstance(data['security_score'], int)
-                assert 0 <= data['security_score'] <= 100
+        # Validate required fields
+        assert 'timestamp' in data
+        assert 'security_score' in data
+        assert 'severity_counts' in data
+        assert isinstance(data['security_score'], int)
+        assert 0 <= data['security_score'] <= 100
 
     def test_graceful_degradation_no_wordpress_sites(self, mock_ssh_comprehensive):
         """Test audit works gracefully with no WordPress sites configured."""
-        mock_config = Mock()
-        mock_config.get_sites.return_value = []
-        mock_config.get_wpscan_token.return_value = None
+        mock_config = _make_config()
 
         manager = ServerAuditManager(mock_ssh_comprehensive, mock_config)
         results = manager.run_full_audit(verbose=False)
@@ -438,12 +488,7 @@ Protocol 1,2
     def test_vulnerability_scan_rate_limiting(self, mock_ssh_comprehensive, mock_config_with_sites):
         """Test vulnerability scanner respects rate limiting."""
         # Create site with many plugins
-        mock_config = Mock()
-        site = Mock()
-        site.name = "testsite"
-        site.domain = "test.com"
-        site.type = "frankenwp"
-        mock_config.get_sites.return_value = [site]
+        mock_config = _make_config([FakeSite("testsite", "test.com", "frankenwp")])
 
         # Mock WP-CLI to return many plugins
         def plugin_command_handler(cmd, *args, **kwargs):
@@ -451,10 +496,7 @@ Protocol 1,2
                 return (0, "testsite-wp", "")
             if 'wp plugin list' in cmd and '--format=csv' in cmd:
                 # Return 20 plugins
-                plugins = ["name,version,status\n"]
-                for i in range(20):
-                    plugins.append(f"plugin{i},1.0.0,active\n")
-                return (0, "".join(plugins), "")
+                return (0, _PLUGIN_CSV_20, "")
             # Other commands
             if 'wp core version' in cmd:
                 return (0, "6.4.0", "")
@@ -464,10 +506,11 @@ Protocol 1,2
 
         ssh = Mock()
         ssh.run_command.side_effect = plugin_command_handler
+        ssh.run_script.side_effect = lambda cmds, *args, **kwargs: [plugin_command_handler(c) for c in cmds]
 
         manager = ServerAuditManager(ssh, mock_config)
 
-        with patch('cli.utils.vulnerability_scanner.requests.get') as mock_get:
+        with patch('cli.utils.vulnerability_scanner.requests.Session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {'plugin0': {'vulnerabilities': []}}
@@ -485,15 +528,9 @@ Protocol 1,2
     def test_concurrent_site_audits(self, mock_ssh_comprehensive):
         """Test auditing multiple sites doesn't cause conflicts."""
         # Create config with many sites
-        mock_config = Mock()
-        sites = []
-        for i in range(5):
-            site = Mock()
-            site.name = f"site{i}"
-            site.domain = f"site{i}.com"
-            site.type = "frankenwp"
-            sites.append(site)
-        mock_config.get_sites.return_value = sites
+        mock_config = _make_config(
+            FakeSite(f"site{i}", f"site{i}.com", "frankenwp") for i in range(5)
+        )
 
         manager = ServerAuditManager(mock_ssh_comprehensive, mock_config)
         results = manager.run_full_audit(verbose=False)
@@ -515,6 +552,7 @@ Protocol 1,2
             return (0, "", "")
 
         mock_ssh.run_command.side_effect = intermittent_failure
+        mock_ssh.run_script.side_effect = lambda cmds, *args, **kwargs: [intermittent_failure(c) for c in cmds]
 
         manager = ServerAuditManager(mock_ssh, mock_config_with_sites)
         results = manager.run_full_audit(verbose=False)
@@ -523,10 +561,9 @@ Protocol 1,2
         assert 'errors' in results
         assert 'overall_score' in results
 
-    def test_audit_timestamp_consistency(self, mock_ssh_comprehensive, mock_config_with_sites):
+    def test_audit_timestamp_consistency(self, baseline_audit_results):
         """Test timestamps are consistent and properly formatted."""
-        manager = ServerAuditManager(mock_ssh_comprehensive, mock_config_with_sites)
-        results = manager.run_full_audit(verbose=False)
+        results = baseline_audit_results
 
         # Main timestamp
         assert 'timestamp' in results
@@ -540,74 +577,31 @@ Protocol 1,2
             assert results['wordpress']['timestamp'].endswith('Z')
 
 
+@pytest.fixture(scope="session")
+def empty_config():
+    """Create config with no sites configured."""
+    return _make_config()
+
+
 class TestAuditEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_empty_ssh_responses(self):
-        """Test handling of empty SSH command responses."""
+    @pytest.mark.parametrize("payload", [
+        "",
+        "malformed data !@#$%",
+        "Ñoño ユーザー 用户",
+        "line\n" * 10000,
+        "data\x00with\x00nulls",
+    ], ids=["empty", "malformed", "unicode", "long", "nulls"])
+    def test_ssh_edge_case(self, empty_config, payload):
+        """Test audit completes whatever every SSH command returns."""
         mock_ssh = Mock()
-        mock_ssh.run_command.return_value = (0, "", "")
+        mock_ssh.run_command.return_value = (0, payload, "")
+        mock_ssh.run_script.side_effect = lambda cmds, *a, **k: [(0, payload, "")] * len(cmds)
 
-        mock_config = Mock()
-        mock_config.get_sites.return_value = []
-
-        manager = ServerAuditManager(mock_ssh, mock_config)
+        manager = ServerAuditManager(mock_ssh, empty_config)
         results = manager.run_full_audit(verbose=False)
 
         # Should complete without crashing
         assert 'overall_score' in results
-
-    def test_malformed_ssh_responses(self):
-        """Test handling of malformed SSH responses."""
-        mock_ssh = Mock()
-        mock_ssh.run_command.return_value = (0, "malformed data !@#$%", "")
-
-        mock_config = Mock()
-        mock_config.get_sites.return_value = []
-
-        manager = ServerAuditManager(mock_ssh, mock_config)
-        results = manager.run_full_audit(verbose=False)
-
-        # Should complete without crashing
-        assert 'overall_score' in results
-
-    def test_unicode_in_responses(self):
-        """Test handling of unicode characters in responses."""
-        mock_ssh = Mock()
-        mock_ssh.run_command.return_value = (0, "Ñoño ユーザー 用户", "")
-
-        mock_config = Mock()
-        mock_config.get_sites.return_value = []
-
-        manager = ServerAuditManager(mock_ssh, mock_config)
-        results = manager.run_full_audit(verbose=False)
-
-        assert 'overall_score' in results
-
-    def test_very_long_responses(self):
-        """Test handling of very long SSH responses."""
-        mock_ssh = Mock()
-        # Simulate very long output
-        long_output = "line\n" * 10000
-        mock_ssh.run_command.return_value = (0, long_output, "")
-
-        mock_config = Mock()
-        mock_config.get_sites.return_value = []
-
-        manager = ServerAuditManager(mock_ssh, mock_config)
-        results = manager.run_full_audit(verbose=False)
-
-        assert 'overall_score' in results
-
-    def test_null_bytes_in_responses(self):
-        """Test handling of null bytes in SSH responses."""
-        mock_ssh = Mock()
-        mock_ssh.run_command.return_value = (0, "data\x00with\x00nulls", "")
-
-        mock_config = Mock()
-        mock_config.get_sites.return_value = []
-
-        manager = ServerAuditManager(mock_ssh, mock_config)
-        results = manager.run_full_audit(verbose=False)
-
-        assert 'overall_score' in results
+        assert results['errors'] == []
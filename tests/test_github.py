@@ -1,8 +1,10 @@
 """Tests for GitHub API client."""
 
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from pathlib import Path
 from cli.utils.github import (
     GitHubClient,
     GitHubRelease,
@@ -49,9 +51,35 @@ class TestGitHubRelease:
         assert release.version == '2.5.3'
 
 
+@pytest.fixture(scope='module')
+def client():
+    """Share one default client across the module's tests."""
+    return GitHubClient()
+
+
+@pytest.fixture(autouse=True)
+def _clear_client_cache(client):
+    """Start every test with an empty response cache."""
+    client._cache.clear()
+    yield
+
+
 class TestGitHubClient:
     """Test GitHub API client."""
 
+    def test_lazy_requests_import(self):
+        """Test importing the client module doesn't import requests."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, cli.utils.github, cli.utils.remote_backup; "
+            "sys.exit('requests' in sys.modules or 'paramiko' in sys.modules)"
+        )
+        repo_root = Path(__file__).resolve().parent.parent
+        result = subprocess.run([sys.executable, '-c', code], cwd=repo_root)
+        assert result.returncode == 0
+
     def test_initialization(self):
         """Test client initialization."""
         client = GitHubClient()
@@ -61,13 +89,23 @@ class TestGitHubClient:
         client_with_token = GitHubClient(token='test_token')
         assert client_with_token.token == 'test_token'
 
+    def test_clients_share_session_but_not_auth(self):
+        """Test clients reuse one pooled session without leaking tokens."""
+        client = GitHubClient(token='test_token')
+        anonymous = GitHubClient()
+
+        assert client.session is anonymous.session
+        assert client.headers['Authorization'] == 'token test_token'
+        assert 'Authorization' not in anonymous.headers
+        assert 'Authorization' not in client.session.headers
+
     def test_initialization_with_custom_timeout(self):
         """Test client with custom timeout."""
         client = GitHubClient(timeout=30)
         assert client.timeout == 30
 
     @patch('cli.utils.github.requests.Session.get')
-    def test_get_latest_release_success(self, mock_get):
+    def test_get_latest_release_success(self, mock_get, client):
         """Test getting latest release successfully."""
         mock_response = Mock()
         mock_response.status_code = 200
@@ -83,7 +121,6 @@ class TestGitHubClient:
         mock_response.headers = {}
         mock_get.return_value = mock_response
 
-        client = GitHubClient()
         release = client.get_latest_release()
 
         assert release is not None
@@ -91,7 +128,122 @@ class TestGitHubClient:
         assert release.tag_name == 'v1.0.0'
 
     @patch('cli.utils.github.requests.Session.get')
-    def test_get_latest_release_rate_limit(self, mock_get):
+    def test_latest_release_file_cache(self, mock_get, monkeypatch, tmp_path):
+        """Test a fresh on-disk release skips the API in a new client, and an old one does not."""
+        cache_file = tmp_path / "vibewp" / "releases.json"
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.json.return_value = {
+            'tag_name': 'v1.0.0',
+            'name': 'Version 1.0.0',
+            'body': 'Release notes',
+            'published_at': '2025-01-01T12:00:00Z',
+            'html_url': 'https://github.com/vibery-studio/vibewp/releases/tag/v1.0.0',
+            'prerelease': False,
+            'assets': []
+        }
+        mock_get.return_value = mock_response
+
+        first = GitHubClient(release_cache_file=cache_file).get_latest_release()
+        second = GitHubClient(release_cache_file=cache_file).get_latest_release()
+
+        assert mock_get.call_count == 1
+        assert second == first
+
+        later = time.time() + GitHubClient.RELEASE_CACHE_TTL.total_seconds()
+        monkeypatch.setattr('cli.utils.github.time.time', lambda: later)
+        GitHubClient(release_cache_file=cache_file).get_latest_release()
+        assert mock_get.call_count == 2
+
+    @patch('cli.utils.github.requests.Session.get')
+    def test_expired_release_file_revalidated(self, mock_get, monkeypatch, tmp_path):
+        """Test an expired on-disk release is revalidated with its validators and kept on 304."""
+        cache_file = tmp_path / "releases.json"
+        ok = Mock(status_code=200, headers={'ETag': '"v1"', 'Last-Modified': 'Wed, 01 Jan 2025 12:00:00 GMT'})
+        ok.json.return_value = {
+            'tag_name': 'v1.0.0',
+            'name': 'Version 1.0.0',
+            'body': 'Release notes',
+            'published_at': '2025-01-01T12:00:00Z',
+            'html_url': 'https://github.com/vibery-studio/vibewp/releases/tag/v1.0.0',
+            'prerelease': False,
+            'assets': []
+        }
+        mock_get.return_value = ok
+        GitHubClient(release_cache_file=cache_file).get_latest_release()
+
+        later = time.time() + GitHubClient.RELEASE_CACHE_TTL.total_seconds()
+        monkeypatch.setattr('cli.utils.github.time.time', lambda: later)
+        mock_get.return_value = Mock(status_code=304, headers={})
+
+        release = GitHubClient(release_cache_file=cache_file).get_latest_release()
+
+        assert release.version == '1.0.0'
+        headers = mock_get.call_args.kwargs['headers']
+        assert headers['If-None-Match'] == '"v1"'
+        assert headers['If-Modified-Since'] == 'Wed, 01 Jan 2025 12:00:00 GMT'
+        # The 304 renewed the stored entry
+        GitHubClient(release_cache_file=cache_file).get_latest_release()
+        assert mock_get.call_count == 2
+
+    @patch('cli.utils.github.requests.Session.get')
+    def test_fresh_release_file_revalidated_on_request(self, mock_get, tmp_path):
+        """Test revalidate=True asks GitHub even while the on-disk release is fresh."""
+        cache_file = tmp_path / "releases.json"
+        ok = Mock(status_code=200, headers={'ETag': '"v1"'})
+        ok.json.return_value = {
+            'tag_name': 'v1.0.0',
+            'name': 'Version 1.0.0',
+            'body': 'Release notes',
+            'published_at': '2025-01-01T12:00:00Z',
+            'html_url': 'https://github.com/vibery-studio/vibewp/releases/tag/v1.0.0',
+            'prerelease': False,
+            'assets': []
+        }
+        mock_get.return_value = ok
+        GitHubClient(release_cache_file=cache_file).get_latest_release()
+
+        mock_get.return_value = Mock(status_code=304, headers={})
+        release = GitHubClient(release_cache_file=cache_file).get_latest_release(revalidate=True)
+
+        assert mock_get.call_count == 2
+        assert release.version == '1.0.0'
+        assert mock_get.call_args.kwargs['headers']['If-None-Match'] == '"v1"'
+
+        newer = Mock(status_code=200, headers={'ETag': '"v2"'})
+        newer.json.return_value = dict(ok.json.return_value, tag_name='v1.1.0', name='Version 1.1.0')
+        mock_get.return_value = newer
+        release = GitHubClient(release_cache_file=cache_file).get_latest_release(revalidate=True)
+
+        assert release.version == '1.1.0'
+        # Passive lookups pick up the newer release from the file
+        assert GitHubClient(release_cache_file=cache_file).get_latest_release().version == '1.1.0'
+        assert mock_get.call_count == 3
+
+    @patch('cli.utils.github.requests.Session.get')
+    def test_latest_populates_tag_cache(self, mock_get, client):
+        """Test looking up the latest release's tag reuses the cached payload."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'tag_name': 'v1.0.0',
+            'name': 'Version 1.0.0',
+            'body': 'Release notes',
+            'published_at': '2025-01-01T12:00:00Z',
+            'html_url': 'https://github.com/vibery-studio/vibewp/releases/tag/v1.0.0',
+            'prerelease': False,
+            'assets': []
+        }
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        latest = client.get_latest_release()
+        by_tag = client.get_release_by_tag('1.0.0')
+
+        assert mock_get.call_count == 1
+        assert by_tag == latest
+
+    @patch('cli.utils.github.requests.Session.get')
+    def test_get_latest_release_rate_limit(self, mock_get, client):
         """Test handling rate limit error."""
         mock_response = Mock()
         mock_response.status_code = 403
@@ -102,38 +254,76 @@ class TestGitHubClient:
         mock_response.text = 'Rate limit exceeded'
         mock_get.return_value = mock_response
 
-        client = GitHubClient()
         release = client.get_latest_release()
 
         # Should return None on error (logged internally)
         assert release is None
 
     @patch('cli.utils.github.requests.Session.get')
-    def test_get_latest_release_not_found(self, mock_get):
+    def test_get_latest_release_not_found(self, mock_get, client):
         """Test handling 404 error."""
         mock_response = Mock()
         mock_response.status_code = 404
         mock_response.text = 'Not found'
         mock_get.return_value = mock_response
 
-        client = GitHubClient()
         release = client.get_latest_release()
 
         assert release is None
 
     @patch('cli.utils.github.requests.Session.get')
-    def test_get_latest_release_timeout(self, mock_get):
-        """Test handling timeout."""
+    def test_get_latest_release_timeout(self, mock_get, client):
+        """Test timeout falls back to an expired cached release."""
+        import time
+        from requests.exceptions import Timeout
+        mock_get.side_effect = Timeout()
+
+        endpoint = '/repos/vibery-studio/vibewp/releases/latest'
+        client._cache[f"request:{endpoint}"] = (time.monotonic() - 600, {
+            'tag_name': 'v0.9.0',
+            'name': 'Version 0.9.0',
+            'body': 'Stale',
+            'published_at': '2024-12-01T12:00:00Z',
+            'html_url': 'https://github.com/vibery-studio/vibewp/releases/tag/v0.9.0',
+            'prerelease': False,
+            'assets': []
+        }, None)
+
+        release = client.get_latest_release()
+
+        assert release is not None
+        assert release.version == '0.9.0'
+
+    @patch('cli.utils.github.requests.Session.get')
+    def test_timeout_no_cache_returns_none(self, mock_get, client):
+        """Test handling timeout with nothing cached."""
         from requests.exceptions import Timeout
         mock_get.side_effect = Timeout()
 
-        client = GitHubClient()
         release = client.get_latest_release()
 
         assert release is None
 
     @patch('cli.utils.github.requests.Session.get')
-    def test_get_all_releases(self, mock_get):
+    def test_server_error_without_stale_fallback(self, mock_get):
+        """Test 5xx is an error when stale fallback is disabled."""
+        import time
+        from requests.exceptions import HTTPError
+        mock_response = Mock()
+        mock_response.status_code = 502
+        mock_response.headers = {}
+        mock_response.raise_for_status.side_effect = HTTPError('502')
+        mock_get.return_value = mock_response
+
+        client = GitHubClient(stale_on_error=False)
+        endpoint = '/repos/vibery-studio/vibewp/releases/latest'
+        client._cache[f"request:{endpoint}"] = (time.monotonic() - 600, {'tag_name': 'v0.9.0'}, None)
+
+        with pytest.raises(GitHubAPIError):
+            client._make_request(endpoint)
+
+    @patch('cli.utils.github.requests.Session.get')
+    def test_get_all_releases(self, mock_get, client):
         """Test getting all releases."""
         mock_response = Mock()
         mock_response.status_code = 200
@@ -160,16 +350,48 @@ class TestGitHubClient:
         mock_response.headers = {}
         mock_get.return_value = mock_response
 
-        client = GitHubClient()
         releases = client.get_all_releases()
 
         assert len(releases) == 2
-        # Should be sorted by date, newest first
+        # Single page requested at the caller's limit, GitHub order kept
+        assert mock_get.call_args.args[0].endswith('/releases?per_page=10')
         assert releases[0].version == '1.1.0'
         assert releases[1].version == '1.0.0'
 
     @patch('cli.utils.github.requests.Session.get')
-    def test_get_release_by_tag(self, mock_get):
+    def test_get_all_releases_paginated(self, mock_get, client):
+        """Test releases beyond one page are fetched and merged newest first."""
+        def release(n, month):
+            return {
+                'tag_name': f'v1.{n}.0',
+                'name': f'Version 1.{n}.0',
+                'body': '',
+                'published_at': f'2025-{month:02d}-01T12:00:00Z',
+                'html_url': f'https://github.com/vibery-studio/vibewp/releases/tag/v1.{n}.0',
+                'prerelease': False,
+                'assets': []
+            }
+
+        page1 = [release(n, 12) for n in range(100, 0, -1)]
+        page2 = [release(0, 1)]
+
+        def page_response(url, **kwargs):
+            response = Mock()
+            response.status_code = 200
+            response.headers = {}
+            response.json.return_value = page2 if url.endswith('&page=2') else page1
+            return response
+
+        mock_get.side_effect = page_response
+
+        releases = client.get_all_releases(limit=150)
+
+        assert mock_get.call_count == 2
+        assert len(releases) == 101
+        assert releases[-1].version == '1.0.0'
+
+    @patch('cli.utils.github.requests.Session.get')
+    def test_get_release_by_tag(self, mock_get, client):
         """Test getting specific release by tag."""
         mock_response = Mock()
         mock_response.status_code = 200
@@ -185,14 +407,13 @@ class TestGitHubClient:
         mock_response.headers = {}
         mock_get.return_value = mock_response
 
-        client = GitHubClient()
         release = client.get_release_by_tag('1.0.0')
 
         assert release is not None
         assert release.version == '1.0.0'
 
     @patch('cli.utils.github.requests.Session.get')
-    def test_check_rate_limit(self, mock_get):
+    def test_check_rate_limit(self, mock_get, client):
         """Test checking rate limit."""
         mock_response = Mock()
         mock_response.status_code = 200
@@ -206,16 +427,13 @@ class TestGitHubClient:
         mock_response.headers = {}
         mock_get.return_value = mock_response
 
-        client = GitHubClient()
         rate_limit = client.check_rate_limit()
 
         assert rate_limit['limit'] == 60
         assert rate_limit['remaining'] == 59
 
-    def test_caching(self):
+    def test_caching(self, client):
         """Test response caching."""
-        client = GitHubClient()
-
         # Set cache
         client._set_cache('test_key', {'data': 'value'})
 
@@ -223,15 +441,71 @@ class TestGitHubClient:
         cached = client._get_cached('test_key')
         assert cached == {'data': 'value'}
 
-    def test_cache_expiration(self):
+    def test_cache_expiration(self, monkeypatch, client):
         """Test cache expiration."""
-        from datetime import timedelta
-        client = GitHubClient()
+        monkeypatch.setattr('cli.utils.github._now', lambda: 1000.0)
+        client._set_cache('test_key', {'data': 'value'})
 
-        # Set cache with old timestamp
-        old_time = datetime.now() - timedelta(minutes=10)
-        client._cache['test_key'] = (old_time, {'data': 'value'})
+        # Advance the clock past the 5 minute TTL
+        monkeypatch.setattr('cli.utils.github._now', lambda: 1000.0 + 301)
 
         # Should return None for expired cache
         cached = client._get_cached('test_key')
         assert cached is None
+
+    def test_cache_evicts_least_recently_used(self, client):
+        """Test cache stays bounded and evicts the least recently used key."""
+        for i in range(GitHubClient.CACHE_MAX_ENTRIES):
+            client._set_cache(f'key{i}', i)
+
+        client._get_cached('key0')  # Touch oldest so key1 becomes LRU
+        client._set_cache('overflow', 'new')
+
+        assert len(client._cache) == GitHubClient.CACHE_MAX_ENTRIES
+        assert 'key0' in client._cache
+        assert 'key1' not in client._cache
+
+    def test_cache_mutated_only_under_lock(self, monkeypatch):
+        """Test LRU reordering and eviction happen under the client lock (pages fetch in threads)."""
+        from collections import OrderedDict
+        monkeypatch.setattr(GitHubClient, 'CACHE_MAX_ENTRIES', 2)
+        client = GitHubClient()
+
+        class LockCheckingDict(OrderedDict):
+            def move_to_end(self, *args, **kwargs):
+                assert client._lock.locked()
+                return super().move_to_end(*args, **kwargs)
+
+            def popitem(self, *args, **kwargs):
+                assert client._lock.locked()
+                return super().popitem(*args, **kwargs)
+
+        client._cache = LockCheckingDict()
+        client._set_cache('a', 1, last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+        client._set_cache('b', 2)
+        client._get_cached('a')
+        client._alias_cache('a', 'c')  # evicts 'b'
+
+        assert list(client._cache) == ['a', 'c']
+        assert client._get_cache_entry('a')[1] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+    @patch('cli.utils.github.requests.Session.get')
+    def test_conditional_request_304(self, mock_get, client):
+        """Test expired entry is revalidated with its ETag and reused on 304."""
+        import time
+        endpoint = '/repos/vibery-studio/vibewp/releases/latest'
+        old_time = time.monotonic() - 600
+        client._cache[f"request:{endpoint}"] = (old_time, {'tag_name': 'v1.0.0'}, '"abc123"')
+
+        mock_response = Mock()
+        mock_response.status_code = 304
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        data = client._make_request(endpoint)
+
+        assert data == {'tag_name': 'v1.0.0'}
+        assert mock_get.call_args.kwargs['headers']['If-None-Match'] == '"abc123"'
+        mock_response.json.assert_not_called()
+        # Timestamp refreshed, so the entry is fresh again
+        assert client._get_cached(f"request:{endpoint}") == {'tag_name': 'v1.0.0'}
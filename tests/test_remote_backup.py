@@ -1,17 +1,31 @@
 """Tests for remote backup functionality."""
 
+import re
+import sys
+import tracemalloc
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from cli.utils.remote_backup import RemoteBackupManager
 from cli.utils.config import RemoteBackupConfig
 
 
+# Default rclone responses, first match wins; patterns are compiled once
+_DEFAULT_RESPONSES = [
+    (re.compile(r'which rclone'), (0, "/usr/bin/rclone", "")),
+    (re.compile(r'rclone listremotes'), (0, "vibewp-s3:\n", "")),
+    (re.compile(r'rclone lsd\b'), (0, "", "")),
+    (re.compile(r'rclone ls\b'), (0, "1048576 backup1.tar.gz\n2097152 backup2.tar.gz\n", "")),
+    (re.compile(r'rclone size\b'), (0, '{"bytes": 3145728}', "")),
+]
+
+
 class MockSSHManager:
     """Mock SSH manager for testing without VPS."""
 
     def __init__(self):
         self.connected = False
         self.commands_run = []
+        self.scripts_run = []
         self.mock_responses = {}
 
     def connect(self):
@@ -25,38 +39,59 @@ class MockSSHManager:
     def run_command(self, cmd):
         """Mock command execution."""
         self.commands_run.append(cmd)
+        return self._respond(cmd)
 
+    def run_command_stream(self, cmd, timeout=30):
+        """Mock streamed execution: yield stdout lines, raise on failure."""
+        self.commands_run.append(cmd)
+        exit_code, stdout, stderr = self._respond(cmd)
+        lines = stdout.split("\n") if isinstance(stdout, str) else stdout
+        for line in lines:
+            yield line
+        if exit_code != 0:
+            raise RuntimeError(f"Command exited with status {exit_code}: {stderr}")
+
+    def run_script(self, commands, timeout=60):
+        """Mock batched execution: one round-trip, one result per command."""
+        self.scripts_run.append(list(commands))
+        return [self._respond(cmd) for cmd in commands]
+
+    def _respond(self, cmd):
+        """Return the configured or default response for a command."""
         # Return mock responses based on command
         if cmd in self.mock_responses:
             return self.mock_responses[cmd]
 
         # Default responses
-        if "which rclone" in cmd:
-            return (0, "/usr/bin/rclone", "")
-        elif "rclone listremotes" in cmd:
-            return (0, "vibewp-s3:\n", "")
-        elif "rclone lsd" in cmd:
-            return (0, "", "")
-        elif "rclone ls" in cmd:
-            return (0, "1048576 backup1.tar.gz\n2097152 backup2.tar.gz\n", "")
-        elif "rclone size" in cmd:
-            return (0, '{"bytes": 3145728}', "")
-        else:
-            return (0, "", "")
+        for pattern, response in _DEFAULT_RESPONSES:
+            if pattern.search(cmd):
+                return response
+        return (0, "", "")
+
+
+@pytest.fixture(scope='class')
+def mock_ssh():
+    """Create mock SSH manager shared by a test class."""
+    return MockSSHManager()
+
+
+@pytest.fixture(scope='class')
+def backup_manager(mock_ssh):
+    """Create RemoteBackupManager with mock SSH."""
+    return RemoteBackupManager(mock_ssh)
 
 
 class TestRemoteBackupManager:
     """Test RemoteBackupManager class."""
 
-    @pytest.fixture
-    def mock_ssh(self):
-        """Create mock SSH manager."""
-        return MockSSHManager()
-
-    @pytest.fixture
-    def backup_manager(self, mock_ssh):
-        """Create RemoteBackupManager with mock SSH."""
-        return RemoteBackupManager(mock_ssh)
+    @pytest.fixture(autouse=True)
+    def _reset(self, mock_ssh, backup_manager):
+        """Clear recorded commands, canned responses and cached rclone checks."""
+        mock_ssh.commands_run.clear()
+        mock_ssh.scripts_run.clear()
+        mock_ssh.mock_responses.clear()
+        backup_manager.invalidate_rclone_cache()
+        yield
 
     def test_init(self, backup_manager):
         """Test initialization."""
@@ -74,6 +109,24 @@ class TestRemoteBackupManager:
         mock_ssh.mock_responses["which rclone"] = (1, "", "not found")
         assert backup_manager.check_rclone_installed() is False
 
+    def test_check_rclone_installed_memoized(self, backup_manager, mock_ssh):
+        """Test the install check runs one SSH command per manager."""
+        assert backup_manager.check_rclone_installed() is True
+        assert backup_manager.check_rclone_installed() is True
+        assert mock_ssh.commands_run.count("which rclone") == 1
+
+        backup_manager.invalidate_rclone_cache()
+        backup_manager.check_rclone_installed()
+        assert mock_ssh.commands_run.count("which rclone") == 2
+
+    def test_install_rclone_rechecks_installation(self, backup_manager, mock_ssh):
+        """Test a cached negative check doesn't fail verification after install."""
+        mock_ssh.mock_responses["which rclone"] = (1, "", "not found")
+        assert backup_manager.check_rclone_installed() is False
+
+        mock_ssh.mock_responses["which rclone"] = (0, "/usr/bin/rclone", "")
+        assert backup_manager.install_rclone() is True
+
     def test_check_rclone_configured_success(self, backup_manager, mock_ssh):
         """Test checking rclone configuration when configured."""
         assert backup_manager.check_rclone_configured() is True
@@ -114,9 +167,16 @@ class TestRemoteBackupManager:
         )
 
         assert result is True
-        # Check config write command was run
-        config_cmds = [cmd for cmd in mock_ssh.commands_run if "rclone.conf" in cmd]
-        assert len(config_cmds) > 0
+        # Remote is created with a single non-interactive rclone command
+        config_cmds = [
+            cmd for cmd in mock_ssh.commands_run if cmd.startswith("rclone config create")
+        ]
+        assert config_cmds == [
+            "rclone config create vibewp-s3 s3 provider=AWS access_key_id=AKIATEST"
+            " secret_access_key=secret123 region=us-east-1 acl=private"
+            " server_side_encryption=AES256 --non-interactive"
+        ]
+        assert not any("rclone.conf" in cmd for cmd in mock_ssh.commands_run)
 
     def test_configure_rclone_r2(self, backup_manager, mock_ssh):
         """Test configuring rclone for Cloudflare R2."""
@@ -129,6 +189,22 @@ class TestRemoteBackupManager:
         )
 
         assert result is True
+        assert mock_ssh.commands_run[0] == (
+            "rclone config create vibewp-s3 s3 provider=Cloudflare access_key_id=AKIATEST"
+            " secret_access_key=secret123 endpoint=https://account.r2.cloudflarestorage.com"
+            " acl=private server_side_encryption=AES256 --non-interactive"
+        )
+
+    def test_configure_rclone_quotes_secrets(self, backup_manager, mock_ssh):
+        """Test shell metacharacters in credentials are quoted."""
+        backup_manager.configure_rclone(
+            provider="s3",
+            bucket="test-bucket",
+            access_key="AKIATEST",
+            secret_key="se'cret $(id)"
+        )
+
+        assert "'secret_access_key=se'\"'\"'cret $(id)'" in mock_ssh.commands_run[0]
 
     def test_configure_rclone_test_failure(self, backup_manager, mock_ssh):
         """Test rclone configuration when test fails."""
@@ -146,19 +222,28 @@ class TestRemoteBackupManager:
 
     def test_sync_backup_to_remote(self, backup_manager, mock_ssh):
         """Test syncing backup to remote."""
-        sync_cmd = "rclone copy /path/to/backup.tar.gz vibewp-s3:test-bucket/backups/site1 --transfers 4 --checkers 8 --retries 3 --low-level-retries 10 --stats 30s --stats-one-line"
+        config = RemoteBackupConfig()
+        sync_cmd = (
+            "rclone copy /path/to/backup.tar.gz vibewp-s3:test-bucket/backups/site1"
+            " --transfers 4 --checkers 8 --retries 3 --low-level-retries 10"
+            " --multi-thread-streams 4 --multi-thread-cutoff 100M"
+            f" --s3-upload-concurrency {config.upload_concurrency}"
+            " --stats 30s --stats-one-line"
+        )
         mock_ssh.mock_responses[sync_cmd] = (0, "Transferred: 10MB", "")
 
         result = backup_manager.sync_backup_to_remote(
             local_backup_path="/path/to/backup.tar.gz",
             remote_path="backups/site1",
             bucket="test-bucket",
-            encryption=True
+            encryption=True,
+            upload_concurrency=config.upload_concurrency
         )
 
         assert result is True
+        assert mock_ssh.commands_run == [sync_cmd]
 
-    def test_sync_backup_failure(self, backup_manager, mock_ssh):
+    def test_sync_backup_failure(self, backup_manager, mock_ssh, monkeypatch):
         """Test backup sync failure."""
         # Mock all rclone copy commands to fail
         for cmd in mock_ssh.commands_run:
@@ -171,7 +256,7 @@ class TestRemoteBackupManager:
                 return (1, "", "Upload failed")
             return (0, "", "")
 
-        mock_ssh.run_command = run_command_with_fail
+        monkeypatch.setattr(mock_ssh, 'run_command', run_command_with_fail)
 
         with pytest.raises(RuntimeError, match="Backup sync failed"):
             backup_manager.sync_backup_to_remote(
@@ -192,6 +277,22 @@ class TestRemoteBackupManager:
         assert backups[0]['size'] == '1048576'
         assert backups[1]['filename'] == 'backup2.tar.gz'
 
+    def test_list_remote_backups_padded_output(self, backup_manager, mock_ssh):
+        """Test parsing rclone's right-aligned sizes and names with spaces."""
+        mock_ssh.mock_responses[
+            "rclone ls vibewp-s3:test-bucket/backups"
+        ] = (0, "     1024 site1/old backup.tar.gz\n  2097152 site2/backup.tar.gz\n\n", "")
+
+        backups = backup_manager.list_remote_backups(
+            bucket="test-bucket",
+            remote_path="backups"
+        )
+
+        assert backups == [
+            {'filename': 'site1/old backup.tar.gz', 'size': '1024'},
+            {'filename': 'site2/backup.tar.gz', 'size': '2097152'},
+        ]
+
     def test_list_remote_backups_empty(self, backup_manager, mock_ssh):
         """Test listing when no backups exist."""
         mock_ssh.mock_responses[
@@ -205,6 +306,42 @@ class TestRemoteBackupManager:
 
         assert backups == []
 
+    def test_list_remote_backups_streaming(self, backup_manager, mock_ssh):
+        """Test large listings are parsed line by line as they stream."""
+        count = 20000
+        full_stdout = "\n".join(f"{i + 1} site/backup_{i}.tar.gz" for i in range(count))
+        mock_ssh.mock_responses[
+            "rclone ls vibewp-s3:test-bucket/backups"
+        ] = (0, (f"{i + 1} site/backup_{i}.tar.gz" for i in range(count)), "")
+
+        tracemalloc.start()
+        try:
+            backups = backup_manager.list_remote_backups(
+                bucket="test-bucket",
+                remote_path="backups"
+            )
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(backups) == count
+        assert backups[-1] == {'filename': f'site/backup_{count - 1}.tar.gz', 'size': str(count)}
+        # Beyond the parsed result, nothing the size of the whole output was held
+        assert peak - current < sys.getsizeof(full_stdout)
+
+    def test_list_remote_backups_stream_failure(self, backup_manager, mock_ssh):
+        """Test a listing failing after partial output returns nothing."""
+        mock_ssh.mock_responses[
+            "rclone ls vibewp-s3:test-bucket/backups"
+        ] = (1, "1024 backup1.tar.gz", "connection reset")
+
+        backups = backup_manager.list_remote_backups(
+            bucket="test-bucket",
+            remote_path="backups"
+        )
+
+        assert backups == []
+
     def test_list_remote_backups_error(self, backup_manager, mock_ssh):
         """Test listing backups with error."""
         mock_ssh.mock_responses[
@@ -230,15 +367,17 @@ class TestRemoteBackupManager:
         cleanup_cmd = [cmd for cmd in mock_ssh.commands_run if "rclone delete" in cmd]
         assert len(cleanup_cmd) > 0
         assert "--min-age 30d" in cleanup_cmd[0]
+        assert "--fast-list" in cleanup_cmd[0]
+        assert len(mock_ssh.commands_run) == 1
 
-    def test_cleanup_failure(self, backup_manager, mock_ssh):
+    def test_cleanup_failure(self, backup_manager, mock_ssh, monkeypatch):
         """Test cleanup failure handling."""
         def run_command_fail(cmd):
             if "rclone delete" in cmd:
                 return (1, "", "Delete failed")
             return (0, "", "")
 
-        mock_ssh.run_command = run_command_fail
+        monkeypatch.setattr(mock_ssh, 'run_command', run_command_fail)
 
         result = backup_manager.cleanup_old_backups(
             bucket="test-bucket",
@@ -270,6 +409,32 @@ class TestRemoteBackupManager:
 
         assert size == "Unknown"
 
+    def test_get_backup_summary_single_round_trip(self, backup_manager, mock_ssh):
+        """Test listing and sizing remote backups share one SSH round-trip."""
+        summary = backup_manager.get_backup_summary(
+            bucket="test-bucket",
+            remote_path="backups"
+        )
+
+        assert mock_ssh.scripts_run == [[
+            "rclone ls vibewp-s3:test-bucket/backups",
+            "rclone size vibewp-s3:test-bucket/backups --json",
+        ]]
+        assert mock_ssh.commands_run == []
+        assert [b['filename'] for b in summary['backups']] == ['backup1.tar.gz', 'backup2.tar.gz']
+        assert summary['total_size'] == "3.00 MB"
+
+    def test_get_backup_summary_size_error(self, backup_manager, mock_ssh):
+        """Test a failed size lookup does not discard the listing."""
+        mock_ssh.mock_responses[
+            "rclone size vibewp-s3:test-bucket/backups --json"
+        ] = (1, "", "Error")
+
+        summary = backup_manager.get_backup_summary(bucket="test-bucket")
+
+        assert len(summary['backups']) == 2
+        assert summary['total_size'] == "Unknown"
+
     def test_get_rclone_provider_mapping(self):
         """Test provider name mapping."""
         from cli.utils.remote_backup import RemoteBackupManager
@@ -325,6 +490,11 @@ class TestRemoteBackupConfig:
                 secret_key="secret123"
             )
 
+    def test_invalid_enabled_with_default_credentials(self):
+        """Test validation fails when enabled and credentials are omitted."""
+        with pytest.raises(ValueError, match="required when remote backup is enabled"):
+            RemoteBackupConfig(enabled=True, bucket="test-bucket")
+
     def test_invalid_retention_negative(self):
         """Test validation fails for negative retention."""
         with pytest.raises(ValueError, match="retention_days must be >= 0"):
@@ -335,6 +505,13 @@ class TestRemoteBackupConfig:
         with pytest.raises(ValueError, match="retention_days cannot exceed 3650"):
             RemoteBackupConfig(retention_days=5000)
 
+    def test_invalid_upload_concurrency(self):
+        """Test validation fails for upload concurrency outside 1..32."""
+        with pytest.raises(ValueError, match="upload_concurrency must be between 1 and 32"):
+            RemoteBackupConfig(upload_concurrency=0)
+        with pytest.raises(ValueError, match="upload_concurrency must be between 1 and 32"):
+            RemoteBackupConfig(upload_concurrency=64)
+
     def test_retention_zero_allowed(self):
         """Test retention_days=0 is allowed (no cleanup)."""
         config = RemoteBackupConfig(retention_days=0)
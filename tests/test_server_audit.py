@@ -1,14 +1,120 @@
 """Unit tests for server security audit components."""
 
+import re
+import threading
+import time
 import pytest
-from unittest.mock import Mock, MagicMock, patch, call
+from unittest.mock import Mock, MagicMock, patch, call, create_autospec
 from datetime import datetime
+import copy
 import json
-from cli.utils.system_auditor import SystemAuditor
-from cli.utils.wordpress_auditor import WordPressAuditor
+import pickle
+from cli.utils.system_auditor import SystemAuditor, FindingTemplate
+from cli.utils.wordpress_auditor import WordPressAuditor, SiteContext
 from cli.utils.vulnerability_scanner import VulnerabilityScanner
 from cli.utils.audit_report import ReportGenerator
 from cli.utils.server_audit import ServerAuditManager
+from cli.utils.ssh import SSHManager
+from cli.utils import jsonio
+
+
+_SECURE_SSH_CONFIG = """
+Port 2222
+PermitRootLogin no
+PasswordAuthentication no
+PubkeyAuthentication yes
+Protocol 2
+"""
+
+_UFW_ACTIVE_STATUS = """Status: active
+Default: deny (incoming), allow (outgoing)
+
+To                         Action      From
+--                         ------      ----
+22/tcp                     ALLOW       Anywhere
+80/tcp                     ALLOW       Anywhere
+443/tcp                    ALLOW       Anywhere
+"""
+
+# Output names in the order WordPressAuditor._site_commands issues them
+_SITE_PROBES = (
+    'core_version', 'core_updates', 'config_perms', 'uploads_perms',
+    'config', 'plugins', 'themes', 'users'
+)
+
+# run_script results for a healthy, up-to-date site
+_BASELINE_WP_RESPONSES = (
+    (0, "6.5.0", ""),
+    (0, "[]", ""),
+    (0, "600", ""),
+    (0, "755", ""),
+    (0, "define('WP_DEBUG', false);", ""),
+    (0, "[]", ""),
+    (0, "[]", ""),
+    (0, "[]", ""),
+)
+
+
+# run_script results when only 'wp core version' succeeds
+_CORE_ONLY_WP_RESPONSES = ((0, "6.5.0", ""),) + ((1, "", ""),) * (len(_SITE_PROBES) - 1)
+
+
+def _site_responses(**overrides):
+    """Baseline site probe results with the named probes replaced (copy on write)."""
+    if not overrides:
+        return _BASELINE_WP_RESPONSES
+    responses = list(_BASELINE_WP_RESPONSES)
+    for name, response in overrides.items():
+        responses[_SITE_PROBES.index(name)] = response
+    return responses
+
+
+# Responses for a running fail2ban with an sshd jail, keyed by command regex
+_FAIL2BAN_ACTIVE_TABLE = {
+    r'^which fail2ban-client': (0, "/usr/bin/fail2ban-client", ""),
+    r'is-active fail2ban': (0, "active", ""),
+    r'fail2ban-client status': (0, "Jail list: sshd, apache-auth", ""),
+}
+
+
+def _route(ssh, table):
+    """Answer run_command/run_script from the first regex in table matching each command."""
+    routes = [(re.compile(pattern), response) for pattern, response in table.items()]
+
+    def run_command(cmd, *args, **kwargs):
+        for pattern, response in routes:
+            if pattern.search(cmd):
+                return response
+        return (0, "", "")
+
+    ssh.run_command.side_effect = run_command
+    ssh.run_script.side_effect = lambda cmds, *args, **kwargs: [run_command(c) for c in cmds]
+    return ssh
+
+
+def _finding_ids(findings):
+    """Index findings by ID once so each assertion is a set lookup."""
+    return {f['id'] for f in findings}
+
+
+def _reset_ssh(ssh):
+    """Clear recorded calls and configured results on a shared SSH mock."""
+    ssh.reset_mock()
+    for method in (ssh.run_command, ssh.run_script):
+        method.reset_mock(return_value=True, side_effect=True)
+    return ssh
+
+
+@pytest.fixture(scope="module")
+def shared_ssh():
+    """SSHManager autospec shared by the module's tests; reset before each test."""
+    return create_autospec(SSHManager, instance=True)
+
+
+@pytest.fixture(scope="module")
+def system_auditor(shared_ssh):
+    """SystemAuditor holding no state beyond the shared SSH mock."""
+    return SystemAuditor(shared_ssh)
 
 
 # ============================================================================
@@ -19,26 +125,18 @@ class TestSystemAuditor:
     """Test SystemAuditor class methods."""
 
     @pytest.fixture
-    def mock_ssh(self):
-        """Create mock SSH manager."""
-        ssh = Mock()
-        return ssh
+    def mock_ssh(self, shared_ssh):
+        """Reset the shared SSH mock for this test."""
+        return _reset_ssh(shared_ssh)
 
     @pytest.fixture
-    def auditor(self, mock_ssh):
-        """Create SystemAuditor instance."""
-        return SystemAuditor(mock_ssh)
+    def auditor(self, system_auditor, mock_ssh):
+        """Shared SystemAuditor instance."""
+        return system_auditor
 
     def test_audit_ssh_config_secure(self, auditor, mock_ssh):
         """Test SSH config audit with secure configuration."""
-        ssh_config = """
-Port 2222
-PermitRootLogin no
-PasswordAuthentication no
-PubkeyAuthentication yes
-Protocol 2
-"""
-        mock_ssh.run_command.return_value = (0, ssh_config, "")
+        mock_ssh.run_command.return_value = (0, _SECURE_SSH_CONFIG, "")
 
         result = auditor.audit_ssh_config()
 
@@ -56,7 +154,7 @@ Protocol 2
         result = auditor.audit_ssh_config()
 
         findings = result['findings']
-        assert any(f['id'] == 'SSH-001' for f in findings)
+        assert 'SSH-001' in _finding_ids(findings)
         assert any('Root login enabled' in f['title'] for f in findings)
         assert any(f['severity'] == 'high' for f in findings)
 
@@ -68,7 +166,7 @@ Protocol 2
         result = auditor.audit_ssh_config()
 
         findings = result['findings']
-        assert any(f['id'] == 'SSH-002' for f in findings)
+        assert 'SSH-002' in _finding_ids(findings)
         assert any('Password authentication enabled' in f['title'] for f in findings)
 
     def test_audit_ssh_config_default_port(self, auditor, mock_ssh):
@@ -79,7 +177,7 @@ Protocol 2
         result = auditor.audit_ssh_config()
 
         findings = result['findings']
-        assert any(f['id'] == 'SSH-003' for f in findings)
+        assert 'SSH-003' in _finding_ids(findings)
         assert any('Default SSH port' in f['title'] for f in findings)
         assert any(f['severity'] == 'medium' for f in findings)
 
@@ -91,7 +189,7 @@ Protocol 2
         result = auditor.audit_ssh_config()
 
         findings = result['findings']
-        assert any(f['id'] == 'SSH-005' for f in findings)
+        assert 'SSH-005' in _finding_ids(findings)
         assert any(f['severity'] == 'critical' for f in findings)
 
     def test_audit_ssh_config_read_error(self, auditor, mock_ssh):
@@ -105,16 +203,7 @@ Protocol 2
 
     def test_audit_firewall_active(self, auditor, mock_ssh):
         """Test firewall audit with active UFW."""
-        ufw_status = """Status: active
-Default: deny (incoming), allow (outgoing)
-
-To                         Action      From
---                         ------      ----
-22/tcp                     ALLOW       Anywhere
-80/tcp                     ALLOW       Anywhere
-443/tcp                    ALLOW       Anywhere
-"""
-        mock_ssh.run_command.return_value = (0, ufw_status, "")
+        mock_ssh.run_command.return_value = (0, _UFW_ACTIVE_STATUS, "")
 
         result = auditor.audit_firewall()
 
@@ -130,7 +219,7 @@ To                         Action      From
         result = auditor.audit_firewall()
 
         findings = result['findings']
-        assert any(f['id'] == 'FW-002' for f in findings)
+        assert 'FW-002' in _finding_ids(findings)
         assert any(f['severity'] == 'critical' for f in findings)
 
     def test_audit_firewall_not_installed(self, auditor, mock_ssh):
@@ -140,16 +229,12 @@ To                         Action      From
         result = auditor.audit_firewall()
 
         findings = result['findings']
-        assert any(f['id'] == 'FW-001' for f in findings)
+        assert 'FW-001' in _finding_ids(findings)
         assert any('UFW not installed' in f['title'] for f in findings)
 
     def test_audit_fail2ban_active(self, auditor, mock_ssh):
         """Test fail2ban audit with active service."""
-        mock_ssh.run_command.side_effect = [
-            (0, "/usr/bin/fail2ban-client", ""),  # which fail2ban-client
-            (0, "active", ""),  # systemctl is-active
-            (0, "Jail list: sshd, apache-auth", "")  # fail2ban-client status
-        ]
+        _route(mock_ssh, _FAIL2BAN_ACTIVE_TABLE)
 
         result = auditor.audit_fail2ban()
 
@@ -164,21 +249,20 @@ To                         Action      From
         result = auditor.audit_fail2ban()
 
         findings = result['findings']
-        assert any(f['id'] == 'F2B-001' for f in findings)
+        assert 'F2B-001' in _finding_ids(findings)
         assert any('fail2ban not installed' in f['title'] for f in findings)
 
     def test_audit_fail2ban_missing_sshd_jail(self, auditor, mock_ssh):
         """Test fail2ban without sshd jail configured."""
-        mock_ssh.run_command.side_effect = [
-            (0, "/usr/bin/fail2ban-client", ""),
-            (0, "active", ""),
-            (0, "Jail list: apache-auth", "")  # No sshd
-        ]
+        _route(mock_ssh, {
+            **_FAIL2BAN_ACTIVE_TABLE,
+            r'fail2ban-client status': (0, "Jail list: apache-auth", ""),  # No sshd
+        })
 
         result = auditor.audit_fail2ban()
 
         findings = result['findings']
-        assert any(f['id'] == 'F2B-003' for f in findings)
+        assert 'F2B-003' in _finding_ids(findings)
         assert any('SSH jail not configured' in f['title'] for f in findings)
 
     def test_audit_open_ports_risky_exposed(self, auditor, mock_ssh):
@@ -210,9 +294,20 @@ vsftpd.service    loaded active running FTP Server
         assert any('telnet' in f['title'].lower() for f in findings)
         assert any('vsftpd' in f['title'].lower() for f in findings)
 
+    def test_audit_services_matches_whole_unit_names(self, auditor, mock_ssh):
+        """Test services are matched by unit name, not by substring."""
+        systemctl_output = """harsh-monitor.service  loaded active running Monitor
+telnet@0-10.0.0.1:23.service loaded active running Telnet
+"""
+        mock_ssh.run_command.return_value = (0, systemctl_output, "")
+
+        result = auditor.audit_services()
+
+        assert [f['id'] for f in result['findings']] == ['SVC-TELNET']
+
     def test_audit_users_no_password(self, auditor, mock_ssh):
         """Test user audit with accounts without password."""
-        mock_ssh.run_command.side_effect = [
+        mock_ssh.run_script.return_value = [
             (0, "user1,user2", ""),  # sudo users
             (0, "user1:x:1000\nuser2:x:1001", ""),  # login users
             (0, "testuser", "")  # users without password
@@ -221,95 +316,140 @@ vsftpd.service    loaded active running FTP Server
         result = auditor.audit_users()
 
         findings = result['findings']
+        mock_ssh.run_script.assert_called_once()
+        mock_ssh.run_command.assert_not_called()
+        assert result['sudo_users'] == ['user1', 'user2']
+        assert result['login_users'] == ['user1', 'user2']
         assert any('testuser' in f['id'] for f in findings)
         assert any('without password' in f['title'] for f in findings)
 
     def test_audit_updates_security_available(self, auditor, mock_ssh):
         """Test updates audit with security updates available."""
-        mock_ssh.run_command.side_effect = [
-            (0, "", ""),  # apt-get update
-            (0, "15", ""),  # total upgradable
-            (0, "5", "")  # security updates
-        ]
+        _route(mock_ssh, {
+            r'grep -i security': (0, "5", ""),  # security updates
+            r'apt list --upgradable': (0, "15", ""),  # total upgradable
+        })
 
         result = auditor.audit_updates()
 
         findings = result['findings']
         assert result['total_updates'] == 15
         assert result['security_updates'] == 5
-        assert any(f['id'] == 'UPD-001' for f in findings)
+        assert 'UPD-001' in _finding_ids(findings)
         assert any(f['severity'] == 'high' for f in findings)
 
     def test_audit_logs_failed_ssh_attempts(self, auditor, mock_ssh):
         """Test log analysis with many failed SSH attempts."""
-        mock_ssh.run_command.side_effect = [
-            (0, "150", ""),  # Failed SSH attempts
-            (0, "sudo command output", "")  # Recent sudo
-        ]
+        mock_ssh.run_command.return_value = (
+            0,
+            "150\nIP 203.0.113.7 40\nIP 198.51.100.2 110\nSUDO Jan 10 host sudo: admin : COMMAND=/bin/ls",
+            ""
+        )
 
         result = auditor.audit_logs()
 
         findings = result['findings']
+        assert mock_ssh.run_command.call_count == 1
         assert result['failed_ssh_attempts'] == 150
-        assert any(f['id'] == 'LOG-001' for f in findings)
+        assert result['ssh_offenders'] == [
+            {'ip': '198.51.100.2', 'attempts': 110},
+            {'ip': '203.0.113.7', 'attempts': 40},
+        ]
+        assert result['recent_sudo'] == ['Jan 10 host sudo: admin : COMMAND=/bin/ls']
+        assert 'LOG-001' in _finding_ids(findings)
         assert any('brute-force' in f['impact'] for f in findings)
 
     def test_audit_filesystem_permissions_incorrect(self, auditor, mock_ssh):
         """Test filesystem permissions with incorrect perms."""
-        def mock_stat_command(cmd, *args, **kwargs):
-            if '/etc/shadow' in cmd:
-                return (0, "644", "")  # Wrong permissions
-            return (0, "644", "")
-
-        mock_ssh.run_command.side_effect = mock_stat_command
+        mock_ssh.run_command.return_value = (
+            1,
+            "/etc/passwd 644\n/etc/shadow 644\n/etc/group 644\n/etc/ssh/sshd_config 600",  # shadow is wrong
+            ""
+        )
 
         result = auditor.audit_filesystem_permissions()
 
         findings = result['findings']
-        assert len(findings) > 0
-        assert any('/etc/shadow' in f['title'] for f in findings)
+        assert mock_ssh.run_command.call_count == 1
+        assert [f['title'] for f in findings] == ['Incorrect permissions on /etc/shadow']
+
+    def test_finding_templates_emit_fresh_dicts(self, auditor, mock_ssh):
+        """Test templated findings are filled per hit and safe to mutate."""
+        mock_ssh.run_command.return_value = (0, "/etc/shadow 644", "")
+
+        first = auditor.audit_filesystem_permissions()['findings'][0]
+        first['category'] = 'System: Filesystem'
+        second = auditor.audit_filesystem_permissions()['findings'][0]
+
+        assert second == {
+            'id': 'FS--etc-shadow',
+            'severity': 'medium',
+            'title': 'Incorrect permissions on /etc/shadow',
+            'description': '/etc/shadow has permissions 644, expected 640',
+            'impact': 'Sensitive file may be accessible to unauthorized users',
+            'remediation': 'Fix permissions: sudo chmod 640 /etc/shadow',
+            'auto_fix': None
+        }
 
-    def test_parse_ssh_config(self, auditor):
+    @pytest.mark.pure
+    def test_parse_ssh_config(self, system_auditor):
         """Test SSH config parsing."""
         config = """Port 2222
 PermitRootLogin no
 # Comment line
 PasswordAuthentication no
 """
-        result = auditor._parse_ssh_config(config)
+        result = system_auditor._parse_ssh_config(config)
 
         assert result['port'] == '2222'
         assert result['permitrootlogin'] == 'no'
         assert result['passwordauthentication'] == 'no'
 
-    def test_parse_ufw_rules(self, auditor):
+    @pytest.mark.pure
+    def test_parse_ufw_rules(self, system_auditor):
         """Test UFW rules parsing."""
         status = """To                         Action      From
 --                         ------      ----
 22/tcp                     ALLOW       Anywhere
 80/tcp                     DENY        192.168.1.0/24
 """
-        result = auditor._parse_ufw_rules(status)
+        result = system_auditor._parse_ufw_rules(status)
 
         assert len(result) == 2
         assert result[0]['to'] == '22/tcp'
         assert result[0]['action'] == 'ALLOW'
 
-    def test_parse_ss_output(self, auditor):
+    @pytest.mark.pure
+    def test_parse_ss_output(self, system_auditor):
         """Test ss output parsing."""
         output = """tcp   LISTEN 0      128        127.0.0.1:3306        0.0.0.0:*    users:(("mysqld",pid=1234))
 tcp   LISTEN 0      128          0.0.0.0:80          0.0.0.0:*    users:(("nginx",pid=5678))
 """
-        result = auditor._parse_ss_output(output)
+        result = system_auditor._parse_ss_output(output)
 
         assert len(result) == 2
         assert result[0]['port'] == '3306'
         assert result[0]['address'] == '127.0.0.1'
         assert result[1]['port'] == '80'
 
+    @pytest.mark.pure
+    def test_parse_ss_output_ipv6_and_missing_process(self, system_auditor):
+        """Test ss parsing strips IPv6 brackets and defaults the process."""
+        output = """tcp   LISTEN 0      128             [::]:22             [::]:*    users:(("sshd",pid=1234))
+udp   UNCONN 0      0      127.0.0.53%lo:53          0.0.0.0:*
+malformed line
+"""
+        result = system_auditor._parse_ss_output(output)
+
+        assert result == [
+            {'protocol': 'tcp', 'address': '::', 'port': '22', 'process': 'users:(("sshd",pid=1234))'},
+            {'protocol': 'udp', 'address': '127.0.0.53%lo', 'port': '53', 'process': 'unknown'},
+        ]
+
     def test_audit_all_comprehensive(self, auditor, mock_ssh):
         """Test audit_all runs all checks."""
         mock_ssh.run_command.return_value = (0, "", "")
+        mock_ssh.run_script.side_effect = lambda cmds, *args, **kwargs: [(0, "", "")] * len(cmds)
 
         result = auditor.audit_all()
 
@@ -325,6 +465,25 @@ tcp   LISTEN 0      128          0.0.0.0:80          0.0.0.0:*    users:(("nginx
         assert 'timestamp' in result
 
 
+    def test_audit_all_concurrent_matches_sequential(self, auditor, mock_ssh):
+        """Test concurrent audit_all returns the same results as one worker."""
+        _route(mock_ssh, {
+            r'cat /etc/ssh/sshd_config': (0, "PermitRootLogin yes\nPort 22", ""),
+            r'ss -tulnp': (0, "tcp LISTEN 0 80 0.0.0.0:3306 0.0.0.0:* users:((\"mysqld\"))", ""),
+        })
+
+        concurrent = auditor.audit_all()
+        sequential = auditor.audit_all(max_workers=1)
+
+        concurrent.pop('timestamp')
+        sequential.pop('timestamp')
+        assert concurrent == sequential
+        assert list(concurrent) == [
+            'ssh', 'firewall', 'fail2ban', 'ports', 'services',
+            'users', 'updates', 'logs', 'filesystem'
+        ]
+        assert 'PORT-3306' in _finding_ids(concurrent['ports']['findings'])
+
 # ============================================================================
 # WordPressAuditor Tests
 # ============================================================================
@@ -333,9 +492,9 @@ class TestWordPressAuditor:
     """Test WordPressAuditor class methods."""
 
     @pytest.fixture
-    def mock_ssh(self):
-        """Create mock SSH manager."""
-        return Mock()
+    def mock_ssh(self, shared_ssh):
+        """Reset the shared SSH mock for this test."""
+        return _reset_ssh(shared_ssh)
 
     @pytest.fixture
     def mock_config(self):
@@ -372,11 +531,11 @@ class TestWordPressAuditor:
 
     def test_audit_core_version_outdated(self, auditor, mock_ssh):
         """Test WordPress core version audit with outdated version."""
-        mock_ssh.run_command.side_effect = [
-            (0, "testsite-wp", ""),  # Container check
-            (0, "6.2.0", ""),  # WP version
-            (0, '[{"version":"6.5.0"}]', "")  # Updates available
-        ]
+        mock_ssh.run_command.return_value = (0, "testsite-wp", "")  # Container check
+        mock_ssh.run_script.return_value = _site_responses(
+            core_version=(0, "6.2.0", ""),
+            core_updates=(0, '[{"version":"6.5.0"}]', ""),  # Updates available
+        )
 
         result = auditor.audit_site("testsite", "test.com", "frankenwp")
 
@@ -386,11 +545,8 @@ class TestWordPressAuditor:
 
     def test_audit_core_version_critically_outdated(self, auditor, mock_ssh):
         """Test WordPress with critically outdated version."""
-        mock_ssh.run_command.side_effect = [
-            (0, "testsite-wp", ""),
-            (0, "5.8.0", ""),  # Very old version
-            (0, "[]", "")
-        ]
+        mock_ssh.run_command.return_value = (0, "testsite-wp", "")  # Container check
+        mock_ssh.run_script.return_value = _site_responses(core_version=(0, "5.8.0", ""))  # Very old version
 
         result = auditor.audit_site("testsite", "test.com", "frankenwp")
 
@@ -398,21 +554,29 @@ class TestWordPressAuditor:
         assert any('critically outdated' in f['title'].lower() for f in findings)
         assert any(f['severity'] == 'critical' for f in findings)
 
+    def test_audit_core_version_failure_skips_wpcli_audits(self, auditor, mock_ssh):
+        """Test plugin/theme/user audits are skipped when wp-cli is unusable."""
+        mock_ssh.run_command.return_value = (0, "testsite-wp", "")  # Container check
+        mock_ssh.run_script.return_value = _site_responses(
+            core_version=(1, "", ""),  # WP version check fails
+            core_updates=(1, "", ""),
+            config_perms=(0, "644", ""),  # wp-config.php perms - INSECURE
+            plugins=(1, "", ""),
+            themes=(1, "", ""),
+            users=(0, '[{"user_login":"admin","roles":"administrator"}]', ""),  # would report a default admin user
+        )
+
+        result = auditor.audit_site("testsite", "test.com", "frankenwp")
+
+        ids = [f['id'] for f in result['findings']]
+        assert 'WP-testsite-CORE-001' in ids
+        assert 'WP-testsite-PERM-001' in ids
+        assert not any(i.startswith(('WP-testsite-PLG', 'WP-testsite-THM', 'WP-testsite-USR')) for i in ids)
+
     def test_audit_file_permissions_insecure_wp_config(self, auditor, mock_ssh):
         """Test file permissions with insecure wp-config.php."""
-        mock_ssh.run_command.side_effect = [
-            (0, "testsite-wp", ""),  # Container running
-            (0, "6.5.0", ""),  # WP version
-            (0, "[]", ""),  # No updates
-            (0, "644", ""),  # wp-config.php perms - INSECURE
-            (0, "755", ""),  # uploads perms
-            (0, "define('WP_DEBUG', false);", ""),  # wp-config content
-            (0, "[]", ""),  # plugins
-            (0, "0", ""),  # plugin updates
-            (0, "0", ""),  # theme updates
-            (0, "[]", ""),  # themes
-            (0, "2", ""),  # admin count
-        ]
+        mock_ssh.run_command.return_value = (0, "testsite-wp", "")  # Container check
+        mock_ssh.run_script.return_value = _site_responses(config_perms=(0, "644", ""))  # wp-config.php perms - INSECURE
 
         result = auditor.audit_site("testsite", "test.com", "frankenwp")
 
@@ -423,41 +587,46 @@ class TestWordPressAuditor:
     def test_audit_wp_config_debug_enabled(self, auditor, mock_ssh):
         """Test wp-config audit with WP_DEBUG enabled."""
         wp_config = "define('WP_DEBUG', true);"
-        mock_ssh.run_command.side_effect = [
-            (0, "testsite-wp", ""),
-            (0, "6.5.0", ""),
-            (0, "[]", ""),
-            (0, "600", ""),
-            (0, "755", ""),
-            (0, wp_config, ""),  # wp-config with debug
-            (0, "[]", ""),
-            (0, "0", ""),
-            (0, "0", ""),
-            (0, "[]", ""),
-            (0, "2", ""),
-        ]
+        mock_ssh.run_command.return_value = (0, "testsite-wp", "")  # Container check
+        mock_ssh.run_script.return_value = _site_responses(config=(0, wp_config, ""))  # wp-config with debug
 
         result = auditor.audit_site("testsite", "test.com", "frankenwp")
 
         findings = result['findings']
         assert any('Debug mode enabled' in f['title'] for f in findings)
 
+    def test_audit_wp_config_file_edit_disabled_false(self, auditor, mock_ssh):
+        """Test DISALLOW_FILE_EDIT set to false is reported."""
+        outputs = {'config': (0, "define('DISALLOW_FILE_EDIT', false);", "")}
+        ctx = SiteContext.for_site("testsite", "test.com", "frankenwp")
+
+        findings = auditor._audit_wp_config(ctx, outputs)
+
+        assert 'WP-testsite-CFG-004' in _finding_ids(findings)
+
+    def test_audit_wp_config_file_edit_disabled_true(self, auditor, mock_ssh):
+        """Test DISALLOW_FILE_EDIT set to true is not reported."""
+        outputs = {'config': (0, "define( 'DISALLOW_FILE_EDIT', TRUE );", "")}
+        ctx = SiteContext.for_site("testsite", "test.com", "frankenwp")
+
+        findings = auditor._audit_wp_config(ctx, outputs)
+
+        assert 'WP-testsite-CFG-004' not in _finding_ids(findings)
+
+    @pytest.mark.parametrize("value", [
+        SiteContext.for_site("testsite", "test.com", "ols"),
+        FindingTemplate('FW-003', 'medium', 'Port {port}', 'd', 'i', 'r', None),
+    ], ids=["site_context", "finding_template"])
+    def test_slotted_dataclasses_copy_and_pickle(self, value):
+        """Test frozen slotted dataclasses survive deepcopy and pickle."""
+        assert copy.deepcopy(value) == value
+        assert pickle.loads(pickle.dumps(value)) == value
+
     def test_audit_wp_config_default_security_keys(self, auditor, mock_ssh):
         """Test wp-config with default security keys."""
         wp_config = "define('AUTH_KEY', 'put your unique phrase here');"
-        mock_ssh.run_command.side_effect = [
-            (0, "testsite-wp", ""),
-            (0, "6.5.0", ""),
-            (0, "[]", ""),
-            (0, "600", ""),
-            (0, "755", ""),
-            (0, wp_config, ""),
-            (0, "[]", ""),
-            (0, "0", ""),
-            (0, "0", ""),
-            (0, "[]", ""),
-            (0, "2", ""),
-        ]
+        mock_ssh.run_command.return_value = (0, "testsite-wp", "")  # Container check
+        mock_ssh.run_script.return_value = _site_responses(config=(0, wp_config, ""))
 
         result = auditor.audit_site("testsite", "test.com", "frankenwp")
 
@@ -465,43 +634,49 @@ class TestWordPressAuditor:
         assert any('Default security keys' in f['title'] for f in findings)
         assert any(f['severity'] == 'critical' for f in findings)
 
+    @pytest.mark.parametrize("wp_config, expected", [
+        ("define( 'NONCE_SALT', '' );", True),
+        ('define("AUTH_KEY", "PUT YOUR UNIQUE PHRASE HERE");', True),
+        ("define('AUTH_KEY', 'k3y-put your unique phrase here');", False),
+    ])
+    def test_audit_wp_config_default_key_values(self, auditor, wp_config, expected):
+        """Test empty and sample key values are both reported as defaults."""
+        ctx = SiteContext.for_site("testsite", "test.com", "frankenwp")
+
+        findings = auditor._audit_wp_config(ctx, {'config': (0, wp_config, "")})
+
+        assert ('WP-testsite-CFG-003' in _finding_ids(findings)) is expected
+
     def test_audit_plugins_many_inactive(self, auditor, mock_ssh):
         """Test plugin audit with many inactive plugins."""
         plugins_json = '[' + ','.join(['{"status":"inactive"}'] * 8) + ']'
-        mock_ssh.run_command.side_effect = [
-            (0, "testsite-wp", ""),
-            (0, "6.5.0", ""),
-            (0, "[]", ""),
-            (0, "600", ""),
-            (0, "755", ""),
-            (0, "define('WP_DEBUG', false);", ""),
-            (0, plugins_json, ""),  # 8 inactive plugins
-            (0, "0", ""),
-            (0, "0", ""),
-            (0, "[]", ""),
-            (0, "2", ""),
-        ]
+        mock_ssh.run_command.return_value = (0, "testsite-wp", "")  # Container check
+        mock_ssh.run_script.return_value = _site_responses(plugins=(0, plugins_json, ""))  # 8 inactive plugins
 
         result = auditor.audit_site("testsite", "test.com", "frankenwp")
 
         findings = result['findings']
         assert any('inactive plugins' in f['title'].lower() for f in findings)
 
+    def test_audit_plugins_inactive_count_is_structural(self, auditor, mock_ssh):
+        """Test inactive plugins are counted from parsed JSON, not substrings."""
+        # Active plugins whose names contain the literal status text
+        plugins_json = json.dumps([
+            {"name": '"status":"inactive"', "status": "active", "update": "none"}
+        ] * 8)
+        mock_ssh.run_command.return_value = (0, "testsite-wp", "")  # Container check
+        mock_ssh.run_script.return_value = _site_responses(plugins=(0, plugins_json, ""))
+
+        result = auditor.audit_site("testsite", "test.com", "frankenwp")
+
+        findings = result['findings']
+        assert not any('inactive plugins' in f['title'].lower() for f in findings)
+
     def test_audit_plugins_updates_available(self, auditor, mock_ssh):
         """Test plugin audit with updates available."""
-        mock_ssh.run_command.side_effect = [
-            (0, "testsite-wp", ""),
-            (0, "6.5.0", ""),
-            (0, "[]", ""),
-            (0, "600", ""),
-            (0, "755", ""),
-            (0, "define('WP_DEBUG', false);", ""),
-            (0, "[]", ""),
-            (0, "3", ""),  # 3 plugin updates available
-            (0, "0", ""),
-            (0, "[]", ""),
-            (0, "2", ""),
-        ]
+        plugins_json = '[' + ','.join(['{"status":"active","update":"available"}'] * 3) + ']'
+        mock_ssh.run_command.return_value = (0, "testsite-wp", "")  # Container check
+        mock_ssh.run_script.return_value = _site_responses(plugins=(0, plugins_json, ""))  # 3 plugin updates available
 
         result = auditor.audit_site("testsite", "test.com", "frankenwp")
 
@@ -511,20 +686,11 @@ class TestWordPressAuditor:
 
     def test_audit_users_too_many_admins(self, auditor, mock_ssh):
         """Test user audit with too many administrator accounts."""
-        mock_ssh.run_command.side_effect = [
-            (0, "testsite-wp", ""),
-            (0, "6.5.0", ""),
-            (0, "[]", ""),
-            (0, "600", ""),
-            (0, "755", ""),
-            (0, "define('WP_DEBUG', false);", ""),
-            (0, "[]", ""),
-            (0, "0", ""),
-            (0, "0", ""),
-            (0, "[]", ""),
-            (0, "8", ""),  # 8 admin accounts
-            (0, "", ""),  # admin user check (not exists)
-        ]
+        users_json = json.dumps([
+            {"user_login": f"admin{i}", "roles": "administrator"} for i in range(8)
+        ])
+        mock_ssh.run_command.return_value = (0, "testsite-wp", "")  # Container check
+        mock_ssh.run_script.return_value = _site_responses(users=(0, users_json, ""))  # 8 admin accounts
 
         result = auditor.audit_site("testsite", "test.com", "frankenwp")
 
@@ -533,26 +699,134 @@ class TestWordPressAuditor:
 
     def test_audit_users_default_admin_username(self, auditor, mock_ssh):
         """Test user audit with default 'admin' username."""
-        mock_ssh.run_command.side_effect = [
-            (0, "testsite-wp", ""),
-            (0, "6.5.0", ""),
-            (0, "[]", ""),
-            (0, "600", ""),
-            (0, "755", ""),
-            (0, "define('WP_DEBUG', false);", ""),
-            (0, "[]", ""),
-            (0, "0", ""),
-            (0, "0", ""),
-            (0, "[]", ""),
-            (0, "2", ""),
-            (0, "User ID: 1", ""),  # admin user exists
-        ]
+        mock_ssh.run_command.return_value = (0, "testsite-wp", "")  # Container check
+        mock_ssh.run_script.return_value = _site_responses(users=(0, '[{"user_login":"admin","roles":"editor"}]', ""))  # admin user exists
 
         result = auditor.audit_site("testsite", "test.com", "frankenwp")
 
         findings = result['findings']
         assert any('Default admin username' in f['title'] for f in findings)
 
+    def test_audit_site_cache_hit_skips_probes(self, mock_ssh, mock_config, tmp_path):
+        """Test unchanged sites reuse cached findings."""
+        auditor = WordPressAuditor(mock_ssh, mock_config, cache_dir=tmp_path)
+        mock_ssh.run_command.return_value = (0, "sha256:abc\n1700000000\n1700000001\n1700000002", "")
+        mock_ssh.run_script.return_value = _CORE_ONLY_WP_RESPONSES
+
+        first = auditor.audit_site("testsite", "test.com", "frankenwp")
+        second = auditor.audit_site("testsite", "test.com", "frankenwp")
+
+        assert mock_ssh.run_script.call_count == 1
+        assert second == first
+        assert (tmp_path / "testsite.json").exists()
+
+    def test_audit_site_cache_with_stdlib_json(self, mock_ssh, mock_config, tmp_path, monkeypatch):
+        """Test the result cache round-trips when orjson is unavailable."""
+        monkeypatch.setattr('cli.utils.jsonio.orjson', None)
+        auditor = WordPressAuditor(mock_ssh, mock_config, cache_dir=tmp_path)
+        mock_ssh.run_command.return_value = (0, "sha256:abc\n1700000000", "")
+        mock_ssh.run_script.return_value = _site_responses(config_perms=(0, "644", ""))
+
+        first = auditor.audit_site("testsite", "test.com", "frankenwp")
+        second = auditor.audit_site("testsite", "test.com", "frankenwp")
+
+        assert mock_ssh.run_script.call_count == 1
+        assert second == first
+        assert json.loads((tmp_path / "testsite.json").read_text())['result'] == first
+
+    def test_audit_site_cache_miss_on_change(self, mock_ssh, mock_config, tmp_path):
+        """Test a changed fingerprint triggers a fresh audit."""
+        auditor = WordPressAuditor(mock_ssh, mock_config, cache_dir=tmp_path)
+        mock_ssh.run_script.return_value = _CORE_ONLY_WP_RESPONSES
+
+        mock_ssh.run_command.return_value = (0, "sha256:abc\n1700000000", "")
+        auditor.audit_site("testsite", "test.com", "frankenwp")
+        mock_ssh.run_command.return_value = (0, "sha256:abc\n1700009999", "")
+        auditor.audit_site("testsite", "test.com", "frankenwp")
+
+        assert mock_ssh.run_script.call_count == 2
+
+    def test_site_fingerprint_covers_ctime_core_and_database(self, mock_ssh, mock_config, tmp_path):
+        """Test the fingerprint sees chmods, core updates, uploads and database-held state."""
+        auditor = WordPressAuditor(mock_ssh, mock_config, cache_dir=tmp_path)
+        mock_ssh.run_command.return_value = (0, "sha256:abc\n1700000000", "")
+
+        auditor._site_fingerprint(SiteContext.for_site("testsite", "test.com", "frankenwp"))
+
+        command = mock_ssh.run_command.call_args.args[0]
+        assert "%Z" in command and "%Y" not in command
+        for probe in ("wp-includes/version.php", "wp-content/uploads", "wp db query",
+                      "capabilities", "active_plugins"):
+            assert probe in command
+
+    def test_audit_site_not_cached_when_fingerprint_fails(self, mock_ssh, mock_config, tmp_path):
+        """Test sites whose state cannot be fingerprinted are audited every time."""
+        auditor = WordPressAuditor(mock_ssh, mock_config, cache_dir=tmp_path)
+        mock_ssh.run_script.return_value = _CORE_ONLY_WP_RESPONSES
+        mock_ssh.run_command.side_effect = lambda cmd: (
+            (1, "sha256:abc\n1700000000", "") if 'docker inspect' in cmd  # database probe failed
+            else (0, "testsite-wp", "")
+        )
+
+        auditor.audit_site("testsite", "test.com", "frankenwp")
+        auditor.audit_site("testsite", "test.com", "frankenwp")
+
+        assert mock_ssh.run_script.call_count == 2
+        assert not (tmp_path / "testsite.json").exists()
+
+    def test_get_plugin_list_parses_json(self, auditor, mock_ssh):
+        """Test get_plugin_list returns parsed wp-cli JSON."""
+        mock_ssh.run_command.return_value = (
+            0, '[{"name":"akismet","status":"active"},{"name":"hello","status":"inactive"}]', ""
+        )
+
+        plugins = auditor.get_plugin_list("testsite1")
+
+        assert [p['name'] for p in plugins] == ['akismet', 'hello']
+
+    def test_get_plugin_list_malformed_json(self, auditor, mock_ssh):
+        """Test get_plugin_list tolerates non-JSON output."""
+        mock_ssh.run_command.return_value = (0, "Error: not a WordPress install", "")
+
+        assert auditor.get_plugin_list("testsite1") == []
+
+    def test_get_plugin_list_cached_by_fingerprint(self, mock_ssh, mock_config, tmp_path):
+        """Test get_plugin_list reuses the cached list until the fingerprint changes."""
+        auditor = WordPressAuditor(mock_ssh, mock_config, cache_dir=tmp_path)
+        table = {
+            r'docker inspect': (0, "sha256:abc\n1700000000", ""),
+            r'wp plugin list': (0, '[{"name":"akismet","status":"active"}]', ""),
+        }
+        _route(mock_ssh, table)
+
+        first = auditor.get_plugin_list("testsite1")
+        second = auditor.get_plugin_list("testsite1")
+        _route(mock_ssh, {**table, r'docker inspect': (0, "sha256:def\n1700000000", "")})
+        auditor.get_plugin_list("testsite1")
+
+        plugin_calls = [c for c in mock_ssh.run_command.call_args_list if 'wp plugin list' in c.args[0]]
+        assert first == second == [{'name': 'akismet', 'status': 'active'}]
+        assert len(plugin_calls) == 2
+        assert (tmp_path / "testsite1.plugins.json").exists()
+
+    def test_get_plugin_list_refreshes_after_activation(self, mock_ssh, mock_config, tmp_path):
+        """Test activating a plugin (a database-only change) invalidates the cached list."""
+        auditor = WordPressAuditor(mock_ssh, mock_config, cache_dir=tmp_path)
+        fingerprint = "sha256:abc\n/var/www/html/wp-content/plugins 1700000000\nadmin\t{0}"
+        table = {
+            r'docker inspect': (0, fingerprint.format('a:1:{i:0;s:7:"akismet";}'), ""),
+            r'wp plugin list': (0, '[{"name":"akismet","status":"inactive"}]', ""),
+        }
+        _route(mock_ssh, table)
+        auditor.get_plugin_list("testsite1")
+
+        _route(mock_ssh, {
+            r'docker inspect': (0, fingerprint.format('a:2:{i:0;s:7:"akismet";i:1;s:5:"hello";}'), ""),
+            r'wp plugin list': (0, '[{"name":"akismet","status":"active"}]', ""),
+        })
+
+        assert auditor.get_plugin_list("testsite1") == [{'name': 'akismet', 'status': 'active'}]
+
     def test_audit_all_sites(self, auditor, mock_ssh, mock_config):
         """Test audit_all_sites runs audit for all configured sites."""
         mock_ssh.run_command.return_value = (1, "", "")  # Containers not running
@@ -564,6 +838,28 @@ class TestWordPressAuditor:
         assert 'testsite2' in result['sites']
         assert 'timestamp' in result
 
+    def test_audit_all_sites_single_container_listing(self, auditor, mock_ssh, mock_config):
+        """Test container liveness is read once for all sites."""
+        mock_ssh.run_command.return_value = (0, "testsite1-wp\nother-wp", "")
+        mock_ssh.run_script.return_value = _CORE_ONLY_WP_RESPONSES
+
+        result = auditor.audit_all_sites()
+
+        assert mock_ssh.run_command.call_count == 1
+        assert result['sites']['testsite1']['status'] == 'audited'
+        assert result['sites']['testsite2']['status'] == 'container_not_running'
+
+    def test_audit_all_sites_keeps_site_order(self, auditor, mock_ssh, mock_config):
+        """Test concurrent site audits are merged in configured site order."""
+        mock_ssh.run_command.return_value = (1, "", "")
+
+        result = auditor.audit_all_sites(max_workers=2)
+
+        assert list(result['sites']) == ['testsite1', 'testsite2']
+        assert [f['id'] for f in result['findings']] == [
+            'WP-testsite1-OFFLINE', 'WP-testsite2-OFFLINE'
+        ]
+
     def test_audit_all_sites_no_sites(self, auditor, mock_ssh, mock_config):
         """Test audit_all_sites with no sites configured."""
         mock_config.get_sites.return_value = []
@@ -596,6 +892,7 @@ class TestVulnerabilityScanner:
         scanner = VulnerabilityScanner("my_token")
         assert scanner.api_token == "my_token"
         assert scanner._request_count == 0
+        assert 'https://' in scanner._session.adapters  # pooled keep-alive session
 
     def test_init_without_token(self):
         """Test initialization without API token."""
@@ -607,7 +904,19 @@ class TestVulnerabilityScanner:
         scanner_no_token.set_api_token("new_token")
         assert scanner_no_token.api_token == "new_token"
 
-    @patch('cli.utils.vulnerability_scanner.requests.get')
+    @patch('cli.utils.vulnerability_scanner.requests.Session.get')
+    def test_scan_sends_current_token(self, mock_get, scanner_no_token):
+        """Test requests carry the token set after initialization."""
+        mock_get.return_value = Mock(status_code=404)
+        scanner_no_token.set_api_token("new_token")
+
+        scanner_no_token.scan_plugin('akismet')
+
+        url = mock_get.call_args.args[0]
+        assert url == f"{scanner_no_token.WPSCAN_API_URL}/plugins/akismet"
+        assert mock_get.call_args.kwargs['headers'] == {'Authorization': 'Token token=new_token'}
+
+    @patch('cli.utils.vulnerability_scanner.requests.Session.get')
     def test_scan_plugin_success(self, mock_get, scanner):
         """Test successful plugin vulnerability scan."""
         mock_response = Mock()
@@ -637,7 +946,7 @@ class TestVulnerabilityScanner:
         assert result['vulnerabilities'][0]['title'] == 'SQL Injection'
         assert scanner._request_count == 1
 
-    @patch('cli.utils.vulnerability_scanner.requests.get')
+    @patch('cli.utils.vulnerability_scanner.requests.Session.get')
     def test_scan_plugin_not_found(self, mock_get, scanner):
         """Test plugin scan when plugin not found in database."""
         mock_response = Mock()
@@ -649,7 +958,7 @@ class TestVulnerabilityScanner:
         assert result['not_found'] is True
         assert len(result['vulnerabilities']) == 0
 
-    @patch('cli.utils.vulnerability_scanner.requests.get')
+    @patch('cli.utils.vulnerability_scanner.requests.Session.get')
     def test_scan_plugin_rate_limited(self, mock_get, scanner):
         """Test plugin scan when API rate limit hit."""
         mock_response = Mock()
@@ -668,7 +977,7 @@ class TestVulnerabilityScanner:
         assert 'error' in result
         assert 'No API token' in result['error']
 
-    @patch('cli.utils.vulnerability_scanner.requests.get')
+    @patch('cli.utils.vulnerability_scanner.requests.Session.get')
     def test_scan_plugin_request_exception(self, mock_get, scanner):
         """Test plugin scan with network error."""
         mock_get.side_effect = Exception("Connection error")
@@ -678,7 +987,88 @@ class TestVulnerabilityScanner:
         assert 'error' in result
         assert 'Request failed' in result['error']
 
-    @patch('cli.utils.vulnerability_scanner.requests.get')
+    @patch('cli.utils.vulnerability_scanner.requests.Session.get')
+    def test_scan_many_one_request_per_slug(self, mock_get, scanner):
+        """Test installs of one slug at several versions share a single request."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'test-plugin': {
+                'vulnerabilities': [
+                    {'title': 'SQL Injection', 'fixed_in': '1.5.0', 'cvss': {'score': 8.5}}
+                ]
+            }
+        }
+        mock_get.return_value = mock_response
+
+        with patch.object(scanner, '_apply_rate_limit'):
+            results = scanner.scan_many([('plugin', 'test-plugin', '1.0.0'), ('plugin', 'test-plugin', '2.0.0')])
+
+        assert mock_get.call_count == 1
+        assert [r['version'] for r in results] == ['1.0.0', '2.0.0']
+        assert [len(r['vulnerabilities']) for r in results] == [1, 0]
+
+    @patch('cli.utils.vulnerability_scanner.requests.Session.get')
+    def test_scan_many_overlaps_requests_in_order(self, mock_get, scanner):
+        """Test mixed component scans run concurrently and keep input order."""
+        in_flight = threading.Barrier(2, timeout=5)
+
+        def get(url, **kwargs):
+            in_flight.wait()  # Both lookups must be in flight at once
+            slug = url.rsplit('/', 1)[1]
+            response = Mock(status_code=200)
+            response.json.return_value = {slug: {'vulnerabilities': []}}
+            return response
+
+        mock_get.side_effect = get
+        scanner.RATE_LIMIT_DELAY = 0
+
+        results = scanner.scan_many([('theme', 'astra', '4.0'), ('plugin', 'akismet', '5.0')])
+
+        assert [r['slug'] for r in results] == ['astra', 'akismet']
+        assert scanner.get_request_count() == 2
+
+    @patch('cli.utils.vulnerability_scanner.requests.Session.get')
+    def test_scan_requests_each_path_once_per_scanner(self, mock_get, scanner):
+        """Test later scans of a slug at another version, or a missing slug, reuse the first response."""
+        def get(url, **kwargs):
+            slug = url.rsplit('/', 1)[1]
+            if slug == 'gone':
+                return Mock(status_code=404)
+            response = Mock(status_code=200)
+            response.json.return_value = {slug: {'vulnerabilities': [{'title': 'XSS', 'fixed_in': '5.1'}]}}
+            return response
+
+        mock_get.side_effect = get
+        scanner.RATE_LIMIT_DELAY = 0
+
+        assert len(scanner.scan_plugin('akismet', '5.0')['vulnerabilities']) == 1
+        assert scanner.scan_plugin('akismet', '5.2')['vulnerabilities'] == []
+        assert scanner.scan_plugin('gone', '1.0')['not_found'] is True
+        assert scanner.scan_plugin('gone', '1.0')['not_found'] is True
+
+        assert scanner.get_request_count() == 2
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_decode_prefers_raw_content(self, monkeypatch, use_orjson):
+        """Test bodies are decoded from raw bytes, with or without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr('cli.utils.jsonio.orjson', None)
+        response = Mock(content=b'{"akismet": {"vulnerabilities": []}}')
+
+        assert VulnerabilityScanner._decode(response) == {'akismet': {'vulnerabilities': []}}
+        response.json.assert_not_called()
+
+    def test_decode_falls_back_to_requests(self):
+        """Test bodies that are not UTF-8 JSON are left to requests' decoding."""
+        response = Mock(content='{"a": "\u00e9"}'.encode('latin-1'))
+        response.json.return_value = {'a': '\u00e9'}
+
+        assert VulnerabilityScanner._decode(response) == {'a': '\u00e9'}
+
+    @patch('cli.utils.vulnerability_scanner.requests.Session.get')
     def test_scan_theme_success(self, mock_get, scanner):
         """Test successful theme vulnerability scan."""
         mock_response = Mock()
@@ -705,7 +1095,7 @@ class TestVulnerabilityScanner:
         assert len(result['vulnerabilities']) == 1
         assert result['vulnerabilities'][0]['type'] == 'xss'
 
-    @patch('cli.utils.vulnerability_scanner.requests.get')
+    @patch('cli.utils.vulnerability_scanner.requests.Session.get')
     def test_scan_wordpress_core_success(self, mock_get, scanner):
         """Test WordPress core vulnerability scan."""
         mock_response = Mock()
@@ -730,7 +1120,7 @@ class TestVulnerabilityScanner:
         assert result['version'] == '6.2.0'
         assert len(result['vulnerabilities']) == 1
 
-    @patch('cli.utils.vulnerability_scanner.requests.get')
+    @patch('cli.utils.vulnerability_scanner.requests.Session.get')
     def test_scan_with_cache(self, mock_get, scanner):
         """Test vulnerability scan uses cache."""
         mock_response = Mock()
@@ -775,6 +1165,21 @@ class TestVulnerabilityScanner:
         assert findings[0]['severity'] == 'critical'  # CVSS 9.5
         assert findings[1]['severity'] == 'medium'  # CVSS 5.0
         assert 'mysite' in findings[0]['id']
+        assert [f['id'] for f in findings] == [
+            'VULN-mysite-PLUGIN-test-plugin-1', 'VULN-mysite-PLUGIN-test-plugin-2'
+        ]
+
+    @pytest.mark.parametrize("cvss, severity", [
+        (9.0, 'critical'), (8.9, 'high'), (7.0, 'high'),
+        (6.9, 'medium'), (4.0, 'medium'), (3.9, 'low'),
+    ])
+    def test_convert_to_findings_cvss_boundaries(self, scanner, cvss, severity):
+        """Test each CVSS severity starts exactly at its threshold."""
+        scan_result = {'slug': 'test-plugin', 'version': '1.0.0', 'vulnerabilities': [{'cvss': cvss}]}
+
+        findings = scanner.convert_to_findings(scan_result, 'mysite', 'plugin')
+
+        assert findings[0]['severity'] == severity
 
     def test_convert_to_findings_no_cvss(self, scanner):
         """Test converting findings without CVSS defaults to high."""
@@ -805,6 +1210,18 @@ class TestVulnerabilityScanner:
 
         assert len(findings) == 0
 
+    def test_convert_to_findings_latest_version_keeps_unfixed(self, scanner):
+        """Test running latest_version skips fixed vulnerabilities but not unfixed ones."""
+        data = {'test-plugin': {'latest_version': '2.0.0', 'vulnerabilities': [
+            {'title': 'Fixed XSS', 'fixed_in': '2.0.0'},
+            {'title': 'Unpatched CSRF'},
+        ]}}
+
+        scan_result = scanner._parse_plugin_response(data, 'test-plugin', '2.0.0')
+        findings = scanner.convert_to_findings(scan_result, 'mysite', 'plugin')
+
+        assert [f['description'] for f in findings] == ['Unpatched CSRF']
+
     def test_version_compare(self, scanner):
         """Test version comparison logic."""
         assert scanner._version_compare('1.0.0', '2.0.0') == -1
@@ -812,6 +1229,41 @@ class TestVulnerabilityScanner:
         assert scanner._version_compare('1.0.0', '1.0.0') == 0
         assert scanner._version_compare('1.0.1', '1.0.0') == 1
         assert scanner._version_compare('1.10.0', '1.9.0') == 1
+        assert scanner._version_compare('1.0', '1.0.0') == 0
+
+    @pytest.mark.parametrize("older, newer", [
+        ('1.0.0-rc1', '1.0.0'),
+        ('2.0.0rc1', '2.0.0'),
+        ('1.0.0-beta', '1.0.1'),
+        ('0.9.9', '1.0.0-rc1'),
+    ])
+    def test_version_compare_prerelease(self, scanner, older, newer):
+        """Test pre-releases sort before their release and build metadata is ignored."""
+        assert scanner._version_compare(older, newer) == -1
+        assert scanner._version_compare(newer, older) == 1
+        assert scanner._version_compare(newer + '+build.5', newer) == 0
+
+    def test_affected_vulnerabilities_bisect_fixed_in(self, scanner):
+        """Test only vulnerabilities fixed after the installed version are kept, in API order."""
+        vuln_list = [
+            {'title': 'A', 'fixed_in': '2.0.0'},
+            {'title': 'B'},
+            {'title': 'C', 'fixed_in': '1.5.0'},
+            {'title': 'D', 'fixed_in': '1.0.0'},
+            {'title': 'E', 'fixed_in': '1.5.0'},
+        ]
+        fixed_indexes = {}
+
+        def titles(version):
+            affected = scanner._affected_vulnerabilities(vuln_list, version, fixed_indexes)
+            return [vuln['title'] for vuln in affected]
+
+        assert titles('1.5.0') == ['A', 'B']
+        assert titles('1.4.9') == ['A', 'B', 'C', 'E']
+        assert titles('0.9') == ['A', 'B', 'C', 'D', 'E']
+        assert titles('3.0') == ['B']
+        assert titles(None) == ['A', 'B', 'C', 'D', 'E']
+        assert len(fixed_indexes) == 1
 
     def test_get_request_count(self, scanner):
         """Test request count tracking."""
@@ -825,19 +1277,57 @@ class TestVulnerabilityScanner:
         scanner.clear_cache()
         assert len(scanner._cache) == 0
 
+    @patch('cli.utils.vulnerability_scanner.requests.Session.get')
+    def test_cache_file_survives_restart(self, mock_get, tmp_path):
+        """Test saved lookups are served to a new scanner without API calls."""
+        mock_response = Mock(status_code=200)
+        mock_response.json.return_value = {'akismet': {'vulnerabilities': []}}
+        mock_get.return_value = mock_response
+        cache_file = tmp_path / "wpscan.json"
+
+        first = VulnerabilityScanner("token", cache_file=cache_file)
+        result = first.scan_plugin('akismet', '5.0')
+        first.save_cache()
+        second = VulnerabilityScanner("token", cache_file=cache_file)
+
+        assert second.scan_plugin('akismet', '5.0') == result
+        assert mock_get.call_count == 1
+        assert second.get_request_count() == 0
+
+    def test_cache_file_ignores_expired_and_corrupt(self, tmp_path):
+        """Test stale or unreadable cache files start an empty cache."""
+        cache_file = tmp_path / "wpscan.json"
+        cache_file.write_text(json.dumps({'plugin:a:1': [{'slug': 'a'}, time.time() - 7200]}))
+        assert len(VulnerabilityScanner("token", cache_file=cache_file)._cache) == 0
+
+        cache_file.write_text("not json")
+        assert len(VulnerabilityScanner("token", cache_file=cache_file)._cache) == 0
+
+    def test_cache_evicts_least_recently_used(self, scanner):
+        """Test the scan cache stays bounded and keeps recently read entries."""
+        scanner.CACHE_MAX_ENTRIES = 2
+        scanner._set_cached('plugin:a:1', {'slug': 'a'})
+        scanner._set_cached('plugin:b:1', {'slug': 'b'})
+        scanner._get_cached('plugin:a:1')
+        scanner._set_cached('plugin:c:1', {'slug': 'c'})
+
+        assert list(scanner._cache) == ['plugin:a:1', 'plugin:c:1']
+        assert scanner.get_cache_stats()['max_entries'] == 2
+
     def test_get_cache_stats(self, scanner):
         """Test cache statistics."""
-        from datetime import datetime
+        expires_at = time.monotonic() + scanner.CACHE_DURATION
         scanner._cache = {
-            'key1': ('data1', datetime.utcnow()),
-            'key2': ('data2', datetime.utcnow())
+            'key1': ('data1', expires_at),
+            'key2': ('data2', expires_at),
+            'key3': ('data3', time.monotonic() - 1)
         }
 
         stats = scanner.get_cache_stats()
 
-        assert stats['total_entries'] == 2
+        assert stats['total_entries'] == 3
         assert stats['active_entries'] == 2
-        assert stats['expired_entries'] == 0
+        assert stats['expired_entries'] == 1
 
 
 # ============================================================================
@@ -906,8 +1396,10 @@ class TestReportGenerator:
         findings = generator._aggregate_findings(sample_system_results, sample_wordpress_results)
 
         assert len(findings) == 2  # 1 system + 1 wordpress
-        assert any(f['id'] == 'SSH-001' for f in findings)
-        assert any(f['id'] == 'WP-TEST-001' for f in findings)
+        assert 'SSH-001' in _finding_ids(findings)
+        assert 'WP-TEST-001' in _finding_ids(findings)
+        assert findings[0]['category'].startswith('System: ')
+        assert findings[1]['category'].startswith('WordPress: ')
 
     def test_calculate_security_score_perfect(self, generator):
         """Test security score calculation with no findings."""
@@ -938,11 +1430,13 @@ class TestReportGenerator:
             {'severity': 'critical', 'id': '1'},
             {'severity': 'high', 'id': '2'},
             {'severity': 'high', 'id': '3'},
-            {'severity': 'low', 'id': '4'}
+            {'severity': 'low', 'id': '4'},
+            {'severity': 'info', 'id': '5'}
         ]
 
         grouped = generator._group_by_severity(findings)
 
+        assert list(grouped) == ['critical', 'high', 'medium', 'low']
         assert len(grouped['critical']) == 1
         assert len(grouped['high']) == 2
         assert len(grouped['medium']) == 0
@@ -972,6 +1466,21 @@ class TestReportGenerator:
         assert generator._get_score_color(60) == 'orange1'
         assert generator._get_score_color(30) == 'red'
 
+    @pytest.mark.parametrize("score, color, html_color", [
+        (100, 'green', '#10b981'),
+        (90, 'green', '#10b981'),
+        (89, 'yellow', '#f59e0b'),
+        (70, 'yellow', '#f59e0b'),
+        (69, 'orange1', '#f97316'),
+        (50, 'orange1', '#f97316'),
+        (49, 'red', '#ef4444'),
+        (0, 'red', '#ef4444'),
+    ])
+    def test_get_score_color_boundaries(self, generator, score, color, html_color):
+        """Test each score band starts exactly at its threshold."""
+        assert generator._get_score_color(score) == color
+        assert generator._get_score_color_html(score) == html_color
+
     def test_generate_json_report(self, generator, sample_system_results, sample_wordpress_results, tmp_path):
         """Test JSON report generation."""
         output_path = tmp_path / "report.json"
@@ -995,6 +1504,41 @@ class TestReportGenerator:
             assert data['security_score'] == 85
             assert data['total_findings'] == 2
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_generate_json_report_encoders_match(self, generator, tmp_path, monkeypatch, use_orjson):
+        """Test the orjson and stdlib encoders write the same report."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr('cli.utils.jsonio.orjson', None)
+        report_data = {
+            'timestamp': '2025-01-10T10:00:00Z',
+            'overall_score': 85,
+            'total_findings': 1,
+            'severity_counts': {'critical': 0, 'high': 1, 'medium': 0, 'low': 0},
+            'findings_by_severity': {'high': [{'id': 'SSH-001', 'title': 'Root login'}]},
+            'system_results': {},
+            'wordpress_results': {'sites': {'example.com': {'score': 90}}}
+        }
+        output_path = tmp_path / "report.json"
+
+        generator._generate_json_report(report_data, str(output_path))
+
+        assert output_path.read_text() == json.dumps(report_data, indent=2)
+
+    @pytest.mark.parametrize("indent", [False, True])
+    def test_jsonio_encoders_match(self, monkeypatch, indent):
+        """Test jsonio writes identical bytes with orjson and with the stdlib encoder."""
+        orjson = pytest.importorskip("orjson")
+        value = {'site': 'café.example', 'counts': {1: 2}, 'findings': [None, True, 1.5]}
+
+        monkeypatch.setattr('cli.utils.jsonio.orjson', orjson)
+        fast = jsonio.dumps(value, indent=indent)
+        monkeypatch.setattr('cli.utils.jsonio.orjson', None)
+
+        assert jsonio.dumps(value, indent=indent) == fast
+        assert jsonio.loads(fast) == {'site': 'café.example', 'counts': {'1': 2}, 'findings': [None, True, 1.5]}
+
 
 # ============================================================================
 # ServerAuditManager Tests
@@ -1004,9 +1548,9 @@ class TestServerAuditManager:
     """Test ServerAuditManager orchestration."""
 
     @pytest.fixture
-    def mock_ssh(self):
-        """Create mock SSH manager."""
-        return Mock()
+    def mock_ssh(self, shared_ssh):
+        """Reset the shared SSH mock for this test."""
+        return _reset_ssh(shared_ssh)
 
     @pytest.fixture
     def mock_config(self):
@@ -1066,6 +1610,38 @@ class TestServerAuditManager:
             assert 'overall_score' in result
             assert result['overall_score'] >= 0
             assert result['overall_score'] <= 100
+            # verbose adds per-stage timings
+            assert {'system', 'wordpress'} <= set(result['timings'])
+            assert "AUDIT TIMINGS" in manager.report_generator.generate_console(result)
+
+    def test_collect_all_findings_reads_sites_once_and_sorts(self, manager):
+        """Test site findings repeated in the WordPress summary are counted once, most severe first."""
+        low = {'id': 'WP-a-001', 'severity': 'low'}
+        critical = {'id': 'WP-a-002', 'severity': 'critical'}
+        audit_data = {
+            'system': {'ssh': {'findings': [{'id': 'SSH-001', 'severity': 'high'}]}},
+            'wordpress': {'findings': [low, critical], 'sites': {'a': {'findings': [low, critical]}}},
+            'vulnerabilities': {'sites': {'a': {'findings': [{'id': 'VULN-1', 'severity': 'medium'}]}}},
+        }
+
+        findings = manager.report_generator._collect_all_findings(audit_data)
+
+        assert [f['id'] for f in findings] == ['WP-a-002', 'SSH-001', 'VULN-1', 'WP-a-001']
+
+    def test_collect_all_findings_keeps_findings_sharing_an_id(self, manager):
+        """Test distinct findings with the same id (FW-003 per open port) are all reported."""
+        audit_data = {'system': {'firewall': {'findings': [
+            {'id': 'FW-003', 'severity': 'medium', 'title': f'Unrestricted access on port {port}'}
+            for port in (22, 80, 443)
+        ]}}}
+
+        findings = manager.report_generator._collect_all_findings(audit_data)
+
+        assert [f['title'] for f in findings] == [
+            'Unrestricted access on port 22',
+            'Unrestricted access on port 80',
+            'Unrestricted access on port 443',
+        ]
 
     def test_run_full_audit_with_errors(self, manager):
         """Test full audit handles component errors gracefully."""
@@ -1077,6 +1653,43 @@ class TestServerAuditManager:
             assert len(result['errors']) > 0
             assert result['errors'][0]['component'] == 'system'
             assert 'overall_score' in result
+            assert 'timings' not in result  # Only verbose runs are timed
+
+    def test_scan_site_vulnerabilities_single_round_trip(self, manager, mock_ssh):
+        """Test version, plugin and theme probes run in one batched exec."""
+        mock_ssh.run_script.return_value = [
+            (0, "6.4.0", ""),
+            (0, "name,version,status\nakismet,5.0,active\nhello,1.0,inactive", ""),
+            (1, "", ""),  # theme list fails
+        ]
+        manager.vuln_scanner = Mock()
+        manager.vuln_scanner.scan_many.return_value = [{'version': '6.4.0'}, {'slug': 'akismet'}]
+        manager.vuln_scanner.convert_to_findings.return_value = []
+
+        result = manager._scan_site_vulnerabilities("testsite", "frankenwp")
+
+        mock_ssh.run_script.assert_called_once()
+        assert mock_ssh.run_script.call_args.kwargs['container'] == "testsite-wp"
+        mock_ssh.run_command.assert_not_called()
+        manager.vuln_scanner.scan_many.assert_called_once_with(
+            [('core', '6.4.0', '6.4.0'), ('plugin', 'akismet', '5.0')]
+        )
+        assert result['scanned_components'] == {'core': True, 'plugins': 2, 'themes': 0}
+
+    def test_vulnerability_scan_skips_offline_sites(self, manager, mock_ssh, mock_config):
+        """Test sites found offline by the WordPress audit are not probed again."""
+        online, offline = Mock(), Mock()
+        online.name, online.type = "online", "frankenwp"
+        offline.name, offline.type = "offline", "frankenwp"
+        mock_config.get_sites.return_value = [online, offline]
+        mock_ssh.run_script.return_value = [(1, "", "")] * 3
+
+        result = manager._run_vulnerability_scan("token", offline_sites={"offline"})
+
+        mock_ssh.run_script.assert_called_once()
+        assert mock_ssh.run_script.call_args.kwargs['container'] == "online-wp"
+        assert result['scanned'] == 1
+        assert result['sites']['offline']['status'] == 'container_not_running'
 
     def test_calculate_overall_score(self, manager):
         """Test overall security score calculation."""
@@ -1098,6 +1711,24 @@ class TestServerAuditManager:
         assert isinstance(score, int)
         assert 0 <= score <= 100
 
+    def test_calculate_overall_score_clean_fast_path(self, manager):
+        """Test a clean audit scores 100 without the weighted sum, unless Lynis or an error weighs in."""
+        audit_results = {
+            'system': {'ssh': {'findings': []}, 'timestamp': '2025-01-10T10:00:00Z'},
+            'wordpress': {'sites_audited': 1, 'findings': []},
+            'vulnerabilities': {'total_vulnerabilities': 0},
+            'lynis': {'skipped': True}
+        }
+
+        with patch.object(manager, '_calculate_system_score') as mock_system_score:
+            assert manager._calculate_overall_score(audit_results) == 100
+        mock_system_score.assert_not_called()
+
+        audit_results['lynis'] = {'available': True, 'hardening_index': 50}
+        assert manager._calculate_overall_score(audit_results) == 95
+
+        assert manager._calculate_overall_score({'system': {'error': 'ssh down'}, 'wordpress': {'skipped': True}}) == 0
+
     def test_calculate_system_score(self, manager):
         """Test system score calculation."""
         system_data = {
@@ -1159,6 +1790,14 @@ hello,1.7.2,active
         assert result[0]['version'] == '5.0'
         assert result[0]['status'] == 'active'
 
+    def test_parse_csv_output_quoted_fields(self, manager):
+        """Test quoted CSV fields keep their commas."""
+        csv_output = 'name,version,status\n"acme, forms",1.0,active\n'
+
+        result = manager._parse_csv_output(csv_output)
+
+        assert result == [{'name': 'acme, forms', 'version': '1.0', 'status': 'active'}]
+
     def test_parse_csv_output_empty(self, manager):
         """Test CSV parsing with empty output."""
         result = manager._parse_csv_output("")
@@ -0,0 +1,409 @@
+"""Unit tests for SSH utilities."""
+
+import re
+import shlex
+import subprocess
+import pytest
+from unittest.mock import Mock, patch
+from cli.utils import ssh as ssh_module
+from cli.utils.ssh import PersistentShell, SSHConnectionPool, SSHManager, TailBuffer
+
+
+class FakeChannel:
+    """Fake paramiko Channel running a shell that answers PersistentShell scripts."""
+
+    def __init__(self, stdout=b"", stderr=b"", status=0, chunk_size=32768, silent=False, exited=False):
+        self.stdout = stdout
+        self.stderr = stderr
+        self.status = status
+        self.chunk_size = chunk_size
+        self.silent = silent
+        self.exited = exited
+        self.closed = False
+        self.sent = []
+        self._out = b""
+        self._err = b""
+
+    def sendall(self, data):
+        self.sent.append(data)
+        match = re.search(rb'echo "(\S+):\$\?"', data)
+        if match and not self.silent:
+            marker = match.group(1)
+            self._out += self.stdout + marker + b":%d\n" % self.status
+            self._err += self.stderr + marker + b"\n"
+
+    def recv_ready(self):
+        return bool(self._out)
+
+    def recv(self, size):
+        chunk, self._out = self._out[:min(size, self.chunk_size)], self._out[min(size, self.chunk_size):]
+        return chunk
+
+    def recv_stderr_ready(self):
+        return bool(self._err)
+
+    def recv_stderr(self, size):
+        chunk, self._err = self._err[:min(size, self.chunk_size)], self._err[min(size, self.chunk_size):]
+        return chunk
+
+    def exit_status_ready(self):
+        return self.exited
+
+    def close(self):
+        self.closed = True
+
+
+class TestPersistentShell:
+    """Test commands run over a long-lived remote shell."""
+
+    def test_returns_exit_code_and_output(self):
+        shell = PersistentShell(FakeChannel(stdout=b"6.5.0\n", status=3))
+
+        assert shell.run("wp core version") == (3, "6.5.0", "")
+
+    def test_splits_stderr(self):
+        shell = PersistentShell(FakeChannel(stdout=b"out\n", stderr=b"Warning: slow\n", status=1))
+
+        assert shell.run("wp plugin list") == (1, "out", "Warning: slow")
+
+    def test_marker_split_across_reads(self):
+        channel = FakeChannel(stdout=b"x" * 50, stderr=b"e" * 10, chunk_size=3)
+
+        assert PersistentShell(channel).run("true") == (0, "x" * 50, "e" * 10)
+
+    def test_command_is_wrapped_with_markers(self):
+        channel = FakeChannel()
+        PersistentShell(channel).run("wp --info")
+
+        script = channel.sent[0].decode()
+        assert script.startswith("{ wp --info\n} </dev/null\n")
+        assert re.search(r'echo "__VW_EXIT_\w+__:\$\?"\necho __VW_EXIT_\w+__ >&2\n$', script)
+
+    def test_reused_for_several_commands(self):
+        channel = FakeChannel(stdout=b"ok\n")
+        shell = PersistentShell(channel)
+
+        assert shell.run("true") == (0, "ok", "")
+        assert shell.run("true") == (0, "ok", "")
+        assert not shell.closed
+
+    def test_timeout_closes_shell(self):
+        channel = FakeChannel(silent=True)
+        shell = PersistentShell(channel)
+
+        with pytest.raises(RuntimeError, match="timed out"):
+            shell.run("sleep 60", timeout=0)
+
+        assert channel.closed
+        assert channel.sent[-1] == b"exit\n"
+        assert shell.closed
+
+    def test_remote_exit_raises(self):
+        channel = FakeChannel(silent=True, exited=True)
+        shell = PersistentShell(channel)
+
+        with pytest.raises(RuntimeError, match="remote shell exited"):
+            shell.run("exit 1")
+
+        assert channel.closed
+
+
+class FakeSSHClient:
+    """Fake paramiko SSHClient whose transport and no-op command can fail."""
+
+    def __init__(self, active=True, exit_status=0):
+        self.active = active
+        self.exit_status = exit_status
+        self.closed = False
+        self.commands = []
+
+    def get_transport(self):
+        return Mock(is_active=Mock(return_value=self.active))
+
+    def exec_command(self, command, timeout=None):
+        self.commands.append(command)
+        stdout = Mock()
+        stdout.channel.recv_exit_status.return_value = self.exit_status
+        return Mock(), stdout, Mock()
+
+    def close(self):
+        self.closed = True
+
+
+_KEY_A = ("deploy", "a.example.com", 22)
+_KEY_B = ("deploy", "b.example.com", 22)
+_KEY_C = ("deploy", "c.example.com", 22)
+
+
+class TestSSHConnectionPool:
+    """Test reuse of authenticated SSH sessions."""
+
+    def test_acquire_empty_pool(self):
+        assert SSHConnectionPool().acquire(_KEY_A) is None
+
+    def test_release_then_acquire_reuses_client(self):
+        pool = SSHConnectionPool()
+        client = FakeSSHClient()
+
+        pool.release(_KEY_A, client)
+
+        assert pool.acquire(_KEY_A) is client
+        assert client.commands == ["true"]
+        assert not client.closed
+        # A client is handed out to one caller at a time
+        assert pool.acquire(_KEY_A) is None
+
+    def test_clients_are_keyed_by_destination(self):
+        pool = SSHConnectionPool()
+        client = FakeSSHClient()
+        pool.release(_KEY_A, client)
+
+        assert pool.acquire(_KEY_B) is None
+        assert pool.acquire(_KEY_A) is client
+
+    def test_evicts_least_recently_used_past_max_size(self):
+        pool = SSHConnectionPool(max_size=2)
+        oldest, middle, newest = FakeSSHClient(), FakeSSHClient(), FakeSSHClient()
+
+        pool.release(_KEY_A, oldest)
+        pool.release(_KEY_B, middle)
+        pool.release(_KEY_C, newest)
+
+        assert oldest.closed
+        assert pool.acquire(_KEY_A) is None
+        assert pool.acquire(_KEY_B) is middle
+        assert pool.acquire(_KEY_C) is newest
+
+    def test_release_replaces_client_for_same_key(self):
+        pool = SSHConnectionPool()
+        first, second = FakeSSHClient(), FakeSSHClient()
+
+        pool.release(_KEY_A, first)
+        pool.release(_KEY_A, second)
+
+        assert first.closed
+        assert pool.acquire(_KEY_A) is second
+
+    def test_expires_after_idle_timeout(self):
+        pool = SSHConnectionPool(idle_timeout=300)
+        client = FakeSSHClient()
+
+        with patch.object(ssh_module.time, "monotonic", return_value=1000.0):
+            pool.release(_KEY_A, client)
+        with patch.object(ssh_module.time, "monotonic", return_value=1301.0):
+            assert pool.acquire(_KEY_A) is None
+
+        assert client.closed
+        assert client.commands == []
+
+    def test_reused_within_idle_timeout(self):
+        pool = SSHConnectionPool(idle_timeout=300)
+        client = FakeSSHClient()
+
+        with patch.object(ssh_module.time, "monotonic", return_value=1000.0):
+            pool.release(_KEY_A, client)
+        with patch.object(ssh_module.time, "monotonic", return_value=1299.0):
+            assert pool.acquire(_KEY_A) is client
+
+    @pytest.mark.parametrize("client", [
+        FakeSSHClient(active=False),
+        FakeSSHClient(exit_status=255),
+    ], ids=["inactive-transport", "failed-noop"])
+    def test_failed_health_check_closes_client(self, client):
+        pool = SSHConnectionPool()
+        pool.release(_KEY_A, client)
+
+        assert pool.acquire(_KEY_A) is None
+        assert client.closed
+
+    def test_close_all(self):
+        pool = SSHConnectionPool()
+        clients = [FakeSSHClient(), FakeSSHClient()]
+        pool.release(_KEY_A, clients[0])
+        pool.release(_KEY_B, clients[1])
+
+        pool.close_all()
+
+        assert all(client.closed for client in clients)
+        assert pool.acquire(_KEY_A) is None
+
+    def test_disconnect_returns_pooled_client(self):
+        pool = SSHConnectionPool()
+        client = FakeSSHClient()
+        manager = SSHManager("a.example.com", 22, "deploy", "/nonexistent")
+        manager.client = client
+
+        with patch.object(ssh_module, "connection_pool", pool):
+            manager.disconnect()
+
+        assert manager.client is None
+        assert not client.closed
+        assert pool.acquire(manager.pool_key) is client
+
+    def test_disconnect_unpooled_closes_client(self):
+        pool = SSHConnectionPool()
+        client = FakeSSHClient()
+        manager = SSHManager("a.example.com", 22, "deploy", "/nonexistent", pooled=False)
+        manager.client = client
+
+        with patch.object(ssh_module, "connection_pool", pool):
+            manager.disconnect()
+
+        assert client.closed
+        assert pool.acquire(manager.pool_key) is None
+
+
+class TestTailBuffer:
+    """Test the bounded output buffer used by run_command_tail."""
+
+    def test_keeps_last_bytes_within_chunk(self):
+        buffer = TailBuffer(5)
+        buffer.append(b"abcd")
+        buffer.append(b"efgh")
+
+        assert buffer.getvalue() == b"defgh"
+
+    def test_drops_chunk_exactly_at_boundary(self):
+        buffer = TailBuffer(4)
+        buffer.append(b"abcd")
+        buffer.append(b"efgh")
+
+        assert buffer.getvalue() == b"efgh"
+        assert list(buffer._chunks) == [b"efgh"]
+
+    def test_keeps_chunk_one_byte_past_boundary(self):
+        buffer = TailBuffer(5)
+        buffer.append(b"abcd")
+        buffer.append(b"efgh")
+
+        assert list(buffer._chunks) == [b"abcd", b"efgh"]
+
+    def test_many_small_chunks(self):
+        buffer = TailBuffer(10)
+        for i in range(1000):
+            buffer.append(b"%03d," % i)
+
+        assert buffer.getvalue() == b"7,998,999,"
+        assert sum(len(chunk) for chunk in buffer._chunks) < 10 + 4
+
+    def test_max_bytes_larger_than_output(self):
+        buffer = TailBuffer(8192)
+        buffer.append(b"Success: ")
+        buffer.append(b"Installed 1 of 1 plugins.")
+
+        assert buffer.getvalue() == b"Success: Installed 1 of 1 plugins."
+
+    def test_empty(self):
+        assert TailBuffer(16).getvalue() == b""
+
+
+class LocalSSHManager(SSHManager):
+    """SSHManager that runs commands through a local 'sh -c' instead of SSH."""
+
+    def __init__(self):
+        super().__init__("localhost", 22, "deploy", "/nonexistent", pooled=False)
+        self.commands = []
+
+    def run_command(self, command, timeout=30):
+        self.commands.append(command)
+        result = subprocess.run(["sh", "-c", command], capture_output=True, timeout=timeout)
+        return (
+            result.returncode,
+            result.stdout.decode("utf-8", errors="replace").strip(),
+            result.stderr.decode("utf-8", errors="replace").strip(),
+        )
+
+
+class TestRunArgv:
+    """Test argv quoting for remote commands."""
+
+    _HOSTILE = ["a b", "$(id)", "`id`", "x; rm -rf /", "it's", '"q"', "a|b&c", "*", "$HOME", "\\n", ""]
+
+    def test_metacharacters_reach_command_verbatim(self):
+        ssh = LocalSSHManager()
+
+        exit_code, stdout, _ = ssh.run_argv(["printf", "%s\\n", *self._HOSTILE])
+
+        assert exit_code == 0
+        assert stdout.split("\n") == self._HOSTILE[:-1]
+        assert shlex.split(ssh.commands[0]) == ["printf", "%s\\n", *self._HOSTILE]
+
+    def test_quotes_once(self):
+        ssh = LocalSSHManager()
+        with patch.object(ssh, "run_command", return_value=(0, "", "")) as run_command:
+            ssh.run_argv(["docker", "exec", "wp_site", "wp", "option", "update", "blogname", "Tom's $ite"])
+
+        run_command.assert_called_once_with(
+            "docker exec wp_site wp option update blogname 'Tom'\"'\"'s $ite'", timeout=30
+        )
+
+    def test_tail_bytes_uses_tail_reader(self):
+        ssh = LocalSSHManager()
+        with patch.object(ssh, "run_command_tail", return_value=(0, "", "")) as run_tail:
+            ssh.run_argv(["wp", "plugin", "install", "a b"], timeout=120, tail_bytes=8192)
+
+        run_tail.assert_called_once_with("wp plugin install 'a b'", timeout=120, tail_bytes=8192)
+
+
+class TestRunScript:
+    """Test several commands run in one exec with per-command results."""
+
+    def test_per_command_exit_codes(self):
+        results = LocalSSHManager().run_script(["true", "false", "sh -c 'exit 3'"])
+
+        assert [exit_code for exit_code, _, _ in results] == [0, 1, 3]
+
+    def test_splits_stdout_and_stderr_per_command(self):
+        results = LocalSSHManager().run_script([
+            "echo out1; echo err1 >&2",
+            "echo err2 >&2",
+            "printf 'line1\\nline2\\n'",
+        ])
+
+        assert results == [
+            (0, "out1", "err1"),
+            (0, "", "err2"),
+            (0, "line1\nline2", ""),
+        ]
+
+    def test_empty_output(self):
+        assert LocalSSHManager().run_script(["true", ":"]) == [(0, "", ""), (0, "", "")]
+
+    def test_commands_do_not_read_script_from_stdin(self):
+        results = LocalSSHManager().run_script(["cat", "echo after"])
+
+        assert results == [(0, "", ""), (0, "after", "")]
+
+    def test_no_commands(self):
+        ssh = LocalSSHManager()
+
+        assert ssh.run_script([]) == []
+        assert ssh.commands == []
+
+    def test_missing_marker_defaults_to_failure(self):
+        results = LocalSSHManager().run_script(["echo before", "exit 7", "echo never"])
+
+        assert results == [(0, "before", ""), (1, "", ""), (1, "", "")]
+
+    def test_no_markers_at_all(self):
+        ssh = LocalSSHManager()
+        with patch.object(ssh, "run_command", return_value=(255, "", "Connection reset")):
+            assert ssh.run_script(["true", "true"]) == [(1, "", ""), (1, "", "")]
+
+    def test_container_wraps_script_in_one_docker_exec(self):
+        ssh = LocalSSHManager()
+        sent = []
+
+        def fake_docker(command, timeout=30):
+            # Run the quoted inner script locally in place of the container
+            sent.append(command)
+            argv = shlex.split(command)
+            return LocalSSHManager.run_command(ssh, shlex.join(argv[3:]), timeout)
+
+        with patch.object(ssh, "run_command", side_effect=fake_docker):
+            results = ssh.run_script(["echo \"it's $((1 + 1))\"", "false"], container="my site")
+
+        assert len(sent) == 1
+        argv = shlex.split(sent[0])
+        assert argv[:5] == ["docker", "exec", "my site", "sh", "-c"]
+        assert results == [(0, "it's 2", ""), (1, "", "")]
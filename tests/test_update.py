@@ -1,16 +1,69 @@
 """Tests for update manager."""
 
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
+from importlib.metadata import PackageNotFoundError
 from cli.utils.update import (
     UpdateManager,
     UpdateInfo,
     UpdateError,
-    InstallMethod
+    InstallMethod,
+    _detect_install_method
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolate_update_manager(monkeypatch, tmp_path):
+    """Keep release lookups out of the user's cache and re-detect the install method per test."""
+    monkeypatch.setattr('cli.utils.update.RELEASE_CACHE_FILE', tmp_path / "releases.json")
+    _detect_install_method.cache_clear()
+    yield
+    _detect_install_method.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def _shared_client():
+    """GitHubClient mock shared by the module's tests; reset before each test."""
+    return Mock()
+
+
+@pytest.fixture(scope="module")
+def _shared_release():
+    """GitHubRelease mock shared by the module's tests; reset before each test."""
+    return Mock()
+
+
+@pytest.fixture(scope="module")
+def _shared_run_result():
+    """subprocess.run result mock shared by the module's tests; reset before each test."""
+    return Mock()
+
+
+@pytest.fixture
+def github_client(_shared_client):
+    """Reset the shared GitHubClient mock for this test."""
+    _shared_client.reset_mock(return_value=True, side_effect=True)
+    return _shared_client
+
+
+@pytest.fixture
+def release(_shared_release):
+    """Reset the shared GitHubRelease mock for this test."""
+    _shared_release.reset_mock()
+    return _shared_release
+
+
+@pytest.fixture
+def update_result(_shared_run_result):
+    """Reset the shared subprocess result to a successful run."""
+    _shared_run_result.reset_mock()
+    _shared_run_result.returncode = 0
+    _shared_run_result.stderr = ""
+    return _shared_run_result
+
+
 class TestInstallMethod:
     """Test InstallMethod enum."""
 
@@ -20,6 +73,11 @@ class TestInstallMethod:
         assert InstallMethod.PIP_PACKAGE.value == "pip_package"
         assert InstallMethod.SCRIPT_INSTALL.value == "script"
 
+    def test_members_compare_as_strings(self):
+        """Test members compare equal to their plain string values."""
+        assert InstallMethod.PIP_EDITABLE == "pip_editable"
+        assert InstallMethod("script") is InstallMethod.SCRIPT_INSTALL
+
 
 class TestUpdateManager:
     """Test UpdateManager class."""
@@ -34,41 +92,68 @@ class TestUpdateManager:
         assert manager.install_method == InstallMethod.SCRIPT_INSTALL
 
     @patch('cli.utils.update.Path.exists')
-    @patch('cli.utils.update.subprocess.run')
-    def test_detect_pip_editable(self, mock_run, mock_exists):
+    @patch('cli.utils.update.distribution')
+    def test_detect_pip_editable(self, mock_distribution, mock_exists):
         """Test detecting pip editable installation."""
         mock_exists.return_value = False  # /opt/vibewp/.git doesn't exist
-
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Editable project location: /some/path"
-        mock_run.return_value = mock_result
+        mock_distribution.return_value.read_text.return_value = (
+            '{"url": "file:///some/path", "dir_info": {"editable": true}}'
+        )
 
         manager = UpdateManager()
         assert manager.install_method == InstallMethod.PIP_EDITABLE
+        mock_distribution.return_value.read_text.assert_called_once_with("direct_url.json")
 
     @patch('cli.utils.update.Path.exists')
-    @patch('cli.utils.update.subprocess.run')
-    def test_detect_pip_package(self, mock_run, mock_exists):
+    @patch('cli.utils.update.distribution')
+    def test_detect_pip_package(self, mock_distribution, mock_exists):
         """Test detecting pip package installation."""
         mock_exists.return_value = False
+        # Wheels installed from an index carry no direct_url.json
+        mock_distribution.return_value.read_text.return_value = None
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Location: /usr/local/lib/python3.9/site-packages"
-        mock_run.return_value = mock_result
+        manager = UpdateManager()
+        assert manager.install_method == InstallMethod.PIP_PACKAGE
+
+    @patch('cli.utils.update.Path.exists')
+    @patch('cli.utils.update.distribution')
+    def test_detect_not_installed_defaults_to_pip_package(self, mock_distribution, mock_exists):
+        """Test missing package metadata falls back to a pip package install."""
+        mock_exists.return_value = False
+        mock_distribution.side_effect = PackageNotFoundError("vibewp")
 
         manager = UpdateManager()
         assert manager.install_method == InstallMethod.PIP_PACKAGE
 
+    @patch('cli.utils.update.Path.exists')
+    @patch('cli.utils.update.distribution')
+    def test_detect_install_method_once_per_process(self, mock_distribution, mock_exists):
+        """Test later managers reuse the detected install method without probing again."""
+        mock_exists.return_value = False
+        mock_distribution.return_value.read_text.return_value = '{"dir_info": {"editable": true}}'
+
+        UpdateManager()
+        manager = UpdateManager()
+
+        assert manager.install_method == InstallMethod.PIP_EDITABLE
+        mock_distribution.assert_called_once()
+
+    @patch('cli.utils.update.Path.exists')
+    @patch('cli.utils.update.distribution')
+    def test_detect_script_install_skips_metadata(self, mock_distribution, mock_exists):
+        """Test a script install is recognised without reading package metadata."""
+        mock_exists.return_value = True
+
+        UpdateManager()
+
+        mock_distribution.assert_not_called()
+
     @patch('cli.utils.update.GitHubClient')
-    def test_check_for_updates_available(self, mock_github_class):
+    def test_check_for_updates_available(self, mock_github_class, github_client, release):
         """Test checking for updates when update is available."""
-        mock_client = Mock()
-        mock_release = Mock()
-        mock_release.version = "1.1.0"
-        mock_client.get_latest_release.return_value = mock_release
-        mock_github_class.return_value = mock_client
+        release.version = "1.1.0"
+        github_client.get_latest_release.return_value = release
+        mock_github_class.return_value = github_client
 
         manager = UpdateManager()
         manager.current_version = "1.0.0"
@@ -80,13 +165,26 @@ class TestUpdateManager:
         assert update_info.latest_version == "1.1.0"
 
     @patch('cli.utils.update.GitHubClient')
-    def test_check_for_updates_not_available(self, mock_github_class):
+    def test_check_for_updates_revalidate(self, mock_github_class, github_client, release):
+        """Test an explicit check asks GitHub to revalidate the cached release."""
+        release.version = "1.1.0"
+        github_client.get_latest_release.return_value = release
+        mock_github_class.return_value = github_client
+
+        manager = UpdateManager()
+        manager.current_version = "1.0.0"
+        manager.check_for_updates(revalidate=True)
+
+        github_client.get_latest_release.assert_called_once_with(
+            include_prerelease=False, revalidate=True
+        )
+
+    @patch('cli.utils.update.GitHubClient')
+    def test_check_for_updates_not_available(self, mock_github_class, github_client, release):
         """Test checking for updates when no update available."""
-        mock_client = Mock()
-        mock_release = Mock()
-        mock_release.version = "1.0.0"
-        mock_client.get_latest_release.return_value = mock_release
-        mock_github_class.return_value = mock_client
+        release.version = "1.0.0"
+        github_client.get_latest_release.return_value = release
+        mock_github_class.return_value = github_client
 
         manager = UpdateManager()
         manager.current_version = "1.0.0"
@@ -96,11 +194,10 @@ class TestUpdateManager:
         assert update_info.update_available is False
 
     @patch('cli.utils.update.GitHubClient')
-    def test_check_for_updates_github_failure(self, mock_github_class):
+    def test_check_for_updates_github_failure(self, mock_github_class, github_client):
         """Test handling GitHub API failure."""
-        mock_client = Mock()
-        mock_client.get_latest_release.return_value = None
-        mock_github_class.return_value = mock_client
+        github_client.get_latest_release.return_value = None
+        mock_github_class.return_value = github_client
 
         manager = UpdateManager()
 
@@ -109,7 +206,7 @@ class TestUpdateManager:
 
     @patch('cli.utils.update.Path')
     @patch('cli.utils.update.subprocess.run')
-    def test_update_script_install_success(self, mock_run, mock_path_class):
+    def test_update_script_install_success(self, mock_run, mock_path_class, update_result):
         """Test successful script installation update."""
         # Mock Path for __init__ detection
         mock_git_path = Mock()
@@ -122,17 +219,7 @@ class TestUpdateManager:
         mock_path_class.return_value = mock_install_path
         mock_path_class.side_effect = [mock_git_path, mock_install_path]
 
-        # Mock for __init__ detection
-        init_result = Mock()
-        init_result.returncode = 0
-        init_result.stdout = "Location: /usr/local/lib/python3.9/site-packages"
-
-        # Mock for actual update
-        update_result = Mock()
-        update_result.returncode = 0
-        update_result.stderr = ""
-
-        mock_run.side_effect = [init_result, update_result, update_result]
+        mock_run.return_value = update_result
 
         manager = UpdateManager()
         manager.install_method = InstallMethod.SCRIPT_INSTALL
@@ -144,12 +231,11 @@ class TestUpdateManager:
             assert success is True
 
     @patch('cli.utils.update.subprocess.run')
-    def test_update_script_install_git_failure(self, mock_run):
+    def test_update_script_install_git_failure(self, mock_run, update_result):
         """Test script installation update with git pull failure."""
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Git pull failed"
-        mock_run.return_value = mock_result
+        update_result.returncode = 1
+        update_result.stderr = "Git pull failed"
+        mock_run.return_value = update_result
 
         manager = UpdateManager()
         manager.install_method = InstallMethod.SCRIPT_INSTALL
@@ -159,21 +245,11 @@ class TestUpdateManager:
 
     @patch('cli.utils.update.Path.exists')
     @patch('cli.utils.update.subprocess.run')
-    def test_update_pip_package_success(self, mock_run, mock_exists):
+    def test_update_pip_package_success(self, mock_run, mock_exists, update_result):
         """Test successful pip package update."""
         mock_exists.return_value = False  # Mock for __init__
 
-        # Mock for __init__ detection
-        init_result = Mock()
-        init_result.returncode = 0
-        init_result.stdout = "Location: /usr/local/lib/python3.9/site-packages"
-
-        # Mock for actual update
-        update_result = Mock()
-        update_result.returncode = 0
-        update_result.stderr = ""
-
-        mock_run.side_effect = [init_result, update_result]
+        mock_run.return_value = update_result
 
         manager = UpdateManager()
         manager.install_method = InstallMethod.PIP_PACKAGE
@@ -183,21 +259,11 @@ class TestUpdateManager:
 
     @patch('cli.utils.update.Path.exists')
     @patch('cli.utils.update.subprocess.run')
-    def test_update_pip_package_with_version(self, mock_run, mock_exists):
+    def test_update_pip_package_with_version(self, mock_run, mock_exists, update_result):
         """Test pip package update to specific version."""
         mock_exists.return_value = False  # Mock for __init__
 
-        # Mock for __init__ detection
-        init_result = Mock()
-        init_result.returncode = 0
-        init_result.stdout = "Location: /usr/local/lib/python3.9/site-packages"
-
-        # Mock for actual update
-        update_result = Mock()
-        update_result.returncode = 0
-        update_result.stderr = ""
-
-        mock_run.side_effect = [init_result, update_result]
+        mock_run.return_value = update_result
 
         manager = UpdateManager()
         manager.install_method = InstallMethod.PIP_PACKAGE
@@ -208,24 +274,15 @@ class TestUpdateManager:
         # Verify correct command was called
         call_args = mock_run.call_args[0][0]
         assert "vibewp==1.2.0" in call_args
+        assert call_args[call_args.index("--upgrade-strategy") + 1] == "only-if-needed"
 
     @patch('cli.utils.update.Path.exists')
     @patch('cli.utils.update.subprocess.run')
-    def test_update_pip_package_force_reinstall(self, mock_run, mock_exists):
+    def test_update_pip_package_force_reinstall(self, mock_run, mock_exists, update_result):
         """Test pip package force reinstall."""
         mock_exists.return_value = False  # Mock for __init__
 
-        # Mock for __init__ detection
-        init_result = Mock()
-        init_result.returncode = 0
-        init_result.stdout = "Location: /usr/local/lib/python3.9/site-packages"
-
-        # Mock for actual update
-        update_result = Mock()
-        update_result.returncode = 0
-        update_result.stderr = ""
-
-        mock_run.side_effect = [init_result, update_result]
+        mock_run.return_value = update_result
 
         manager = UpdateManager()
         manager.install_method = InstallMethod.PIP_PACKAGE
@@ -244,6 +301,17 @@ class TestUpdateManager:
         verified = manager.verify_installation()
         assert verified is True
 
+    @patch('cli.utils.update.distribution')
+    def test_get_install_path_from_metadata(self, mock_distribution):
+        """Test pip install paths come from the distribution's site-packages."""
+        mock_distribution.return_value.read_text.return_value = None
+        mock_distribution.return_value.locate_file.return_value = "/usr/lib/python3/site-packages"
+
+        manager = UpdateManager()
+        manager.install_method = InstallMethod.PIP_PACKAGE
+
+        assert manager._get_install_path() == Path("/usr/lib/python3/site-packages/vibewp")
+
     @patch('cli.utils.update.subprocess.run')
     def test_get_installation_info(self, mock_run):
         """Test getting installation information."""
@@ -257,6 +325,21 @@ class TestUpdateManager:
         assert 'python_version' in info
         assert info['install_method'] == 'pip_package'
 
+    @patch('cli.utils.update.distribution')
+    def test_get_installation_info_gathered_once(self, mock_distribution):
+        """Test repeated calls reuse the details and hand out independent copies."""
+        mock_distribution.return_value.read_text.return_value = None
+        manager = UpdateManager()
+        manager.install_method = InstallMethod.PIP_PACKAGE
+        mock_distribution.reset_mock()
+
+        first = manager.get_installation_info()
+        first['version'] = "tampered"
+        second = manager.get_installation_info()
+
+        mock_distribution.assert_called_once_with("vibewp")
+        assert second['version'] == manager.current_version
+
 
 class TestUpdateInfo:
     """Test UpdateInfo data class."""
@@ -275,3 +358,9 @@ class TestUpdateInfo:
         assert info.latest_version == "1.1.0"
         assert info.update_available is True
         assert info.install_method == InstallMethod.PIP_PACKAGE
+
+    def test_update_info_has_no_instance_dict(self):
+        """Test UpdateInfo stores its fields in slots."""
+        info = UpdateInfo("1.0.0", "1.1.0", True, None, InstallMethod.PIP_PACKAGE)
+
+        assert not hasattr(info, '__dict__')
@@ -1,5 +1,10 @@
 """Tests for version utilities."""
 
+import copy
+import dataclasses
+import pickle
+from unittest.mock import patch
+
 import pytest
 from cli.utils.version import (
     SemanticVersion,
@@ -23,6 +28,17 @@ class TestSemanticVersion:
 
         v_build = SemanticVersion(1, 2, 3, prerelease="beta", build="123")
         assert str(v_build) == "1.2.3-beta+123"
+        assert not hasattr(v_build, '__dict__')
+
+    def test_copy_and_pickle_round_trip(self):
+        """Test frozen slotted versions survive deepcopy and pickle."""
+        v = parse_version("1.2.3-rc.1+build.5")
+        v < parse_version("1.2.3")  # populate the cached sort key
+
+        for clone in (copy.deepcopy(v), pickle.loads(pickle.dumps(v))):
+            assert clone == v
+            assert clone.build == "build.5"
+            assert clone < parse_version("1.2.3")
 
     def test_equality(self):
         """Test version equality."""
@@ -59,6 +75,14 @@ class TestSemanticVersion:
         # Alpha < Beta
         assert v1 < v2
 
+    def test_prerelease_identifier_precedence(self):
+        """Test numeric prerelease identifiers compare as numbers."""
+        ordered = ["1.0.0-alpha", "1.0.0-alpha.1", "1.0.0-rc.2", "1.0.0-rc.10", "1.0.0-rc.a", "1.0.0"]
+        versions = [parse_version(v) for v in ordered]
+
+        assert sorted(reversed(versions)) == versions
+        assert not versions[2] < versions[2]
+
 
 class TestParseVersion:
     """Test version parsing."""
@@ -78,6 +102,11 @@ class TestParseVersion:
         assert v.minor == 2
         assert v.patch == 3
 
+    def test_parse_strips_single_prefix_of_either_case(self):
+        """Test one 'v' or 'V' prefix is accepted, but not a doubled one."""
+        assert parse_version("V1.2.3") == parse_version("1.2.3")
+        assert parse_version("vv1.2.3") is None
+
     def test_parse_with_prerelease(self):
         """Test parsing version with pre-release."""
         v = parse_version("1.2.3-beta")
@@ -97,6 +126,31 @@ class TestParseVersion:
         assert v.patch == 3
         assert v.build == "build123"
 
+    @pytest.mark.parametrize("version_str, expected", [
+        (" v1.2.3 ", (1, 2, 3, None, None)),
+        ("1.2.3-rc-1+build.5", (1, 2, 3, "rc-1", "build.5")),
+        ("1.2.3-", None),
+        ("1.2.3+a+b", None),
+        ("1.2.-3", None),
+        ("1.2.3 4", None),
+    ])
+    def test_parse_fast_path_matches_pattern(self, version_str, expected):
+        """Test plain and suffixed versions parse alike whichever path handles them."""
+        v = parse_version(version_str)
+        if expected is None:
+            assert v is None
+        else:
+            assert (v.major, v.minor, v.patch, v.prerelease, v.build) == expected
+
+    def test_parse_returns_shared_immutable_instance(self):
+        """Test repeated parses share one cached, immutable instance."""
+        v = parse_version("1.2.3-beta+build1")
+
+        assert parse_version("1.2.3-beta+build1") is v
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            v.major = 2
+        assert hash(v) == hash(SemanticVersion(1, 2, 3, prerelease="beta"))
+
     def test_parse_invalid_version(self):
         """Test parsing invalid version."""
         assert parse_version("invalid") is None
@@ -158,6 +212,12 @@ class TestIsNewerVersion:
         assert is_newer_version("invalid", "1.0.0") is False
         assert is_newer_version("1.0.0", "invalid") is False
 
+    def test_identical_strings_skip_parsing(self):
+        """Test identical version strings answer without being parsed."""
+        with patch('cli.utils.version.compare_versions') as mock_compare:
+            assert is_newer_version("3.1.4", "3.1.4") is False
+        mock_compare.assert_not_called()
+
 
 class TestVersionToTuple:
     """Test version_to_tuple utility."""
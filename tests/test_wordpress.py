@@ -0,0 +1,194 @@
+"""Unit tests for WordPress management utilities."""
+
+import shlex
+import pytest
+from cli.utils.wordpress import WordPressManager, BATCH_SEPARATOR
+
+
+class RecordingSSH:
+    """Fake SSHManager that records every command and replays canned results."""
+
+    def __init__(self, responses=None):
+        self.client = object()
+        self.commands = []
+        self.argvs = []
+        self.responses = responses or {}
+
+    def _respond(self, command):
+        for needle, result in self.responses.items():
+            if needle in command:
+                return result
+        return 0, "", ""
+
+    def run_command(self, command, timeout=30):
+        self.commands.append(command)
+        return self._respond(command)
+
+    def run_argv(self, argv, timeout=30, tail_bytes=None):
+        self.argvs.append(list(argv))
+        return self._respond(shlex.join(argv))
+
+
+@pytest.fixture
+def ssh():
+    return RecordingSSH()
+
+
+@pytest.fixture
+def wp(ssh):
+    return WordPressManager(ssh)
+
+
+class TestRunBatched:
+    """Test one-round-trip command chains."""
+
+    def test_splits_output_per_command(self, ssh, wp):
+        ssh.responses = {"echo": (0, f"one\n{BATCH_SEPARATOR}\ntwo\n", "")}
+
+        exit_code, outputs, stderr = wp._run_batched(["echo one", "echo two"])
+
+        assert exit_code == 0
+        assert outputs == ["one", "two"]
+        assert ssh.commands == [f"echo one && echo {BATCH_SEPARATOR} && echo two"]
+
+    def test_container_name_is_quoted(self, ssh, wp):
+        wp._run_batched(["true"], container_name="site; rm -rf /")
+
+        command = ssh.commands[0]
+        assert command.startswith("docker exec 'site; rm -rf /' sh -c ")
+        assert shlex.split(command)[2] == "site; rm -rf /"
+
+
+class TestPluginInstallMany:
+    """Test concurrent plugin installs."""
+
+    @staticmethod
+    def _wp_calls(ssh, subcommand):
+        return [argv for argv in ssh.argvs if argv[3:6] == ["wp", "plugin", subcommand]]
+
+    def test_activates_once_after_all_installs(self, ssh, wp):
+        ssh.responses = {"plugin list": (0, "[]", "")}
+
+        results = wp.plugin_install_many("wp_site", ["akismet", "jetpack", "hello-dolly"])
+
+        assert results == {"akismet": True, "jetpack": True, "hello-dolly": True}
+        installs = self._wp_calls(ssh, "install")
+        assert len(installs) == 3
+        assert not any("--activate" in argv for argv in installs)
+        activations = self._wp_calls(ssh, "activate")
+        assert len(activations) == 1
+        assert activations[0][6:9] == ["akismet", "jetpack", "hello-dolly"]
+        assert ssh.argvs[-1] == activations[0]
+
+    def test_skips_installed_and_active_plugins(self, ssh, wp):
+        ssh.responses = {
+            "plugin list": (0, '[{"name": "akismet", "status": "active"},'
+                               ' {"name": "jetpack", "status": "inactive"}]', "")
+        }
+
+        results = wp.plugin_install_many("wp_site", ["akismet", "jetpack", "hello-dolly"])
+
+        assert all(results.values())
+        installs = self._wp_calls(ssh, "install")
+        assert [argv[6] for argv in installs] == ["hello-dolly"]
+        activations = self._wp_calls(ssh, "activate")
+        assert activations[0][6:8] == ["jetpack", "hello-dolly"]
+
+    def test_failed_activation_marks_pending_plugins(self, ssh, wp):
+        ssh.responses = {
+            "plugin list": (0, '[{"name": "akismet", "status": "active"}]', ""),
+            "plugin activate": (1, "", "Error: plugin could not be activated"),
+        }
+
+        results = wp.plugin_install_many("wp_site", ["akismet", "jetpack"])
+
+        assert results == {"akismet": True, "jetpack": False}
+
+    def test_failed_install_is_not_activated(self, ssh, wp):
+        ssh.responses = {
+            "plugin list": (0, "[]", ""),
+            "install missing": (1, "", "Error: plugin not found"),
+        }
+
+        results = wp.plugin_install_many("wp_site", ["missing", "jetpack"])
+
+        assert results == {"missing": False, "jetpack": True}
+        assert self._wp_calls(ssh, "activate")[0][6:7] == ["jetpack"]
+        assert "missing" not in self._wp_calls(ssh, "activate")[0]
+
+    def test_without_activate_never_activates(self, ssh, wp):
+        ssh.responses = {"plugin list": (0, "[]", "")}
+
+        wp.plugin_install_many("wp_site", ["akismet"], activate=False)
+
+        assert self._wp_calls(ssh, "activate") == []
+
+
+class TestListInstalledPlugins:
+    """Test the installed-plugin lookup."""
+
+    _PLUGINS = ('[{"name": "akismet", "status": "active"},'
+                ' {"name": "jetpack", "status": "inactive"},'
+                ' {"name": "woocommerce", "status": "active-network"}]')
+
+    def test_lists_all_plugins(self, ssh, wp):
+        ssh.responses = {"plugin list": (0, self._PLUGINS, "")}
+
+        assert wp.list_installed_plugins("wp_site") == {"akismet", "jetpack", "woocommerce"}
+        assert ssh.argvs[0][:3] == ["docker", "exec", "wp_site"]
+        assert "--path=/var/www/html" in ssh.argvs[0]
+
+    def test_active_only(self, ssh, wp):
+        ssh.responses = {"plugin list": (0, self._PLUGINS, "")}
+
+        assert wp.list_installed_plugins("wp_site", active_only=True) == {"akismet", "woocommerce"}
+
+    @pytest.mark.parametrize("response", [
+        (1, "", "Error: This does not seem to be a WordPress installation."),
+        (0, "not json", ""),
+    ])
+    def test_failure_returns_empty_set(self, ssh, wp, response):
+        ssh.responses = {"plugin list": response}
+
+        assert wp.list_installed_plugins("wp_site") == set()
+
+
+class TestConfigureWpcli:
+    """Test pinning the WordPress path in wp-cli.yml."""
+
+    def test_writes_config_and_verifies_in_one_exec(self, ssh, wp):
+        assert wp.configure_wpcli("wp_site") is True
+
+        assert len(ssh.commands) == 1
+        script = shlex.split(ssh.commands[0])[-1]
+        assert "printf 'path: %s\\n' /var/www/html > /var/www/wp-cli.yml" in script
+        assert script.endswith("wp core version --allow-root")
+
+    def test_ols_path_includes_domain(self, ssh, wp):
+        wp.configure_wpcli("ols_site", wp_type="ols", domain="example.com")
+
+        assert "/var/www/vhosts/example.com" in shlex.split(ssh.commands[0])[-1]
+
+    def test_configured_container_omits_path(self, ssh, wp):
+        wp.configure_wpcli("wp_site")
+        wp.plugin_install("wp_site", "akismet", activate=False)
+        wp.plugin_install("other_site", "akismet", activate=False)
+
+        configured, other = ssh.argvs
+        assert configured[3:] == ["wp", "plugin", "install", "akismet", "--allow-root"]
+        assert "--path=/var/www/html" in other
+
+    def test_configured_once(self, ssh, wp):
+        wp.configure_wpcli("wp_site")
+        wp.configure_wpcli("wp_site")
+
+        assert len(ssh.commands) == 1
+
+    def test_failed_verification_keeps_path(self, ssh, wp):
+        ssh.responses = {"wp core version": (1, "", "Error: not a WordPress installation")}
+
+        assert wp.configure_wpcli("wp_site") is False
+
+        ssh.responses = {}
+        wp.plugin_install("wp_site", "akismet", activate=False)
+        assert "--path=/var/www/html" in ssh.argvs[0]